@@ -0,0 +1,235 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows: fall back to tracemalloc for peak memory
+    resource=None
+
+import db.connection as connection
+from bench.standin import StandInDriver
+from bench.synthetic import generate_movies
+from db.graph_version import bump_graph_version
+from graph import schema
+from ingest import partitioned
+from ingest.csv_stream import DEFAULT_CHUNK_SIZE, clean_movie_frame, read_movie_chunks
+from ingest.fresh import check_labels_empty, unique_rows, write_movies, write_names, write_relationships
+from ingest.load_data import _write_movie, _write_movie_batch
+from ingest.parallel import _write_chunk
+
+# Ingest throughput benchmark on synthetic movie data.
+# Every (rows, strategy) case runs in a fresh process so peak memory is per case. The ingest loop
+# is the one from ingest/load_data.py and ingest/parallel.py, with the clock split into
+#   parse    - pandas read_csv chunks
+#   validate - clean_movie_frame (MovieModel rules)
+#   write    - Cypher statements through Neo4jConnection
+# Results are appended as JSON lines to --out, one record per case, so runs can be diffed.
+#
+# Usage (from phase1/code):
+#   python -m bench.run --rows 1000 100000 --strategies batch parallel
+#   python -m bench.run --rows 10000 --backend neo4j      # WIPES Movie/Genre/Person nodes first
+
+BENCH_DIR=Path(__file__).resolve().parent
+STRATEGIES=["per-row","batch","parallel","fresh"]
+CLEAR_MOVIE_GRAPH="""
+MATCH (n) WHERE n:Movie OR n:Genre OR n:Person
+CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF 10000 ROWS
+"""
+
+
+def dataset_path(rows:int, seed:int):
+    # generated once per (rows, seed) and reused by later runs
+    path=BENCH_DIR/"data"/f"movies_{rows}_{seed}.csv"
+    if not path.exists():
+        path.parent.mkdir(parents=True,exist_ok=True)
+        start=time.perf_counter()
+        tmp=path.with_name(path.name+".tmp")
+        generate_movies(str(tmp),rows,seed=seed)
+        tmp.replace(path)
+        print(f"Generated {rows} movies in {time.perf_counter()-start:.1f}s -> {path}")
+    return path
+
+
+def _timed_batches(file_path:str, chunk_size:int, timer:dict):
+    chunks=iter(read_movie_chunks(file_path,chunk_size))
+    while True:
+        t=time.perf_counter()
+        chunk=next(chunks,None)
+        timer["parse"]+=time.perf_counter()-t
+        if chunk is None:
+            return
+        t=time.perf_counter()
+        rows,_=clean_movie_frame(chunk)
+        timer["validate"]+=time.perf_counter()-t
+        if rows:
+            yield rows
+
+
+def _run_per_row(db, file_path:str, timer:dict, batch_size:int, workers:int):
+    count=0
+    for rows in _timed_batches(file_path,DEFAULT_CHUNK_SIZE,timer):
+        t=time.perf_counter()
+        for movie in rows:
+            _write_movie(db,movie)
+        timer["write"]+=time.perf_counter()-t
+        count+=len(rows)
+    return count
+
+
+def _run_batch(db, file_path:str, timer:dict, batch_size:int, workers:int):
+    count=0
+    for rows in _timed_batches(file_path,batch_size,timer):
+        t=time.perf_counter()
+        _write_movie_batch(db,rows)
+        timer["write"]+=time.perf_counter()-t
+        count+=len(rows)
+    return count
+
+
+def _run_parallel(db, file_path:str, timer:dict, batch_size:int, workers:int):
+    genres,persons=set(),set()
+    for rows in _timed_batches(file_path,batch_size,timer):
+        for row in rows:
+            genres.update(row["genre"])
+            persons.add(row["director"])
+            persons.update(row["cast"])
+    t=time.perf_counter()
+    partitioned.write_names(db,schema.UNWIND_GENRES,genres)
+    partitioned.write_names(db,schema.UNWIND_PERSONS,persons)
+    timer["write"]+=time.perf_counter()-t
+
+    count=0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for rows in _timed_batches(file_path,batch_size,timer):
+            t=time.perf_counter()
+            _write_chunk(db,pool,rows,workers)
+            timer["write"]+=time.perf_counter()-t
+            count+=len(rows)
+    return count
+
+
+def _run_fresh(db, file_path:str, timer:dict, batch_size:int, workers:int):
+    check_labels_empty(db)
+    genres,persons={},{}
+    count=0
+    seen=set()
+    for rows in _timed_batches(file_path,batch_size,timer):
+        rows=unique_rows(rows,seen)
+        t=time.perf_counter()
+        if rows:
+            write_movies(db,rows,genres,persons)
+        timer["write"]+=time.perf_counter()-t
+        count+=len(rows)
+    t=time.perf_counter()
+    write_names(db,genres,persons)
+    timer["write"]+=time.perf_counter()-t
+
+    seen=set()
+    for rows in _timed_batches(file_path,batch_size,timer):
+        rows=unique_rows(rows,seen)
+        t=time.perf_counter()
+        if rows:
+            write_relationships(db,rows)
+        timer["write"]+=time.perf_counter()-t
+    return count
+
+
+RUNNERS={"per-row":_run_per_row,"batch":_run_batch,"parallel":_run_parallel,"fresh":_run_fresh}
+
+
+def _peak_memory_mb():
+    # peak RSS of this (per-case) process; tracemalloc peak where the resource module is missing (Windows)
+    if resource is None:
+        return tracemalloc.get_traced_memory()[1]/2**20,"tracemalloc"
+    peak=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return (peak/2**20 if sys.platform=="darwin" else peak/2**10),"ru_maxrss"
+
+
+def run_case(case:dict):
+    # runs in a child process; returns one result record
+    if resource is None:
+        tracemalloc.start()
+
+    standin=None
+    if case["backend"]=="standin":
+        standin=connection._driver=StandInDriver(latency=case["latency"])
+    db=connection.Neo4jConnection()
+    if case["backend"]=="neo4j":
+        db.execute(CLEAR_MOVIE_GRAPH)
+        for constraint in schema.CREATE_CONSTRAINS:
+            db.execute(constraint)
+
+    timer={"parse":0.0,"validate":0.0,"write":0.0}
+    start=time.perf_counter()
+    count=RUNNERS[case["strategy"]](db,case["file"],timer,case["batch_size"],case["workers"])
+    elapsed=time.perf_counter()-start
+    if case["backend"]=="neo4j":
+        bump_graph_version()
+
+    peak,memory_source=_peak_memory_mb()
+    record={
+        "timestamp":datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "dataset":"movie",
+        "rows":case["rows"],
+        "ingested":count,
+        "strategy":case["strategy"],
+        "backend":case["backend"],
+        "latency":case["latency"] if standin else None,
+        "batch_size":None if case["strategy"]=="per-row" else case["batch_size"],
+        "workers":case["workers"] if case["strategy"]=="parallel" else None,
+        "seconds":round(elapsed,4),
+        "rows_per_sec":round(count/max(elapsed,1e-9),1),
+        "parse_s":round(timer["parse"],4),
+        "validate_s":round(timer["validate"],4),
+        "write_s":round(timer["write"],4),
+        "peak_memory_mb":round(peak,1),
+        "memory_source":memory_source,
+        "statements":standin.statements if standin else None,
+        "python":platform.python_version(),
+        "platform":platform.platform(),
+    }
+    return record
+
+
+def main():
+    parser=argparse.ArgumentParser(description="Benchmark movie ingest strategies on synthetic data.")
+    parser.add_argument("--rows",type=int,nargs="+",default=[1_000,10_000,100_000],
+                        help="Dataset sizes to run (e.g. 1000 ... 10000000)")
+    parser.add_argument("--strategies",nargs="+",choices=STRATEGIES,default=STRATEGIES)
+    parser.add_argument("--backend",choices=["standin","neo4j"],default="standin",
+                        help="standin = in-process fake driver; neo4j = database from .env (cleared first)")
+    parser.add_argument("--latency",type=float,default=0.0,help="Stand-in seconds per statement")
+    parser.add_argument("--batch-size",type=int,default=500)
+    parser.add_argument("--workers",type=int,default=4)
+    parser.add_argument("--seed",type=int,default=0)
+    parser.add_argument("--out",default=str(BENCH_DIR/"results"/"ingest.jsonl"))
+    args=parser.parse_args()
+
+    out=Path(args.out)
+    out.parent.mkdir(parents=True,exist_ok=True)
+    ctx=get_context("spawn")
+    for rows in args.rows:
+        file_path=dataset_path(rows,args.seed)
+        for strategy in args.strategies:
+            case={"file":str(file_path),"rows":rows,"strategy":strategy,"backend":args.backend,
+                  "latency":args.latency,"batch_size":args.batch_size,"workers":args.workers}
+            with ProcessPoolExecutor(max_workers=1,mp_context=ctx) as pool:
+                record=pool.submit(run_case,case).result()
+            with out.open("a",encoding="utf-8") as f:
+                f.write(json.dumps(record)+"\n")
+            print(f"{rows:>10} {strategy:<9} {record['rows_per_sec']:>12.0f} rows/sec  "
+                  f"parse {record['parse_s']:.2f}s  validate {record['validate_s']:.2f}s  "
+                  f"write {record['write_s']:.2f}s  peak {record['peak_memory_mb']:.0f} MB")
+    print(f"Results appended to {out}")
+
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,70 @@
+import threading
+import time
+
+# In-process stand-in for the neo4j driver, for benchmarking ingest without a database.
+# Supports what db/connection.py uses (session, run, begin_transaction, execute_write). Statements
+# are not executed; each one optionally sleeps `latency` seconds (a simulated round trip) and the
+# items of list parameters (rows / pairs / names) are counted, so the write phase still pays for building
+# and handing over every batch.
+
+
+class _Result:
+
+    def consume(self):
+        return None
+
+    def __iter__(self):
+        return iter(())
+
+
+class _Transaction:
+
+    def __init__(self, driver):
+        self.driver=driver
+
+    def run(self, query:str, parameters:dict|None=None, **kwargs):
+        self.driver._record(parameters or kwargs)
+        return _Result()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Session(_Transaction):
+
+    def begin_transaction(self):
+        return _Transaction(self.driver)
+
+    def execute_write(self, work, *args, **kwargs):
+        return work(_Transaction(self.driver),*args,**kwargs)
+
+    execute_read=execute_write
+
+    def close(self):
+        pass
+
+
+class StandInDriver:
+
+    def __init__(self, latency:float=0.0):
+        self.latency=latency
+        self.statements=0
+        self.list_items=0
+        self._lock=threading.Lock()
+
+    def _record(self, parameters:dict):
+        items=sum(len(v) for v in parameters.values() if isinstance(v,list))
+        with self._lock:
+            self.statements+=1
+            self.list_items+=items
+        if self.latency:
+            time.sleep(self.latency)
+
+    def session(self, **kwargs):
+        return _Session(self)
+
+    def close(self):
+        pass
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+
+# Synthetic movie.csv generator for ingest benchmarks (same columns and formats as data/movie.csv).
+# Genres, directors and actors are drawn from Zipf-like distributions over finite pools, so a few
+# names appear in a large share of rows (hot nodes for MERGE/locking), like the real dataset.
+# A small share of rows has a missing year (kept) or a missing director (dropped by validation).
+# Rows are written in chunks, so 10^7 rows never sit in memory at once.
+
+GENRES=["Drama","Comedy","Action","Romance","Thriller","Crime","Family","Adventure","Mystery",
+        "Fantasy","Horror","Musical","Biography","History","Sci-Fi","Sport","War","Animation",
+        "Documentary","Music","Western","Film-Noir"]
+
+FIRST_NAMES=["Aamir","Priya","Rahul","Anita","Vikram","Kavya","Arjun","Meera","Rohan","Sana",
+             "James","Emma","Lucas","Olivia","Noah","Mia","Omar","Lena","Kenji","Yuki",
+             "Carlos","Sofia","Ivan","Nadia","Tariq","Elif","Daniel","Grace","Ravi","Asha"]
+LAST_NAMES=["Khan","Sharma","Kapoor","Patel","Iyer","Reddy","Singh","Das","Bose","Menon",
+            "Smith","Brown","Garcia","Rossi","Novak","Kim","Tanaka","Silva","Ahmed","Costa",
+            "Mehta","Joshi","Nair","Verma","Chopra","Gupta","Rao","Pillai","Shah","Varma"]
+TITLE_WORDS=["Night","River","Shadow","Promise","Storm","Journey","Heart","City","Secret","Fire",
+             "Dream","Road","Silence","Empire","Mirror","Garden","Echo","Horizon","Game","Return"]
+
+GENRE_SKEW=1.0
+PERSON_SKEW=1.1
+MISSING_YEAR_RATE=0.005
+MISSING_DIRECTOR_RATE=0.001
+CHUNK_ROWS=100_000
+
+
+def zipf_probabilities(n:int, skew:float):
+    # P(rank k) proportional to 1/k^skew over a finite pool of n items
+    weights=1.0/np.arange(1,n+1)**skew
+    return weights/weights.sum()
+
+
+def person_name(i:int):
+    first=FIRST_NAMES[i%len(FIRST_NAMES)]
+    last=LAST_NAMES[(i//len(FIRST_NAMES))%len(LAST_NAMES)]
+    suffix=i//(len(FIRST_NAMES)*len(LAST_NAMES))
+    return f"{first} {last}" if suffix==0 else f"{first} {last} {suffix+1}"
+
+
+def _join_unique(names, counts, pool):
+    # one comma-separated cell per row from the first count draws, duplicates removed
+    return [", ".join(dict.fromkeys(pool[j] for j in row[:n])) for row,n in zip(names,counts)]
+
+
+def _movie_chunk(rng:np.random.Generator, start:int, size:int, actors:list[str], directors:list[str]):
+    actor_p=zipf_probabilities(len(actors),PERSON_SKEW)
+    director_p=zipf_probabilities(len(directors),PERSON_SKEW)
+    genre_p=zipf_probabilities(len(GENRES),GENRE_SKEW)
+
+    genre_counts=rng.choice([1,2,3],size=size,p=[0.3,0.45,0.25])
+    cast_counts=rng.integers(2,7,size=size)
+    genre_draws=rng.choice(len(GENRES),size=(size,3),p=genre_p).tolist()
+    cast_draws=rng.choice(len(actors),size=(size,6),p=actor_p).tolist()
+    director_draws=rng.choice(len(directors),size=size,p=director_p)
+
+    words=rng.integers(0,len(TITLE_WORDS),size=(size,2))
+    years=rng.integers(1950,2025,size=size).astype(object)
+    years[rng.random(size)<MISSING_YEAR_RATE]=None
+    director_col=np.array(directors,dtype=object)[director_draws]
+    director_col[rng.random(size)<MISSING_DIRECTOR_RATE]=None
+
+    return pd.DataFrame({
+        "movie_id":[f"tt{i:08d}" for i in range(start,start+size)],
+        "movie_name":[f"The {TITLE_WORDS[a]} {TITLE_WORDS[b]}" for a,b in words],
+        "year":years,
+        "genre":_join_unique(genre_draws,genre_counts,GENRES),
+        "overview":[f"A story of {TITLE_WORDS[a].lower()} and {TITLE_WORDS[b].lower()}." for a,b in words],
+        "director":director_col,
+        "cast":_join_unique(cast_draws,cast_counts,actors),
+    })
+
+
+def generate_movies(file_path:str, rows:int, seed:int=0):
+    # write `rows` synthetic movies to file_path; pool sizes grow with the row count
+    rng=np.random.default_rng(seed)
+    n_actors=max(500,rows//2)
+    n_directors=max(50,rows//20)
+    actors=[person_name(i) for i in range(n_actors)]
+    directors=[person_name(n_actors+i) for i in range(n_directors)]
+    for start in range(0,rows,CHUNK_ROWS):
+        size=min(CHUNK_ROWS,rows-start)
+        chunk=_movie_chunk(rng,start,size,actors,directors)
+        chunk.to_csv(file_path,mode="w" if start==0 else "a",header=start==0,index=False)
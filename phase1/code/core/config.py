@@ -7,6 +7,20 @@ class Settings(BaseSettings):
     neo4j_password:str
     neo4j_db:str
 
+    # Shared driver pool (db/connection.py get_driver)
+    neo4j_max_pool_size:int=50
+    neo4j_max_connection_lifetime:int=3600
+    neo4j_connection_acquisition_timeout:float=60.0
+
+    # Bumped after ingest (db/graph_version.py); relative to phase1/code or absolute
+    graph_version_file:str=".cache/graph_version"
+
+    # Row fingerprints of the last incremental ingest (ingest/manifest.py); relative to phase1/code or absolute
+    ingest_manifest_file:str=".cache/movie_manifest.npz"
+
+    # PROFILE runs saved by query/profile.py; relative to phase1/code or absolute
+    profile_dir:str="query/profiles"
+
     class Config:
         env_file='.env'
         extra='ignore'
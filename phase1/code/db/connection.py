@@ -1,23 +1,86 @@
+import atexit
+import threading
+from contextlib import contextmanager
+
 from neo4j import GraphDatabase
 from core.config import settings
 
+# One driver (and connection pool) per process, created on first use
+_driver = None
+_driver_lock = threading.Lock()
+
+
+def get_driver():
+    global _driver
+    if _driver is None:
+        with _driver_lock:
+            if _driver is None:
+                _driver = GraphDatabase.driver(
+                    settings.neo4j_uri,
+                    auth=(settings.neo4j_user, settings.neo4j_password),
+                    max_connection_pool_size=settings.neo4j_max_pool_size,
+                    max_connection_lifetime=settings.neo4j_max_connection_lifetime,
+                    connection_acquisition_timeout=settings.neo4j_connection_acquisition_timeout,
+                )
+    return _driver
+
+
+def close_driver():
+    global _driver
+    with _driver_lock:
+        if _driver is not None:
+            _driver.close()
+            _driver = None
+
+
+atexit.register(close_driver)
+
 
 class Neo4jConnection:
 
     def __init__(self):
-        self.driver = GraphDatabase.driver(
-            settings.neo4j_uri,
-            auth=(settings.neo4j_user, settings.neo4j_password)
-        )
+        self.driver = get_driver()
 
     def close(self):
-        self.driver.close()
+        # The driver is shared by the whole process; close_driver() shuts it down
+        pass
 
-    def execute(self, query: str, parameters: dict | None = None):
+    @contextmanager
+    def session(self):
+        """Session on the configured database; run several statements on it before it closes."""
         with self.driver.session(database=settings.neo4j_db) as session:
+            yield session
+
+    @contextmanager
+    def transaction(self):
+        """Explicit transaction: commits when the block exits normally, rolls back on error."""
+        with self.session() as session:
+            with session.begin_transaction() as tx:
+                yield tx
+
+    def execute(self, query: str, parameters: dict | None = None):
+        with self.session() as session:
             session.run(query, parameters or {})
+
+    def execute_batch(self, statements: list[tuple[str, dict]]):
+        """Run several (query, parameters) pairs in one explicit write transaction. Returns each statement's records."""
+        def _run_all(tx):
+            return [list(tx.run(query, parameters or {})) for query, parameters in statements]
+
+        with self.session() as session:
+            return session.execute_write(_run_all)
     
     def execute_query(self, query: str, parameters: dict | None = None):
-        with self.driver.session(database=settings.neo4j_db) as session:
+        with self.session() as session:
             result = session.run(query, parameters or {})
-            return list(result) 
+            return list(result)
+
+    def profile(self, query: str, parameters: dict | None = None):
+        """Run the query under PROFILE; returns the driver's profiled plan (operator tree with db hits, rows, page cache)."""
+        with self.session() as session:
+            return session.run("PROFILE " + query, parameters or {}).consume().profile
+
+    def explain(self, query: str, parameters: dict | None = None):
+        """Plan the query under EXPLAIN without running it; returns the operator tree with estimated rows."""
+        with self.session() as session:
+            return session.run("EXPLAIN " + query, parameters or {}).consume().plan 
@@ -0,0 +1,30 @@
+import threading
+from pathlib import Path
+
+from core.config import settings
+
+# Counter file bumped after ingest commits. Readers that cache query results (phase2's
+# db/result_cache.py) drop their cache when it changes; share GRAPH_VERSION_FILE to link them.
+
+_lock=threading.Lock()
+
+
+def _version_path():
+    path=Path(settings.graph_version_file)
+    if path.is_absolute():
+        return path
+    return Path(__file__).resolve().parent.parent/path
+
+
+def bump_graph_version():
+    path=_version_path()
+    with _lock:
+        path.parent.mkdir(parents=True,exist_ok=True)
+        try:
+            version=int(path.read_text(encoding="utf-8").strip() or 0)+1
+        except (OSError,ValueError):
+            version=1
+        tmp=path.with_name(path.name+".tmp")
+        tmp.write_text(str(version),encoding="utf-8")
+        tmp.replace(path)
+    return version
@@ -0,0 +1,178 @@
+import argparse
+import time
+
+import numpy as np
+
+from db.connection import Neo4jConnection
+from db.graph_version import bump_graph_version
+from graph import schema
+from graph.csr import NODE_KEYS,RELATIONSHIPS,CSRGraph
+
+# Batch graph analytics with write-back: co-acting weights, PageRank and degree centrality.
+# Questions like "most influential actor" or "frequent collaborators" otherwise make every request
+# aggregate ACTED_IN in Cypher. This job reads the ACTED_IN/DIRECTED edges once (graph/csr.py
+# snapshot), computes on the CSR arrays with vectorized NumPy (sparse products as gathers and
+# bincounts) and writes the results back in UNWIND batches:
+#   COLLABORATED_WITH {weight}  one relationship per pair of persons who acted together; weight is
+#                               the number of such movies (the off-diagonal of A*A^T, A = person x movie)
+#   Person.pagerank             PageRank over the credits graph: persons and movies linked by
+#                               ACTED_IN/DIRECTED, both directions
+#   Person.degree_centrality    distinct co-actors / (persons - 1)
+# Old COLLABORATED_WITH relationships are deleted first, so a rerun replaces them. Rerun after ingest.
+#
+# Usage (from phase1/code):
+#   python -m graph.analytics                        # snapshot the database, compute, write back
+#   python -m graph.analytics --csv ../data/movie.csv --dry-run   # compute from the CSV, print the top
+
+WRITE_BATCH_SIZE=10_000
+PAGERANK_DAMPING=0.85
+PAGERANK_TOLERANCE=1e-6
+PAGERANK_MAX_ITERATIONS=100
+CREDITS={rel:RELATIONSHIPS[rel] for rel in ("ACTED_IN","DIRECTED")}
+
+
+def co_acting(graph:CSRGraph):
+    # (a, b, weight) person id arrays, a < b: pairs inside every movie's cast, counted over movies.
+    # Cast rows are sorted by person id, so pairing each entry with the ones after it gives a < b.
+    cast=graph.relationships["ACTED_IN"].in_
+    lengths=np.diff(cast.indptr)
+    position=np.arange(len(cast.indices))-np.repeat(cast.indptr[:-1],lengths)
+    remaining=np.repeat(lengths,lengths)-position-1  # cast members after this entry
+    n=len(graph.keys["Person"])
+    keys=[]
+    candidates=np.flatnonzero(remaining>0)
+    step=1
+    while len(candidates):
+        a=cast.indices[candidates].astype(np.int64)
+        b=cast.indices[candidates+step]
+        keys.append(a*n+b)
+        step+=1
+        candidates=candidates[remaining[candidates]>=step]
+    if not keys:
+        empty=np.empty(0,dtype=np.int64)
+        return empty,empty,empty
+    pairs,weights=np.unique(np.concatenate(keys),return_counts=True)
+    return pairs//n,pairs%n,weights
+
+
+def degree_centrality(a:np.ndarray, b:np.ndarray, n:int):
+    # distinct co-actors per person, normalized by the n - 1 possible ones
+    counts=np.bincount(a,minlength=n)+np.bincount(b,minlength=n)
+    return counts/max(n-1,1)
+
+
+def pagerank(graph:CSRGraph, damping:float=PAGERANK_DAMPING, tolerance:float=PAGERANK_TOLERANCE,
+             max_iterations:int=PAGERANK_MAX_ITERATIONS):
+    # power iteration on the undirected credits graph; returns (person scores, iterations).
+    # Node ids: persons 0..P-1, movies P..P+M-1. Scores over all nodes sum to 1.
+    n_persons=len(graph.keys["Person"])
+    n=n_persons+len(graph.keys["Movie"])
+    src,dst=[],[]
+    for rel in CREDITS:
+        out=graph.relationships[rel].out
+        persons=np.repeat(np.arange(n_persons),np.diff(out.indptr))
+        movies=out.indices.astype(np.int64)+n_persons
+        src+=[persons,movies]
+        dst+=[movies,persons]
+    src,dst=np.concatenate(src),np.concatenate(dst)
+    out_degree=np.bincount(src,minlength=n).astype(float)
+    dangling=out_degree==0
+    share=np.divide(1.0,out_degree,out=np.zeros(n),where=~dangling)
+
+    rank=np.full(n,1.0/max(n,1))
+    iterations=0
+    for iterations in range(1,max_iterations+1):
+        spread=np.bincount(dst,weights=(rank*share)[src],minlength=n)
+        new=(1-damping)/n+damping*(spread+rank[dangling].sum()/n)
+        delta=np.abs(new-rank).sum()
+        rank=new
+        if delta<tolerance:
+            break
+    return rank[:n_persons],iterations
+
+
+def compute(graph:CSRGraph):
+    start=time.perf_counter()
+    a,b,weights=co_acting(graph)
+    n=len(graph.keys["Person"])
+    scores,iterations=pagerank(graph)
+    result={
+        "pairs":(a,b,weights),
+        "pagerank":scores,
+        "degree_centrality":degree_centrality(a,b,n),
+        "iterations":iterations,
+    }
+    print(f"Computed {len(weights)} collaborations, PageRank ({iterations} iterations) and degree "
+          f"centrality for {n} persons in {time.perf_counter()-start:.2f}s")
+    return result
+
+
+def write_back(db:Neo4jConnection, graph:CSRGraph, result:dict, min_weight:int=1,
+               batch_size:int=WRITE_BATCH_SIZE):
+    start=time.perf_counter()
+    names=graph.names["Person"]
+    a,b,weights=result["pairs"]
+    keep=weights>=min_weight
+    a,b,weights=a[keep],b[keep],weights[keep]
+
+    # generation swap: the previous COLLABORATED_WITH set stays until the new one is complete
+    generation=time.time_ns()
+    try:
+        for i in range(0,len(weights),batch_size):
+            rows=[{"a":x,"b":y,"weight":w} for x,y,w in
+                  zip(names[a[i:i+batch_size]].tolist(),names[b[i:i+batch_size]].tolist(),weights[i:i+batch_size].tolist())]
+            db.execute_batch([(schema.CREATE_COLLABORATIONS,{"rows":rows,"generation":generation})])
+    except Exception:
+        db.execute(schema.DELETE_COLLABORATION_GENERATION,{"generation":generation})
+        raise
+    db.execute(schema.DELETE_OLD_COLLABORATIONS,{"generation":generation})
+
+    pagerank_scores=result["pagerank"].tolist()
+    centrality=result["degree_centrality"].tolist()
+    people=names.tolist()
+    for i in range(0,len(people),batch_size):
+        rows=[{"name":name,"pagerank":score,"degree_centrality":degree} for name,score,degree in
+              zip(people[i:i+batch_size],pagerank_scores[i:i+batch_size],centrality[i:i+batch_size])]
+        db.execute_batch([(schema.SET_PERSON_SCORES,{"rows":rows})])
+    # only after every batch is committed: tell result caches the graph changed
+    bump_graph_version()
+    print(f"Wrote {len(weights)} COLLABORATED_WITH relationships and scores for {len(people)} persons "
+          f"in {time.perf_counter()-start:.2f}s")
+
+
+def _top(names:np.ndarray, values:np.ndarray, limit:int):
+    order=np.argsort(-values,kind="stable")[:limit]
+    return list(zip(names[order].tolist(),values[order].tolist()))
+
+
+def main():
+    parser=argparse.ArgumentParser(description="Compute co-acting weights, PageRank and degree centrality; write them back.")
+    parser.add_argument("--csv",help="compute from this movie CSV instead of a database snapshot")
+    parser.add_argument("--dry-run",action="store_true",help="print the top results, write nothing")
+    parser.add_argument("--min-weight",type=int,default=1,help="write COLLABORATED_WITH only for pairs with this many movies")
+    parser.add_argument("--top",type=int,default=5)
+    args=parser.parse_args()
+
+    start=time.perf_counter()
+    db=None
+    if args.csv:
+        graph=CSRGraph.from_movie_csv(args.csv)
+    else:
+        db=Neo4jConnection()
+        graph=CSRGraph.from_neo4j(db,{label:NODE_KEYS[label] for label in ("Movie","Person")},CREDITS)
+    print(f"Loaded in {time.perf_counter()-start:.2f}s: {graph.summary()}")
+    result=compute(graph)
+
+    names=graph.names["Person"]
+    a,b,weights=result["pairs"]
+    print("PageRank:",_top(names,result["pagerank"],args.top))
+    print("Degree centrality:",_top(names,result["degree_centrality"],args.top))
+    top=np.argsort(-weights,kind="stable")[:args.top]
+    print("Collaborations:",[(names[a[i]],names[b[i]],int(weights[i])) for i in top])
+
+    if not args.dry_run:
+        write_back(db or Neo4jConnection(),graph,result,min_weight=args.min_weight)
+
+
+if __name__=="__main__":
+    main()
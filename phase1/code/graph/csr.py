@@ -0,0 +1,337 @@
+import argparse
+import time
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from db.connection import Neo4jConnection
+from ingest.csv_stream import DEFAULT_CHUNK_SIZE,clean_movie_columns,read_movie_chunks
+
+# In-process copy of the movie graph for hot read paths (co-stars, filmographies, genre counts,
+# degrees of separation) that do not need a database round trip.
+# Each label's keys (Movie.movie_id, Person.name, Genre.name) are interned to 0..n-1: a pandas
+# Index maps key -> id, an object array id -> key. Each relationship type is stored twice as CSR arrays: `out` over its start label
+# (indptr[i]:indptr[i+1] slices the end ids of node i) and `in_` over its end label. Traversals
+# gather whole frontiers with NumPy, so a lookup is a few array slices.
+# Memory is the key strings plus ~4 bytes per relationship per direction and 8 bytes per node per
+# relationship type touching its label: 19 MB of arrays for 200k synthetic movies, where one Python
+# object per node with neighbour lists takes ~160 MB (run `python -m graph.csr` for a file's numbers).
+# Load from the CSV (same cleaning as ingest, csv_stream.clean_movie_columns) or snapshot the
+# database; the copy does not follow later writes, so reload it after ingest.
+#
+# Usage (from phase1/code):
+#   graph=CSRGraph.from_movie_csv("../data/movie.csv")     # or CSRGraph.from_neo4j(Neo4jConnection())
+#   graph.neighbors("Person","Atlee",["DIRECTED"])          # [("Movie", "tt15354916"), ...]
+#   graph.k_hop("Person","Shah Rukh Khan",2,["ACTED_IN"])  # movies and co-stars
+#   graph.shortest_path(("Person","Atlee"),("Person","Nayanthara"))
+#   python -m graph.csr ../data/movie.csv                   # load, memory and query timings
+
+NODE_KEYS={"Movie":"movie_id","Person":"name","Genre":"name"}
+RELATIONSHIPS={
+    "HAS_GENRE":("Movie","Genre"),
+    "DIRECTED":("Person","Movie"),
+    "ACTED_IN":("Person","Movie"),
+}
+
+OUT,IN,BOTH="out","in","both"
+
+_EMPTY=np.empty(0,dtype=np.int64)
+
+
+class CSR(NamedTuple):
+    indptr:np.ndarray  # int64, one more than the rows
+    indices:np.ndarray  # int32 neighbour ids
+
+    def row(self,i:int):
+        return self.indices[self.indptr[i]:self.indptr[i+1]]
+
+    def gather(self,ids:np.ndarray):
+        # (neighbours, owner of each neighbour) for a whole frontier, without a Python loop
+        starts=self.indptr[ids]
+        lengths=self.indptr[ids+1]-starts
+        total=int(lengths.sum())
+        if not total:
+            return _EMPTY,_EMPTY
+        offsets=np.repeat(starts-(np.cumsum(lengths)-lengths),lengths)+np.arange(total)
+        return self.indices[offsets].astype(np.int64),np.repeat(ids,lengths)
+
+
+def _csr(rows:np.ndarray, cols:np.ndarray, n_rows:int):
+    # rows must be sorted
+    indptr=np.zeros(n_rows+1,dtype=np.int64)
+    np.cumsum(np.bincount(rows,minlength=n_rows),out=indptr[1:])
+    return CSR(indptr,cols.astype(np.int32))
+
+
+class Relationship(NamedTuple):
+    start:str
+    end:str
+    out:CSR  # start id -> end ids
+    in_:CSR  # end id -> start ids
+
+    @property
+    def count(self):
+        return len(self.out.indices)
+
+
+class CSRGraph:
+
+    def __init__(self, keys:dict[str,pd.Index], relationships:dict[str,Relationship]):
+        self.keys=keys  # key -> id (hash lookup)
+        self.names={label:index.to_numpy(dtype=object) for label,index in keys.items()}  # id -> key
+        self.relationships=relationships
+        self.labels=list(keys)
+
+    @classmethod
+    def from_pairs(cls, keys:dict[str,pd.Index], pairs:dict[str,tuple[np.ndarray,np.ndarray]],
+                   relationships:dict[str,tuple[str,str]]=RELATIONSHIPS):
+        # keys: label -> unique keys; pairs: type -> (start keys, end keys), repeats allowed
+        built={}
+        for rel,(start,end) in relationships.items():
+            starts,ends=pairs[rel]
+            s=keys[start].get_indexer(starts)
+            e=keys[end].get_indexer(ends)
+            known=(s>=0)&(e>=0)
+            n_start,n_end=len(keys[start]),len(keys[end])
+            # unique (start, end) pairs, sorted by start: MERGE semantics and CSR order in one step
+            combined=np.unique(s[known].astype(np.int64)*max(n_end,1)+e[known])
+            s,e=combined//max(n_end,1),combined%max(n_end,1)
+            order=np.argsort(e,kind="stable")
+            built[rel]=Relationship(start,end,_csr(s,e,n_start),_csr(e[order],s[order],n_end))
+        return cls(keys,built)
+
+    @classmethod
+    def from_movie_csv(cls, file_path:str, chunk_size:int=DEFAULT_CHUNK_SIZE*10):
+        movies,genres,directed,acted=[],[],[],[]
+        for chunk in read_movie_chunks(file_path,chunk_size):
+            frame,_=clean_movie_columns(chunk)
+            movies.append(frame["movie_id"].to_numpy())
+            genre=frame[["movie_id","genre"]].explode("genre")
+            genres.append((genre["movie_id"].to_numpy(),genre["genre"].to_numpy()))
+            directed.append((frame["director"].to_numpy(),frame["movie_id"].to_numpy()))
+            cast=frame[["movie_id","cast"]].explode("cast")
+            acted.append((cast["cast"].to_numpy(),cast["movie_id"].to_numpy()))
+
+        def _join(parts):
+            if not parts:
+                return np.empty(0,dtype=object),np.empty(0,dtype=object)
+            return np.concatenate([p[0] for p in parts]),np.concatenate([p[1] for p in parts])
+
+        pairs={"HAS_GENRE":_join(genres),"DIRECTED":_join(directed),"ACTED_IN":_join(acted)}
+        keys={
+            "Movie":pd.Index(pd.unique(np.concatenate(movies) if movies else np.empty(0,dtype=object))),
+            "Person":pd.Index(pd.unique(np.concatenate([pairs["DIRECTED"][0],pairs["ACTED_IN"][0]]))),
+            "Genre":pd.Index(pd.unique(pairs["HAS_GENRE"][1])),
+        }
+        return cls.from_pairs(keys,pairs)
+
+    @classmethod
+    def from_neo4j(cls, db:Neo4jConnection, node_keys:dict[str,str]=NODE_KEYS,
+                   relationships:dict[str,tuple[str,str]]=RELATIONSHIPS):
+        # one read per label and per relationship type; nodes without a key are left out
+        keys={}
+        pairs={}
+        with db.session() as session:
+            for label,prop in node_keys.items():
+                frame=session.run(f"MATCH (n:{label}) WHERE n.{prop} IS NOT NULL RETURN n.{prop} AS key").to_df()
+                keys[label]=pd.Index(frame["key"].unique() if len(frame) else [],dtype=object)
+            for rel,(start,end) in relationships.items():
+                frame=session.run(f"MATCH (a:{start})-[:{rel}]->(b:{end}) "
+                                  f"RETURN a.{node_keys[start]} AS start, b.{node_keys[end]} AS end").to_df()
+                if not len(frame):
+                    frame=pd.DataFrame({"start":[],"end":[]},dtype=object)
+                pairs[rel]=(frame["start"].to_numpy(),frame["end"].to_numpy())
+        return cls.from_pairs(keys,pairs,relationships)
+
+    # -- lookups
+
+    def node_id(self, label:str, key:str):
+        # KeyError for an unknown label or key
+        return self.keys[label].get_loc(key)
+
+    def key(self, label:str, node:int):
+        return self.names[label][node]
+
+    def _types(self, types:list[str]|None):
+        return self.relationships if types is None else {t:self.relationships[t] for t in types}
+
+    def expand(self, label:str, ids:np.ndarray, types:list[str]|None=None, direction:str=BOTH):
+        # one hop from the nodes `ids` of `label`: yields (neighbour label, neighbour ids, owner ids)
+        for rel in self._types(types).values():
+            if rel.start==label and direction!=IN:
+                neighbours,owners=rel.out.gather(ids)
+                if len(neighbours):
+                    yield rel.end,neighbours,owners
+            if rel.end==label and direction!=OUT:
+                neighbours,owners=rel.in_.gather(ids)
+                if len(neighbours):
+                    yield rel.start,neighbours,owners
+
+    def neighbors(self, label:str, key:str, types:list[str]|None=None, direction:str=BOTH):
+        """Distinct neighbours of one node as (label, key) pairs."""
+        ids=np.array([self.node_id(label,key)])
+        found=[]
+        for other,neighbours,_ in self.expand(label,ids,types,direction):
+            found+=[(other,k) for k in self.names[other][np.unique(neighbours)].tolist()]
+        return list(dict.fromkeys(found))
+
+    def degree(self, label:str, key:str, types:list[str]|None=None, direction:str=BOTH):
+        node=self.node_id(label,key)
+        total=0
+        for rel in self._types(types).values():
+            if rel.start==label and direction!=IN:
+                total+=int(rel.out.indptr[node+1]-rel.out.indptr[node])
+            if rel.end==label and direction!=OUT:
+                total+=int(rel.in_.indptr[node+1]-rel.in_.indptr[node])
+        return total
+
+    def degrees(self, label:str, types:list[str]|None=None, direction:str=BOTH):
+        # degree of every node of `label`, as an int64 array indexed by node id
+        total=np.zeros(len(self.keys[label]),dtype=np.int64)
+        for rel in self._types(types).values():
+            if rel.start==label and direction!=IN:
+                total+=np.diff(rel.out.indptr)
+            if rel.end==label and direction!=OUT:
+                total+=np.diff(rel.in_.indptr)
+        return total
+
+    def top_degrees(self, label:str, types:list[str]|None=None, direction:str=BOTH, limit:int=10):
+        counts=self.degrees(label,types,direction)
+        top=np.argsort(-counts,kind="stable")[:limit]
+        return list(zip(self.names[label][top].tolist(),counts[top].tolist()))
+
+    # -- traversals
+
+    def k_hop(self, label:str, key:str, k:int, types:list[str]|None=None, direction:str=BOTH):
+        """Nodes reachable in 1..k hops (not the start node), as label -> list of keys."""
+        start=self.node_id(label,key)
+        seen={name:np.zeros(len(index),dtype=bool) for name,index in self.keys.items()}
+        seen[label][start]=True
+        frontier={label:np.array([start])}
+        for _ in range(k):
+            reached={}
+            for current,ids in frontier.items():
+                for other,neighbours,_ in self.expand(current,ids,types,direction):
+                    reached.setdefault(other,[]).append(neighbours)
+            frontier={}
+            for other,parts in reached.items():
+                ids=np.unique(np.concatenate(parts))
+                ids=ids[~seen[other][ids]]
+                if len(ids):
+                    seen[other][ids]=True
+                    frontier[other]=ids
+            if not frontier:
+                break
+        seen[label][start]=False
+        return {name:self.names[name][mask].tolist() for name,mask in seen.items() if mask.any()}
+
+    def shortest_path(self, start:tuple[str,str], end:tuple[str,str], types:list[str]|None=None,
+                      direction:str=BOTH, max_hops:int|None=None):
+        """Bidirectional BFS; the path as a list of (label, key) from start to end, or None."""
+        codes={name:i for i,name in enumerate(self.labels)}
+        source=(start[0],self.node_id(*start))
+        target=(end[0],self.node_id(*end))
+        if source==target:
+            return [start]
+        reverse={OUT:IN,IN:OUT,BOTH:BOTH}[direction]
+        # per side and label: parent id + 1 (0 = not reached) and parent label code; np.zeros is lazy
+        sides=[]
+        for (label,node),side_direction in ((source,direction),(target,reverse)):
+            parents={name:np.zeros(len(index),dtype=np.int64) for name,index in self.keys.items()}
+            parent_labels={name:np.zeros(len(index),dtype=np.int8) for name,index in self.keys.items()}
+            parents[label][node]=node+1
+            parent_labels[label][node]=codes[label]
+            sides.append({"parents":parents,"labels":parent_labels,"frontier":{label:np.array([node])},
+                          "direction":side_direction,"root":(label,node)})
+
+        hops=0
+        while all(side["frontier"] for side in sides) and (max_hops is None or hops<max_hops):
+            # grow the smaller frontier by one level
+            side,other=sorted(sides,key=lambda s:sum(len(ids) for ids in s["frontier"].values()))
+            hops+=1
+            meet=None
+            frontier={}
+            for current,ids in side["frontier"].items():
+                for label,neighbours,owners in self.expand(current,ids,types,side["direction"]):
+                    fresh=side["parents"][label][neighbours]==0
+                    neighbours,owners=neighbours[fresh],owners[fresh]
+                    if not len(neighbours):
+                        continue
+                    neighbours,first=np.unique(neighbours,return_index=True)
+                    side["parents"][label][neighbours]=owners[first]+1
+                    side["labels"][label][neighbours]=codes[current]
+                    frontier.setdefault(label,[]).append(neighbours)
+                    if meet is None:
+                        hit=np.flatnonzero(other["parents"][label][neighbours])
+                        if len(hit):
+                            meet=(label,int(neighbours[hit[0]]))
+            if meet is not None:
+                forward,backward=(side,other) if side is sides[0] else (other,side)
+                path=self._walk(forward,meet)[::-1]+self._walk(backward,meet)[1:]
+                return [(label,self.names[label][node]) for label,node in path]
+            side["frontier"]={label:np.concatenate(parts) for label,parts in frontier.items()}
+        return None
+
+    def _walk(self, side:dict, node:tuple[str,int]):
+        # node back to the side's root
+        path=[node]
+        while node!=side["root"]:
+            label,i=node
+            node=(self.labels[side["labels"][label][i]],int(side["parents"][label][i])-1)
+            path.append(node)
+        return path
+
+    # -- size
+
+    def nbytes(self):
+        # array bytes (CSR + id -> key pointers); the key strings and hash tables are extra
+        total=sum(names.nbytes for names in self.names.values())
+        for rel in self.relationships.values():
+            total+=sum(a.nbytes for a in (rel.out.indptr,rel.out.indices,rel.in_.indptr,rel.in_.indices))
+        return total
+
+    def summary(self):
+        nodes=", ".join(f"{len(index)} {label}" for label,index in self.keys.items())
+        rels=", ".join(f"{rel.count} {name}" for name,rel in self.relationships.items())
+        return f"{nodes}; {rels}; {self.nbytes()/2**20:.1f} MB arrays"
+
+
+def _time_us(fn, repeat:int=200):
+    fn()
+    start=time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter()-start)/repeat*1e6
+
+
+def main():
+    parser=argparse.ArgumentParser(description="Load the movie graph into CSR arrays and time sample lookups.")
+    parser.add_argument("csv",nargs="?",help="movie CSV; omit to snapshot the database from .env")
+    args=parser.parse_args()
+    start=time.perf_counter()
+    graph=CSRGraph.from_movie_csv(args.csv) if args.csv else CSRGraph.from_neo4j(Neo4jConnection())
+    print(f"Loaded in {time.perf_counter()-start:.2f}s: {graph.summary()}")
+    if not len(graph.keys["Person"]):
+        return
+
+    # a typical actor (median degree) and the most connected one
+    counts=graph.degrees("Person",["ACTED_IN"])
+    order=np.argsort(counts,kind="stable")
+    actor,hub=graph.names["Person"][order[len(order)//2]],graph.names["Person"][order[-1]]
+    other=graph.names["Person"][order[len(order)//4]]
+    checks={
+        f"neighbors({actor!r}, ACTED_IN)":lambda:graph.neighbors("Person",actor,["ACTED_IN"]),
+        f"degree({actor!r})":lambda:graph.degree("Person",actor),
+        f"k_hop({actor!r}, 2, ACTED_IN)":lambda:graph.k_hop("Person",actor,2,["ACTED_IN"]),
+        f"degree({hub!r}) (hub)":lambda:graph.degree("Person",hub),
+        f"shortest_path({actor!r}, {other!r}, ACTED_IN)":
+            lambda:graph.shortest_path(("Person",actor),("Person",other),["ACTED_IN"]),
+    }
+    for name,fn in checks.items():
+        print(f"  {name}: {_time_us(fn,repeat=20):.0f} us")
+    print(f"  path: {graph.shortest_path(('Person',actor),('Person',other),['ACTED_IN'])}")
+
+
+if __name__=="__main__":
+    main()
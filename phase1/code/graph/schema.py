@@ -42,4 +42,213 @@ MERGE (p:Person {name: $actor})
 WITH p
 MATCH (m:Movie {movie_id: $movie_id})
 MERGE (p)-[:ACTED_IN]->(m)
-"""
\ No newline at end of file
+"""
+
+# Batched (UNWIND) queries: $rows is a list of MovieModel dicts
+UNWIND_MOVIES = """
+UNWIND $rows AS row
+MERGE (m:Movie {movie_id: row.movie_id})
+SET m.name = row.movie_name,
+m.year = row.year,
+m.overview = row.overview
+"""
+
+UNWIND_GENRE_RELS = """
+UNWIND $rows AS row
+UNWIND row.genre AS genre
+MERGE (g:Genre {name: genre})
+WITH g, row
+MATCH (m:Movie {movie_id: row.movie_id})
+MERGE (m)-[:HAS_GENRE]->(g)
+"""
+
+UNWIND_DIRECTOR_RELS = """
+UNWIND $rows AS row
+MERGE (p:Person {name: row.director})
+WITH p, row
+MATCH (m:Movie {movie_id: row.movie_id})
+MERGE (p)-[:DIRECTED]->(m)
+"""
+
+UNWIND_ACTOR_RELS = """
+UNWIND $rows AS row
+UNWIND row.cast AS actor
+MERGE (p:Person {name: actor})
+WITH p, row
+MATCH (m:Movie {movie_id: row.movie_id})
+MERGE (p)-[:ACTED_IN]->(m)
+"""
+
+
+# Parallel ingest: shared nodes first, then MATCH-only relationship batches
+UNWIND_GENRES = """
+UNWIND $names AS name
+MERGE (:Genre {name: name})
+"""
+
+UNWIND_PERSONS = """
+UNWIND $names AS name
+MERGE (:Person {name: name})
+"""
+
+# $pairs is a list of {movie_id, name}
+MATCH_GENRE_RELS = """
+UNWIND $pairs AS pair
+MATCH (m:Movie {movie_id: pair.movie_id})
+MATCH (g:Genre {name: pair.name})
+MERGE (m)-[:HAS_GENRE]->(g)
+"""
+
+MATCH_DIRECTOR_RELS = """
+UNWIND $pairs AS pair
+MATCH (m:Movie {movie_id: pair.movie_id})
+MATCH (p:Person {name: pair.name})
+MERGE (p)-[:DIRECTED]->(m)
+"""
+
+MATCH_ACTOR_RELS = """
+UNWIND $pairs AS pair
+MATCH (m:Movie {movie_id: pair.movie_id})
+MATCH (p:Person {name: pair.name})
+MERGE (p)-[:ACTED_IN]->(m)
+"""
+
+
+# Incremental ingest (ingest/incremental.py): before a changed movie is re-written, drop the
+# relationships its new row no longer has ($rows as for the UNWIND queries above). Each returns the
+# names it unlinked, for the orphan check below
+PRUNE_GENRE_RELS = """
+UNWIND $rows AS row
+MATCH (m:Movie {movie_id: row.movie_id})-[r:HAS_GENRE]->(g:Genre)
+WHERE NOT g.name IN row.genre
+DELETE r
+RETURN DISTINCT g.name AS name
+"""
+
+PRUNE_DIRECTOR_RELS = """
+UNWIND $rows AS row
+MATCH (p:Person)-[r:DIRECTED]->(m:Movie {movie_id: row.movie_id})
+WHERE p.name <> row.director
+DELETE r
+RETURN DISTINCT p.name AS name
+"""
+
+PRUNE_ACTOR_RELS = """
+UNWIND $rows AS row
+MATCH (p:Person)-[r:ACTED_IN]->(m:Movie {movie_id: row.movie_id})
+WHERE NOT p.name IN row.cast
+DELETE r
+RETURN DISTINCT p.name AS name
+"""
+
+# Movies whose rows left the CSV ($ids is a list of movie_id); returns the genres/persons they were linked to
+DELETE_MOVIES = """
+UNWIND $ids AS id
+MATCH (m:Movie {movie_id: id})
+WITH m, [(m)-[:HAS_GENRE]->(g:Genre) | g.name] AS genres, [(p:Person)-->(m) | p.name] AS persons
+DETACH DELETE m
+RETURN genres, persons
+"""
+
+# $names: genres/persons unlinked above; deleted if no movie links to them any more. Only these are
+# checked, so the cost follows the change, not the label size. COLLABORATED_WITH (graph/analytics.py)
+# does not keep a person alive: it is derived from ACTED_IN and rebuilt by the next analytics run
+DELETE_ORPHAN_GENRES = """
+UNWIND $names AS name
+MATCH (g:Genre {name: name})
+WHERE NOT EXISTS { (g)--() }
+DELETE g
+"""
+
+DELETE_ORPHAN_PERSONS = """
+UNWIND $names AS name
+MATCH (p:Person {name: name})
+WHERE NOT EXISTS { (p)-[:DIRECTED|ACTED_IN]->() }
+DETACH DELETE p
+"""
+
+
+# Fresh-database load (ingest/fresh.py): only while Movie/Genre/Person are empty. Every node is
+# CREATEd once; relationships are CREATEd between nodes found through the uniqueness constraints
+FRESH_LABELS_IN_USE = """
+RETURN EXISTS { MATCH (:Movie) } AS Movie,
+EXISTS { MATCH (:Genre) } AS Genre,
+EXISTS { MATCH (:Person) } AS Person
+"""
+
+CREATE_MOVIES = """
+UNWIND $rows AS row
+CREATE (:Movie {movie_id: row.movie_id, name: row.movie_name, year: row.year, overview: row.overview})
+"""
+
+CREATE_GENRES = """
+UNWIND $names AS name
+CREATE (:Genre {name: name})
+"""
+
+CREATE_PERSONS = """
+UNWIND $names AS name
+CREATE (:Person {name: name})
+"""
+
+CREATE_GENRE_RELS = """
+UNWIND $rows AS row
+MATCH (m:Movie {movie_id: row.movie_id})
+UNWIND row.genre AS name
+MATCH (g:Genre {name: name})
+CREATE (m)-[:HAS_GENRE]->(g)
+"""
+
+CREATE_DIRECTOR_RELS = """
+UNWIND $rows AS row
+MATCH (m:Movie {movie_id: row.movie_id})
+MATCH (p:Person {name: row.director})
+CREATE (p)-[:DIRECTED]->(m)
+"""
+
+CREATE_ACTOR_RELS = """
+UNWIND $rows AS row
+MATCH (m:Movie {movie_id: row.movie_id})
+UNWIND row.cast AS name
+MATCH (p:Person {name: name})
+CREATE (p)-[:ACTED_IN]->(m)
+"""
+
+
+# Batch analytics write-back (graph/analytics.py). Precomputed so questions about collaborators or
+# influence read a property instead of aggregating ACTED_IN at query time:
+#   (a:Person)-[:COLLABORATED_WITH {weight}]-(b:Person)  weight = movies both acted in; one
+#                                                        relationship per pair, match it undirected
+#   Person.pagerank            PageRank over the ACTED_IN/DIRECTED credits graph (higher = more central)
+#   Person.degree_centrality   distinct co-actors / (persons - 1)
+# A run writes its relationships under a new $generation and only then deletes every other one, so
+# a failure part-way never leaves the graph without a complete set (see analytics.write_back)
+
+# $rows: list of {a, b, weight} person names
+CREATE_COLLABORATIONS = """
+UNWIND $rows AS row
+MATCH (a:Person {name: row.a})
+MATCH (b:Person {name: row.b})
+CREATE (a)-[:COLLABORATED_WITH {weight: row.weight, generation: $generation}]->(b)
+"""
+
+# After every batch of $generation is written: drop earlier runs (and leftovers of failed ones)
+DELETE_OLD_COLLABORATIONS = """
+MATCH (:Person)-[r:COLLABORATED_WITH]->(:Person)
+WHERE r.generation IS NULL OR r.generation <> $generation
+CALL { WITH r DELETE r } IN TRANSACTIONS OF 10000 ROWS
+"""
+
+# A run that failed part-way removes what it wrote, leaving the previous generation in place
+DELETE_COLLABORATION_GENERATION = """
+MATCH (:Person)-[r:COLLABORATED_WITH {generation: $generation}]->(:Person)
+CALL { WITH r DELETE r } IN TRANSACTIONS OF 10000 ROWS
+"""
+
+# $rows: list of {name, pagerank, degree_centrality}
+SET_PERSON_SCORES = """
+UNWIND $rows AS row
+MATCH (p:Person {name: row.name})
+SET p.pagerank = row.pagerank,
+p.degree_centrality = row.degree_centrality
+"""
@@ -0,0 +1,168 @@
+import argparse
+import shlex
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from core.config import settings
+from db.connection import Neo4jConnection
+from db.graph_version import bump_graph_version
+from graph import schema
+from ingest.csv_stream import clean_movie_columns,read_movie_chunks
+
+# Offline bulk-import export: movie.csv -> node/relationship CSVs for `neo4j-admin database import`.
+# For a first load into an empty database; the importer writes the store files directly (no
+# transactions, no MERGE), which is minutes instead of hours for millions of rows.
+# Rows go through the same cleaning as ingest (csv_stream.clean_movie_columns = MovieModel rules),
+# column-wise per chunk. Person and Genre names are interned in memory: each distinct name gets one
+# integer ID, in order of first appearance, so the same CSV always exports the same IDs. Movies keep
+# movie_id as their ID (first row wins for a repeated movie_id, like a unique constraint would).
+# Files are streamed chunk by chunk; only the name -> ID maps and the movie_id set stay in memory.
+# After the import, start the database and apply graph/schema.py's constraints:
+#
+# Usage (from phase1/code):
+#   python -m ingest.bulk_export export ../data/movie.csv import/      # prints the neo4j-admin command
+#   neo4j-admin database import full ... neo4j                          # database stopped
+#   python -m ingest.bulk_export constraints                            # database running
+
+EXPORT_CHUNK_SIZE=100_000
+
+NODE_FILES={
+    "Movie":("movies.csv",["movie_id:ID(Movie)","name","year:int","overview"]),
+    "Person":("persons.csv",[":ID(Person)","name"]),
+    "Genre":("genres.csv",[":ID(Genre)","name"]),
+}
+RELATIONSHIP_FILES={
+    "HAS_GENRE":("has_genre.csv",[":START_ID(Movie)",":END_ID(Genre)"]),
+    "DIRECTED":("directed.csv",[":START_ID(Person)",":END_ID(Movie)"]),
+    "ACTED_IN":("acted_in.csv",[":START_ID(Person)",":END_ID(Movie)"]),
+}
+
+
+class Interner:
+    # name -> stable integer ID (order of first appearance), looked up a chunk at a time
+
+    def __init__(self):
+        self.names=pd.Index([],dtype=object)
+
+    def __call__(self,names:pd.Series):
+        ids=self.names.get_indexer(names)
+        new=names[ids<0].unique()
+        if len(new):
+            self.names=self.names.append(pd.Index(new))
+            ids=self.names.get_indexer(names)
+        return ids
+
+    def __len__(self):
+        return len(self.names)
+
+
+def import_command(out_dir:Path, database:str, multiline:bool=False):
+    args=["neo4j-admin","database","import","full","--overwrite-destination"]
+    if multiline:
+        args.append("--multiline-fields=true")
+    args+=[f"--nodes={label}={out_dir/name}" for label,(name,_) in NODE_FILES.items()]
+    args+=[f"--relationships={rel}={out_dir/name}" for rel,(name,_) in RELATIONSHIP_FILES.items()]
+    args.append(database)
+    return " ".join(shlex.quote(str(a)) for a in args)
+
+
+def _pairs(frame:pd.DataFrame, column:str):
+    # (movie_id, name) per list item, without repeats inside one movie
+    pairs=frame[["movie_id",column]].explode(column)
+    return pairs[~pairs.duplicated()]
+
+
+def export_movies(file_path:str, out_dir:str|Path, chunk_size:int=EXPORT_CHUNK_SIZE):
+    """Write import CSVs for movie.csv into out_dir; returns counts per node label / relationship type."""
+    out_dir=Path(out_dir)
+    out_dir.mkdir(parents=True,exist_ok=True)
+    start=time.perf_counter()
+    persons,genres=Interner(),Interner()
+    movies=set()
+    counts=dict.fromkeys([*NODE_FILES,*RELATIONSHIP_FILES],0)
+    skipped=dropped=0
+    multiline=False
+
+    files={key:(out_dir/name).open("w",newline="",encoding="utf-8")
+           for key,(name,_) in {**NODE_FILES,**RELATIONSHIP_FILES}.items()}
+    try:
+        for key,(_,header) in {**NODE_FILES,**RELATIONSHIP_FILES}.items():
+            files[key].write(",".join(header)+"\n")
+
+        for chunk in read_movie_chunks(file_path,chunk_size):
+            frame,invalid=clean_movie_columns(chunk)
+            dropped+=invalid
+            # first row wins for a repeated movie_id, in this chunk or an earlier one
+            ids=frame["movie_id"].tolist()
+            first=[]
+            for movie_id in ids:
+                first.append(movie_id not in movies)
+                movies.add(movie_id)
+            frame=frame[first]
+            skipped+=len(ids)-len(frame)
+            if frame.empty:
+                continue
+
+            text=frame[["movie_name","overview"]]
+            multiline=multiline or bool(text.apply(lambda c:c.str.contains("\n",regex=False)).any(axis=None))
+            frame[["movie_id","movie_name","year","overview"]].to_csv(files["Movie"],header=False,index=False)
+            genre=_pairs(frame,"genre")
+            genre.assign(genre=genres(genre["genre"])).to_csv(files["HAS_GENRE"],header=False,index=False)
+            directed=pd.DataFrame({"person":persons(frame["director"]),"movie_id":frame["movie_id"]})
+            directed.to_csv(files["DIRECTED"],header=False,index=False)
+            cast=_pairs(frame,"cast")
+            pd.DataFrame({"person":persons(cast["cast"]),"movie_id":cast["movie_id"]}).to_csv(
+                files["ACTED_IN"],header=False,index=False)
+            counts["Movie"]+=len(frame)
+            counts["DIRECTED"]+=len(frame)
+            counts["HAS_GENRE"]+=len(genre)
+            counts["ACTED_IN"]+=len(cast)
+
+        for label,interner in (("Person",persons),("Genre",genres)):
+            pd.DataFrame({"id":range(len(interner)),"name":interner.names}).to_csv(files[label],header=False,index=False)
+            counts[label]=len(interner)
+    finally:
+        for f in files.values():
+            f.close()
+
+    elapsed=time.perf_counter()-start
+    print(f"Exported {counts['Movie']} movies, {counts['Person']} persons, {counts['Genre']} genres, "
+          f"{counts['HAS_GENRE']+counts['DIRECTED']+counts['ACTED_IN']} relationships in {elapsed:.2f}s -> {out_dir}")
+    if dropped:
+        print(f"Validation failed:{dropped} rows missing required fields")
+    if skipped:
+        print(f"Skipped {skipped} rows with a repeated movie_id")
+    print("Stop the database, then run:")
+    print("  "+import_command(out_dir,settings.neo4j_db,multiline))
+    return counts
+
+
+def apply_constraints():
+    # after the import, with the database running: same constraints as the MERGE ingest
+    db=Neo4jConnection()
+    for constraint in schema.CREATE_CONSTRAINS:
+        db.execute(constraint)
+    bump_graph_version()
+    db.close()
+    print(f"Applied {len(schema.CREATE_CONSTRAINS)} constraints")
+
+
+def main():
+    parser=argparse.ArgumentParser(description="Export movie.csv for neo4j-admin database import.")
+    sub=parser.add_subparsers(dest="command",required=True)
+    export=sub.add_parser("export",help="Write node/relationship CSVs and print the import command")
+    export.add_argument("csv")
+    export.add_argument("out_dir")
+    export.add_argument("--chunk-size",type=int,default=EXPORT_CHUNK_SIZE)
+    sub.add_parser("constraints",help="Create graph/schema.py constraints after the import")
+    args=parser.parse_args()
+    if args.command=="export":
+        export_movies(args.csv,args.out_dir,chunk_size=args.chunk_size)
+    else:
+        apply_constraints()
+
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+from models.movie import MovieModel
+
+# Stream movie.csv in chunks and apply MovieModel's cleaning rules column-wise
+# (genre/cast split, year digits, NaN checks) instead of iterrows + MovieModel per row.
+# Batches are lists of dicts shaped like MovieModel.model_dump().
+
+REQUIRED_TEXT_COLUMNS=["movie_id","movie_name","overview","director","genre","cast"]
+
+DEFAULT_CHUNK_SIZE=10_000
+
+
+def split_list_column(values:pd.Series):
+    # same as MovieModel.split_values
+    return values.str.strip().str.split(r"\s*,\s*",regex=True)
+
+
+def coerce_year_column(values:pd.Series):
+    # same as MovieModel.coerce_year: numbers as-is, strings by their digits, else None
+    numeric=pd.to_numeric(values,errors="coerce")
+    digits=values.astype("string").str.replace(r"\D","",regex=True)
+    from_digits=pd.to_numeric(digits.where(digits.str.len()>0),errors="coerce")
+    years=np.trunc(numeric.fillna(from_digits)).astype("Int64")
+    return years.astype(object).where(years.notna(),None)
+
+
+def clean_movie_columns(df:pd.DataFrame):
+    # the cleaning rules as a DataFrame of MovieModel fields (genre/cast are lists); bulk_export.py
+    # works on these columns directly, clean_movie_frame turns them into row dicts
+    valid=df[REQUIRED_TEXT_COLUMNS].notna().all(axis=1)
+    df=df[valid]
+    if "year" in df.columns:
+        years=coerce_year_column(df["year"])
+    else:
+        years=pd.Series([None]*len(df),index=df.index,dtype=object)
+    columns={
+        "movie_id":df["movie_id"],
+        "movie_name":df["movie_name"],
+        "year":years,
+        "overview":df["overview"],
+        "director":df["director"],
+        "genre":split_list_column(df["genre"]),
+        "cast":split_list_column(df["cast"]),
+    }
+    return pd.DataFrame({field:columns[field] for field in MovieModel.model_fields}),int((~valid).sum())
+
+
+def movie_rows(frame:pd.DataFrame):
+    # MovieModel dicts of a clean_movie_columns frame, in frame order
+    fields=list(MovieModel.model_fields)
+    return [dict(zip(fields,values))
+            for values in zip(*(frame[field].tolist() for field in fields))]
+
+
+def clean_movie_frame(df:pd.DataFrame):
+    frame,dropped=clean_movie_columns(df)
+    return movie_rows(frame),dropped
+
+
+def read_movie_chunks(file_path:str,chunk_size:int=DEFAULT_CHUNK_SIZE,text_only:bool=False):
+    # raw DataFrame chunks, before clean_movie_frame (bench/run.py times the two steps separately);
+    # text_only reads year as text too (stable row fingerprints for ingest/manifest.py)
+    return pd.read_csv(file_path,chunksize=chunk_size,
+                       dtype=str if text_only else {column:str for column in REQUIRED_TEXT_COLUMNS})
+
+
+def iter_movie_batches(file_path:str,chunk_size:int=DEFAULT_CHUNK_SIZE):
+    for chunk in read_movie_chunks(file_path,chunk_size):
+        rows,dropped=clean_movie_frame(chunk)
+        if dropped:
+            print(f"Validation failed:{dropped} rows missing required fields")
+        if rows:
+            yield rows
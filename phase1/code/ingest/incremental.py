@@ -0,0 +1,149 @@
+import time
+
+from db.connection import Neo4jConnection
+from db.graph_version import bump_graph_version
+from graph import schema
+from ingest.csv_stream import DEFAULT_CHUNK_SIZE,REQUIRED_TEXT_COLUMNS,clean_movie_columns,movie_rows,read_movie_chunks
+from ingest.manifest import RowManifest,row_fingerprints
+
+# Incremental movie ingest: write only rows that are new or changed since the last run.
+# Every row is fingerprinted from its CSV text (vectorized) and compared with the manifest
+# (ingest/manifest.py, keyed by movie_id). Only new/changed rows are cleaned and written, in UNWIND
+# batches; for a changed movie the relationships its new row no longer lists (a dropped cast
+# member, a new director) are deleted in the same transaction. A row's fingerprint is recorded
+# only once its batch is written; an invalid row keeps its previous entry (the graph still holds
+# that version), so it is retried. Movies missing from the CSV are reported, or DETACH DELETEd with
+# delete_missing. Genres/persons unlinked on the way are then removed if no movie links to them.
+# An unchanged file never opens a connection.
+# The manifest describes what this script wrote: delete it if the database is reset or edited
+# by other means, and the next run rewrites every row.
+
+DEFAULT_BATCH_SIZE=500
+KEY="movie_id"
+FINGERPRINT_COLUMNS=REQUIRED_TEXT_COLUMNS+["year"]
+
+
+def _write_rows(db:Neo4jConnection, rows:list[dict], changed:list[dict]):
+    # returns the genres and persons that lost a link
+    statements=[]
+    if changed:
+        statements+=[
+            (schema.PRUNE_GENRE_RELS,{"rows":changed}),
+            (schema.PRUNE_DIRECTOR_RELS,{"rows":changed}),
+            (schema.PRUNE_ACTOR_RELS,{"rows":changed}),
+        ]
+    statements+=[
+        (schema.UNWIND_MOVIES,{"rows":rows}),
+        (schema.UNWIND_GENRE_RELS,{"rows":rows}),
+        (schema.UNWIND_DIRECTOR_RELS,{"rows":rows}),
+        (schema.UNWIND_ACTOR_RELS,{"rows":rows}),
+    ]
+    results=db.execute_batch(statements)
+    if not changed:
+        return [],[]
+    genres,directors,actors=results[:3]
+    return [r["name"] for r in genres],[r["name"] for r in directors+actors]
+
+
+class _Writer:
+    # Opens the connection (and creates constraints) only when there is something to write
+
+    def __init__(self,batch_size:int,manifest:RowManifest):
+        self.batch_size=batch_size
+        self.manifest=manifest
+        self.existing=set(manifest.rows)  # movie_ids already in the graph
+        self.pending:dict[str,dict]={}  # movie_id -> row; a repeated id keeps its last row
+        self.fingerprints:dict[str,int]={}  # movie_id -> fingerprint of the pending row
+        self.unlinked={"genres":set(),"persons":set()}  # orphan candidates
+        self.db=None
+
+    def connect(self):
+        if self.db is None:
+            self.db=Neo4jConnection()
+            for constraint in schema.CREATE_CONSTRAINS:
+                self.db.execute(constraint)
+        return self.db
+
+    def add(self,row:dict,fingerprint:int):
+        if row[KEY] in self.pending:
+            self.flush()  # same movie twice: write the earlier row first, so the later one wins
+        self.pending[row[KEY]]=row
+        self.fingerprints[row[KEY]]=fingerprint
+        if len(self.pending)>=self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        rows=list(self.pending.values())
+        genres,persons=_write_rows(self.connect(),rows,[row for row in rows if row[KEY] in self.existing])
+        self.unlinked["genres"].update(genres)
+        self.unlinked["persons"].update(persons)
+        self.manifest.rows.update(self.fingerprints)
+        self.existing.update(self.pending)
+        self.pending,self.fingerprints={},{}
+
+
+def ingest_movies_incremental(file_path:str, batch_size:int|None=None, delete_missing:bool=False):
+    """Write only new and changed rows of movie.csv (see the comment at the top of this module).
+    Returns counts: new, changed, unchanged, invalid, missing, deleted."""
+    start=time.perf_counter()
+    manifest=RowManifest()
+    previous=set(manifest.rows)
+    writer=_Writer(batch_size or DEFAULT_BATCH_SIZE,manifest)
+    counts=dict.fromkeys(("new","changed","unchanged","invalid","missing","deleted"),0)
+    seen=set()
+    dirty=False
+
+    for chunk in read_movie_chunks(file_path,DEFAULT_CHUNK_SIZE,text_only=True):
+        chunk=chunk[chunk[KEY].notna()]
+        columns=[column for column in FINGERPRINT_COLUMNS if column in chunk.columns]
+        fingerprints=row_fingerprints(chunk,columns)
+        todo=[]
+        for position,(key,fingerprint) in enumerate(zip(chunk[KEY].tolist(),fingerprints.tolist())):
+            seen.add(key)
+            if manifest.rows.get(key)!=fingerprint:
+                todo.append(position)
+        counts["unchanged"]+=len(chunk)-len(todo)
+        if not todo:
+            continue
+        dirty=True
+        frame,dropped=clean_movie_columns(chunk.iloc[todo])
+        counts["invalid"]+=dropped
+        valid=fingerprints[chunk.index.get_indexer(frame.index)].tolist()
+        for row,fingerprint in zip(movie_rows(frame),valid):
+            counts["changed" if row[KEY] in writer.existing or row[KEY] in writer.pending else "new"]+=1
+            writer.add(row,fingerprint)
+    writer.flush()
+
+    missing=[key for key in previous if key not in seen]
+    counts["missing"]=len(missing)
+    if missing and delete_missing:
+        db=writer.connect()
+        for i in range(0,len(missing),DEFAULT_BATCH_SIZE):
+            deleted,=db.execute_batch([(schema.DELETE_MOVIES,{"ids":missing[i:i+DEFAULT_BATCH_SIZE]})])
+            for record in deleted:
+                writer.unlinked["genres"].update(record["genres"])
+                writer.unlinked["persons"].update(record["persons"])
+        for key in missing:
+            del manifest.rows[key]
+        counts["deleted"]=len(missing)
+        dirty=True
+    if writer.unlinked["genres"] or writer.unlinked["persons"]:
+        writer.db.execute_batch([
+            (schema.DELETE_ORPHAN_GENRES,{"names":sorted(writer.unlinked["genres"])}),
+            (schema.DELETE_ORPHAN_PERSONS,{"names":sorted(writer.unlinked["persons"])}),
+        ])
+    if writer.db is not None:
+        # everything is committed; tell result caches the graph changed
+        bump_graph_version()
+        writer.db.close()
+    if dirty:
+        manifest.save()
+
+    elapsed=time.perf_counter()-start
+    kept="" if delete_missing or not missing else " (kept; delete_missing=True removes them)"
+    print(f"Incremental ingest in {elapsed:.2f}s: {counts['new']} new, {counts['changed']} changed, "
+          f"{counts['unchanged']} unchanged, {counts['invalid']} invalid, {counts['missing']} missing{kept}, "
+          f"{counts['deleted']} deleted")
+    return counts
@@ -1,46 +1,93 @@
-import pandas as pd
+import time
+
 from db.connection import Neo4jConnection
+from db.graph_version import bump_graph_version
 from graph import schema
-from models.movie import MovieModel
+from ingest.csv_stream import DEFAULT_CHUNK_SIZE,iter_movie_batches
+from ingest.fresh import ingest_movies_fresh
+from ingest.incremental import ingest_movies_incremental
+from ingest.parallel import ingest_movies_parallel
+
+
+
+
+def _write_movie(db:Neo4jConnection, movie:dict):
+    # Movie
+    db.execute(schema.CREATE_MOVIE,movie)
+
+    # Genres
+    for genre in movie["genre"]:
+        db.execute(schema.CREATE_GENRE_REL,
+        {"movie_id":movie["movie_id"],
+        "genre":genre})
 
+    # Director
+    db.execute(schema.CREATE_DIRECTOR_REL, {
+        "movie_id": movie["movie_id"],
+        "director": movie["director"]
+    })
 
+    # Actors
+    for actor in movie["cast"]:
+        db.execute(schema.CREATE_ACTOR_REL, {
+            "movie_id": movie["movie_id"],
+            "actor": actor
+        })
+
+
+def _write_movie_batch(db:Neo4jConnection, rows:list[dict]):
+    # One transaction per chunk; movies first so the relationship MATCHes find them
+    db.execute_batch([
+        (schema.UNWIND_MOVIES, {"rows": rows}),
+        (schema.UNWIND_GENRE_RELS, {"rows": rows}),
+        (schema.UNWIND_DIRECTOR_RELS, {"rows": rows}),
+        (schema.UNWIND_ACTOR_RELS, {"rows": rows}),
+    ])
 
 
-def ingest_movies(file_path:str):
+def ingest_movies(file_path:str, batch_size:int|None=None, workers:int|None=None,
+                  incremental:bool=False, delete_missing:bool=False, fresh:bool=False):
+    """Ingest movie.csv (streamed in chunks). With batch_size, write each chunk via UNWIND in one transaction.
+    With workers, fan chunks out to that many threads (ingest/parallel.py).
+    With fresh, CREATE nodes once and then relationships (ingest/fresh.py); refuses to run unless the
+    Movie/Genre/Person labels are empty.
+    With incremental, write only rows that are new or changed since the last incremental run
+    (ingest/incremental.py); delete_missing then also removes movies no longer in the CSV."""
+
+    if incremental:
+        ingest_movies_incremental(file_path,batch_size=batch_size,delete_missing=delete_missing)
+        return
 
-    df=pd.read_csv(file_path)
     db=Neo4jConnection()
 
     for constraint in schema.CREATE_CONSTRAINS:
         db.execute(constraint)
-    
-    for _,row in df.iterrows():
-        try:
-            movie=MovieModel(**row.to_dict())
-        except Exception as e:
-            print(f"Validation failed:{e}")
-            continue
-    
-        # Movie
-        db.execute(schema.CREATE_MOVIE,movie.model_dump())
-
-        # Genres
-        for genre in movie.genre:
-            db.execute(schema.CREATE_GENRE_REL,
-            {"movie_id":movie.movie_id,
-            "genre":genre})
-        
-        # Director
-        db.execute(schema.CREATE_DIRECTOR_REL, {
-            "movie_id": movie.movie_id,
-            "director": movie.director
-        })
 
-        # Actors
-        for actor in movie.cast:
-            db.execute(schema.CREATE_ACTOR_REL, {
-                "movie_id": movie.movie_id,
-                "actor": actor
-            })
+    start=time.perf_counter()
+    count=0
+    if fresh:
+        count=ingest_movies_fresh(db,file_path,chunk_size=batch_size or DEFAULT_CHUNK_SIZE)
+    elif workers:
+        count=ingest_movies_parallel(db,file_path,workers,chunk_size=batch_size or DEFAULT_CHUNK_SIZE)
+    elif batch_size:
+        for rows in iter_movie_batches(file_path,chunk_size=batch_size):
+            _write_movie_batch(db,rows)
+            count+=len(rows)
+    else:
+        for rows in iter_movie_batches(file_path,chunk_size=DEFAULT_CHUNK_SIZE):
+            for movie in rows:
+                _write_movie(db,movie)
+            count+=len(rows)
+    elapsed=time.perf_counter()-start
+    # everything is committed; tell result caches the graph changed
+    bump_graph_version()
+
+    if fresh:
+        mode=f"fresh, batch_size={batch_size or DEFAULT_CHUNK_SIZE}"
+    elif workers:
+        mode=f"workers={workers}"
+    else:
+        mode=f"batch_size={batch_size}" if batch_size else "per-row"
+    print(f"Ingested {count} movies in {elapsed:.2f}s ({count/max(elapsed,1e-9):.0f} rows/sec, {mode})")
 
-    db.close()
\ No newline at end of file
+    db.close()
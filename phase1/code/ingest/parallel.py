@@ -0,0 +1,50 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from db.connection import Neo4jConnection
+from graph import schema
+from ingest.csv_stream import DEFAULT_CHUNK_SIZE,iter_movie_batches
+from ingest.partitioned import write_names,write_partitioned,write_rounds
+
+# Parallel movie ingest.
+# 1. One streaming pass collects distinct Genre/Person names; they are MERGEd with UNWIND.
+# 2. Second pass, per chunk: Movie nodes are split across workers by movie_id; HAS_GENRE/DIRECTED/
+#    ACTED_IN pairs are written in rounds over a (movie, name) partition grid.
+# The scheduling lives in ingest/partitioned.py; this module only picks the queries and keys.
+
+
+def _collect_shared_names(file_path:str, chunk_size:int):
+    genres=set()
+    persons=set()
+    for rows in iter_movie_batches(file_path,chunk_size=chunk_size):
+        for row in rows:
+            genres.update(row["genre"])
+            persons.add(row["director"])
+            persons.update(row["cast"])
+    return genres,persons
+
+
+def _write_chunk(db:Neo4jConnection, pool:ThreadPoolExecutor, rows:list[dict], workers:int):
+    write_partitioned(db,pool,schema.UNWIND_MOVIES,rows,"movie_id",workers)
+    genre_pairs=[{"movie_id":r["movie_id"],"name":g} for r in rows for g in r["genre"]]
+    director_pairs=[{"movie_id":r["movie_id"],"name":r["director"]} for r in rows]
+    actor_pairs=[{"movie_id":r["movie_id"],"name":a} for r in rows for a in r["cast"]]
+    write_rounds(db,pool,schema.MATCH_GENRE_RELS,genre_pairs,"movie_id","name",workers)
+    write_rounds(db,pool,schema.MATCH_DIRECTOR_RELS,director_pairs,"movie_id","name",workers)
+    write_rounds(db,pool,schema.MATCH_ACTOR_RELS,actor_pairs,"movie_id","name",workers)
+
+
+def ingest_movies_parallel(db:Neo4jConnection, file_path:str, workers:int, chunk_size:int=DEFAULT_CHUNK_SIZE):
+    """Write movie.csv with a pool of workers sharing db's driver. Returns rows written."""
+    start=time.perf_counter()
+    genres,persons=_collect_shared_names(file_path,chunk_size)
+    write_names(db,schema.UNWIND_GENRES,genres)
+    write_names(db,schema.UNWIND_PERSONS,persons)
+    print(f"Shared nodes: {len(genres)} genres, {len(persons)} persons in {time.perf_counter()-start:.2f}s")
+
+    count=0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for rows in iter_movie_batches(file_path,chunk_size=chunk_size):
+            _write_chunk(db,pool,rows,workers)
+            count+=len(rows)
+    return count
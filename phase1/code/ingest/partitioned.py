@@ -0,0 +1,53 @@
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from db.connection import Neo4jConnection
+
+# Lock-partitioned parallel writes, shared by the parallel ingest (ingest/parallel.py).
+# - write_names: MERGE the distinct shared names (Genre/Person) in sorted slices.
+# - write_partitioned: rows split across workers by the hash of one key, so no two batches share a node.
+# - write_rounds: relationship pairs placed in a workers x workers grid by (hash(start), hash(end)).
+#   In round r worker i writes cell (i, (i+r)%workers): no two batches of a round touch the same
+#   node on either side, so workers never wait on each other's locks.
+# Each batch runs in a managed write transaction (Neo4jConnection.execute_batch), which the driver
+# retries on transient errors such as DeadlockDetected; a batch that still fails raises here.
+# phase2/code/ingest and phase2.1/code/langchain/ingest have the same logic: change them together.
+
+NAME_BATCH_SIZE=10_000
+
+
+def bucket(key:str, workers:int):
+    return zlib.crc32(key.encode("utf-8"))%workers
+
+
+def _wait(futures):
+    for future in futures:
+        future.result()
+
+
+def write_names(db:Neo4jConnection, query:str, names):
+    ordered=sorted(names)
+    for i in range(0,len(ordered),NAME_BATCH_SIZE):
+        db.execute_batch([(query,{"names":ordered[i:i+NAME_BATCH_SIZE]})])
+
+
+def write_partitioned(db:Neo4jConnection, pool:ThreadPoolExecutor, query:str, rows:list[dict], key:str, workers:int):
+    partitions=[[] for _ in range(workers)]
+    for row in rows:
+        partitions[bucket(row[key],workers)].append(row)
+    _wait([pool.submit(db.execute_batch,[(query,{"rows":part})]) for part in partitions if part])
+
+
+def grid(pairs:list[dict], start:str, end:str, workers:int):
+    # cells keyed by (partition of pair[start], partition of pair[end])
+    cells={}
+    for pair in pairs:
+        cells.setdefault((bucket(pair[start],workers),bucket(pair[end],workers)),[]).append(pair)
+    return cells
+
+
+def write_rounds(db:Neo4jConnection, pool:ThreadPoolExecutor, query:str, pairs:list[dict], start:str, end:str, workers:int):
+    cells=grid(pairs,start,end,workers)
+    for r in range(workers):
+        round_cells=[cells[(i,(i+r)%workers)] for i in range(workers) if (i,(i+r)%workers) in cells]
+        _wait([pool.submit(db.execute_batch,[(query,{"pairs":cell})]) for cell in round_cells])
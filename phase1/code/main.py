@@ -1,4 +1,16 @@
 from ingest.load_data import ingest_movies
 
+# Rows per UNWIND transaction; set to None for the original one-statement-per-call path
+BATCH_SIZE = 500
+# Parallel writers (ingest/parallel.py); None = serial writes on one connection
+WORKERS = None
+# Write only rows that are new or changed since the last incremental run (ingest/incremental.py)
+INCREMENTAL = False
+# With INCREMENTAL: also delete movies that are no longer in the CSV
+DELETE_MISSING = False
+# First load into an empty graph: CREATE each node once, then relationships (ingest/fresh.py)
+FRESH = False
+
 if __name__=="__main__":
-    ingest_movies(r"C:\WORK_DIR\Projects\Knowledge_graph\phase1\data\movie.csv")
\ No newline at end of file
+    ingest_movies(r"C:\WORK_DIR\Projects\Knowledge_graph\phase1\data\movie.csv", batch_size=BATCH_SIZE, workers=WORKERS,
+                  incremental=INCREMENTAL, delete_missing=DELETE_MISSING, fresh=FRESH)
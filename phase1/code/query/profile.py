@@ -0,0 +1,166 @@
+import argparse
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from core.config import settings
+from db.connection import Neo4jConnection
+from query.registry import QUERIES
+
+# PROFILE capture for the named queries in query/registry.py.
+# `run` profiles every query through Neo4jConnection.profile() and saves one JSON file per run
+# (operator tree, db hits, rows, page cache hits/misses per operator plus totals).
+# `diff` compares two saved runs, e.g. before/after adding an index, and exits with status 1 when a
+# query got slower (total db hits up by more than --threshold), so it can gate CI. Plan changes are reported too.
+#
+# Usage (from phase1/code):
+#   python -m query.profile run before
+#   ... add an index / rewrite a query ...
+#   python -m query.profile run after
+#   python -m query.profile diff before after
+
+
+def profile_dir():
+    path=Path(settings.profile_dir)
+    if path.is_absolute():
+        return path
+    return Path(__file__).resolve().parent.parent/path
+
+
+def operator_tree(plan:dict):
+    # driver profile dict -> compact, JSON-friendly operator tree
+    args=plan.get("args",{})
+    return {
+        "operator":plan.get("operatorType"),
+        "details":args.get("Details"),
+        "identifiers":plan.get("identifiers",[]),
+        "rows":plan.get("rows",0),
+        "db_hits":plan.get("dbHits",0),
+        "page_cache_hits":plan.get("pageCacheHits",0),
+        "page_cache_misses":plan.get("pageCacheMisses",0),
+        "estimated_rows":args.get("EstimatedRows"),
+        "children":[operator_tree(child) for child in plan.get("children",[])],
+    }
+
+
+def _walk(tree:dict):
+    yield tree
+    for child in tree["children"]:
+        yield from _walk(child)
+
+
+def profile_query(db:Neo4jConnection, cypher:str, parameters:dict|None=None, warmup:int=1):
+    # warm-up runs first, so page cache misses from a cold start do not dominate the numbers
+    for _ in range(warmup):
+        db.execute_query(cypher,parameters)
+    tree=operator_tree(db.profile(cypher,parameters))
+    operators=list(_walk(tree))
+    return {
+        "query":" ".join(cypher.split()),
+        "parameters":parameters or {},
+        "db_hits":sum(op["db_hits"] for op in operators),
+        "rows":tree["rows"],
+        "page_cache_hits":sum(op["page_cache_hits"] for op in operators),
+        "page_cache_misses":sum(op["page_cache_misses"] for op in operators),
+        "operators":[op["operator"] for op in operators],
+        "plan":tree,
+    }
+
+
+def run_profiles(label:str, names:list[str]|None=None, warmup:int=1):
+    # profile the registry (or just `names`) and save it as <profile_dir>/<label>.json
+    db=Neo4jConnection()
+    results={}
+    for name in names or QUERIES:
+        cypher,parameters=QUERIES[name]
+        results[name]=profile_query(db,cypher,parameters,warmup)
+    run={
+        "label":label,
+        "timestamp":datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "database":settings.neo4j_db,
+        "queries":results,
+    }
+    path=profile_dir()/f"{label}.json"
+    path.parent.mkdir(parents=True,exist_ok=True)
+    path.write_text(json.dumps(run,indent=2),encoding="utf-8")
+    db.close()
+    return run,path
+
+
+def load_run(label_or_path:str):
+    path=Path(label_or_path)
+    if not path.suffix:
+        path=profile_dir()/f"{label_or_path}.json"
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def diff_runs(before:dict, after:dict, threshold:float=0.10):
+    # one entry per query present in both runs; regression = total db hits up by more than threshold
+    rows=[]
+    for name,old in before["queries"].items():
+        new=after["queries"].get(name)
+        if new is None:
+            continue
+        change=(new["db_hits"]-old["db_hits"])/max(old["db_hits"],1)
+        plan_changed=old["operators"]!=new["operators"]
+        rows.append({
+            "name":name,
+            "db_hits":(old["db_hits"],new["db_hits"]),
+            "db_hits_change":change,
+            "rows":(old["rows"],new["rows"]),
+            "page_cache_hits":(old["page_cache_hits"],new["page_cache_hits"]),
+            "plan_changed":plan_changed,
+            "operators":(old["operators"],new["operators"]),
+            "regression":change>threshold,
+        })
+    return rows
+
+
+def _print_run(run:dict):
+    print(f"{'query':<22}{'db hits':>12}{'rows':>10}{'cache hits':>12}{'misses':>8}  plan")
+    for name,result in run["queries"].items():
+        print(f"{name:<22}{result['db_hits']:>12}{result['rows']:>10}"
+              f"{result['page_cache_hits']:>12}{result['page_cache_misses']:>8}  "
+              f"{' <- '.join(reversed(result['operators']))}")
+
+
+def _print_diff(rows:list[dict]):
+    print(f"{'query':<22}{'db hits before':>16}{'after':>12}{'change':>9}{'rows':>16}  note")
+    for row in rows:
+        note=[]
+        if row["plan_changed"]:
+            note.append("plan changed: "+" <- ".join(reversed(row["operators"][1])))
+        if row["regression"]:
+            note.insert(0,"REGRESSION")
+        print(f"{row['name']:<22}{row['db_hits'][0]:>16}{row['db_hits'][1]:>12}"
+              f"{row['db_hits_change']:>+9.0%}{'%d -> %d' % row['rows']:>16}  {'; '.join(note)}")
+
+
+def main():
+    parser=argparse.ArgumentParser(description="PROFILE the registered queries and compare runs.")
+    commands=parser.add_subparsers(dest="command",required=True)
+    run_cmd=commands.add_parser("run",help="Profile the registered queries and save the run")
+    run_cmd.add_argument("label",help="Name of the run, e.g. before / after-genre-index")
+    run_cmd.add_argument("--only",nargs="+",choices=list(QUERIES),help="Profile just these queries")
+    run_cmd.add_argument("--warmup",type=int,default=1,help="Un-profiled runs before PROFILE")
+    diff_cmd=commands.add_parser("diff",help="Compare two saved runs")
+    diff_cmd.add_argument("before")
+    diff_cmd.add_argument("after")
+    diff_cmd.add_argument("--threshold",type=float,default=0.10,
+                          help="Relative db hits increase counted as a regression")
+    args=parser.parse_args()
+
+    if args.command=="run":
+        run,path=run_profiles(args.label,args.only,args.warmup)
+        _print_run(run)
+        print(f"Saved to {path}")
+        return
+    rows=diff_runs(load_run(args.before),load_run(args.after),args.threshold)
+    _print_diff(rows)
+    if any(row["regression"] for row in rows):
+        sys.exit(1)
+
+
+if __name__=="__main__":
+    main()
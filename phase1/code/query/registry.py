@@ -0,0 +1,53 @@
+# Named canonical queries profiled by query/profile.py (the Phase 1 queries from phase3/plan.md).
+# name -> (cypher, parameters). Keep names stable: saved runs are diffed by name.
+
+QUERIES={
+    "all_movies":(
+        """
+        MATCH (m:Movie) RETURN m.name, m.year
+        """,
+        {},
+    ),
+    "movies_by_genre":(
+        """
+        MATCH (m:Movie)-[:HAS_GENRE]->(g:Genre {name: $genre})
+        RETURN m.name, m.year
+        ORDER BY m.year DESC
+        """,
+        {"genre":"Action"},
+    ),
+    "movies_by_director":(
+        """
+        MATCH (p:Person {name: $director})-[:DIRECTED]->(m:Movie)
+        RETURN m.name, m.year
+        """,
+        {"director":"Atlee"},
+    ),
+    "co_actors":(
+        """
+        MATCH (p1:Person)-[:ACTED_IN]->(m:Movie)<-[:ACTED_IN]-(p2:Person)
+        WHERE p1.name < p2.name
+        RETURN p1.name, p2.name, m.name
+        LIMIT 20
+        """,
+        {},
+    ),
+    "movies_per_genre":(
+        """
+        MATCH (m:Movie)-[:HAS_GENRE]->(g:Genre)
+        RETURN g.name, count(m) AS movie_count
+        ORDER BY movie_count DESC
+        """,
+        {},
+    ),
+    "prolific_actors":(
+        """
+        MATCH (p:Person)-[:ACTED_IN]->(m:Movie)
+        WITH p, count(m) AS movie_count
+        WHERE movie_count > $min_movies
+        RETURN p.name, movie_count
+        ORDER BY movie_count DESC
+        """,
+        {"min_movies":5},
+    ),
+}
@@ -10,6 +10,16 @@ class Settings(BaseSettings):
     neo4j_password: str
     neo4j_db: str
 
+    # Shared driver pool (db/connection.py get_driver): max connections, seconds, seconds
+    neo4j_max_pool_size: int = 50
+    neo4j_max_connection_lifetime: int = 3600
+    neo4j_connection_acquisition_timeout: float = 60.0
+
+    # Counter file bumped after ingest commits (db/graph_version.py); relative to this folder or absolute
+    graph_version_file: str = ".cache/graph_version"
+    # Row fingerprints of the last incremental ingest (ingest/manifest.py); relative to this folder or absolute
+    ingest_manifest_file: str = ".cache/movie_manifest.npz"
+
     llm_provider: str = "groq"
     groq_api_key: Optional[str] = None
     groq_model: Optional[str] = None
@@ -3,39 +3,97 @@ Single place for all Neo4j connection logic (credentials from core.config).
 
 - Ingest and direct Cypher: use get_neo4j_connection() or Neo4jConnection.
 - LangChain chains (NL→Cypher): use get_graph() → Neo4jGraph.
+
+All Neo4jConnection instances share one lazily created driver (get_driver), so the connection
+pool, TCP and auth handshakes are paid once per process, not once per connection.
 """
-from typing import Optional
+import atexit
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
 from langchain_neo4j import Neo4jGraph
-from neo4j import GraphDatabase
+from neo4j import Driver, GraphDatabase, Record, Session, Transaction
 
 from core.config import settings
 
+# Process-wide driver; created on first use, closed at exit (or via close_driver()).
+_driver: Optional[Driver] = None
+_driver_lock = threading.Lock()
+
+
+def get_driver() -> Driver:
+    """Return the shared driver, creating it with the pool settings from core.config."""
+    global _driver
+    if _driver is None:
+        with _driver_lock:
+            if _driver is None:
+                _driver = GraphDatabase.driver(
+                    settings.neo4j_uri,
+                    auth=(settings.neo4j_user, settings.neo4j_password),
+                    max_connection_pool_size=settings.neo4j_max_pool_size,
+                    max_connection_lifetime=settings.neo4j_max_connection_lifetime,
+                    connection_acquisition_timeout=settings.neo4j_connection_acquisition_timeout,
+                )
+    return _driver
+
+
+def close_driver() -> None:
+    """Close the shared driver (e.g. on shutdown). Safe to call more than once."""
+    global _driver
+    with _driver_lock:
+        if _driver is not None:
+            _driver.close()
+            _driver = None
+
+
+atexit.register(close_driver)
+
 
 class Neo4jConnection:
-    """Raw Neo4j driver wrapper. Use for ingest (CSV → Cypher MERGE). Call .close() when done."""
+    """Thin wrapper over the shared driver. Use for ingest (CSV → Cypher MERGE) and direct Cypher."""
 
     def __init__(self) -> None:
-        self.driver = GraphDatabase.driver(
-            settings.neo4j_uri,
-            auth=(settings.neo4j_user, settings.neo4j_password),
-        )
+        self.driver = get_driver()
 
     def close(self) -> None:
-        self.driver.close()
+        """Kept for callers' try/finally; the shared driver stays open (see close_driver)."""
 
-    def execute(self, query: str, parameters: Optional[dict] = None) -> None:
+    @contextmanager
+    def session(self) -> Iterator[Session]:
+        """Session on NEO4J_DB; run several statements on it before it returns to the pool."""
         with self.driver.session(database=settings.neo4j_db) as session:
+            yield session
+
+    @contextmanager
+    def transaction(self) -> Iterator[Transaction]:
+        """Explicit transaction: commits when the block exits normally, rolls back on error."""
+        with self.session() as session:
+            with session.begin_transaction() as tx:
+                yield tx
+
+    def execute(self, query: str, parameters: Optional[dict] = None) -> None:
+        with self.session() as session:
             session.run(query, parameters or {})
 
+    def execute_batch(self, statements: list[tuple[str, dict]]) -> list[list[Record]]:
+        """Run several (query, parameters) pairs in one explicit write transaction.
+        Returns each statement's records."""
+
+        def _run_all(tx) -> list[list[Record]]:
+            return [list(tx.run(query, parameters or {})) for query, parameters in statements]
+
+        with self.session() as session:
+            return session.execute_write(_run_all)
+
     def execute_query(self, query: str, parameters: Optional[dict] = None):
-        with self.driver.session(database=settings.neo4j_db) as session:
+        with self.session() as session:
             result = session.run(query, parameters or {})
             return list(result)
 
 
 def get_neo4j_connection() -> Neo4jConnection:
-    """Return a new Neo4j connection for ingest or direct Cypher. Caller must call .close()."""
+    """Return a Neo4j connection on the shared driver for ingest or direct Cypher."""
     return Neo4jConnection()
 
 
@@ -43,8 +101,13 @@ def get_neo4j_connection() -> Neo4jConnection:
 _graph: Optional[Neo4jGraph] = None
 
 
-def get_graph() -> Neo4jGraph:
-    """Return a shared Neo4jGraph for LangChain chains (e.g. NL→Cypher). Same config as raw driver."""
+def get_graph(schema_notes: Optional[dict[str, str]] = None) -> Neo4jGraph:
+    """Return a shared Neo4jGraph for LangChain chains (e.g. NL→Cypher). Same config as raw driver.
+
+    schema_notes maps a relationship type to text appended to the schema the chain puts in its
+    prompt when the graph has relationships of that type (e.g. notes on precomputed analytics).
+    The caller supplies them, so this module does not depend on graph.schema.
+    """
     global _graph
     if _graph is None:
         _graph = Neo4jGraph(
@@ -53,6 +116,12 @@ def get_graph() -> Neo4jGraph:
             password=settings.neo4j_password,
             database=settings.neo4j_db,
         )
+    if schema_notes:
+        relationships = _graph.get_structured_schema.get("relationships", [])
+        present = {rel.get("type") for rel in relationships}
+        for rel_type, notes in schema_notes.items():
+            if rel_type in present and notes not in _graph.schema:
+                _graph.schema = f"{_graph.schema}\n{notes}"
     return _graph
 
 
@@ -0,0 +1,33 @@
+"""Graph version counter file, bumped after ingest commits.
+
+Readers that cache query results (e.g. phase2's db/result_cache.py) drop their cache when the
+number changes. Point GRAPH_VERSION_FILE at the same file in every project that shares the database.
+"""
+import threading
+from pathlib import Path
+
+from core.config import settings
+
+_lock = threading.Lock()
+
+
+def _version_path() -> Path:
+    path = Path(settings.graph_version_file)
+    if path.is_absolute():
+        return path
+    return Path(__file__).resolve().parent.parent / path
+
+
+def bump_graph_version() -> int:
+    """Increment the version after a write path commits. Returns the new version."""
+    path = _version_path()
+    with _lock:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            version = int(path.read_text(encoding="utf-8").strip() or 0) + 1
+        except (OSError, ValueError):
+            version = 1
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(str(version), encoding="utf-8")
+        tmp.replace(path)
+    return version
@@ -46,4 +46,183 @@ MERGE (p:Person {name: $actor})
 WITH p
 MATCH (m:Movie {movie_id: $movie_id})
 MERGE (p)-[:ACTED_IN]->(m)
-"""
\ No newline at end of file
+"""
+
+# ----- UNWIND templates (batched ingest; $rows is a list of MovieModel dicts) -----
+UNWIND_MOVIES = """
+UNWIND $rows AS row
+MERGE (m:Movie {movie_id: row.movie_id})
+SET m.name = row.movie_name,
+m.year = row.year,
+m.overview = row.overview
+"""
+
+UNWIND_GENRE_RELS = """
+UNWIND $rows AS row
+UNWIND row.genre AS genre
+MERGE (g:Genre {name: genre})
+WITH g, row
+MATCH (m:Movie {movie_id: row.movie_id})
+MERGE (m)-[:HAS_GENRE]->(g)
+"""
+
+UNWIND_DIRECTOR_RELS = """
+UNWIND $rows AS row
+MERGE (p:Person {name: row.director})
+WITH p, row
+MATCH (m:Movie {movie_id: row.movie_id})
+MERGE (p)-[:DIRECTED]->(m)
+"""
+
+UNWIND_ACTOR_RELS = """
+UNWIND $rows AS row
+UNWIND row.cast AS actor
+MERGE (p:Person {name: actor})
+WITH p, row
+MATCH (m:Movie {movie_id: row.movie_id})
+MERGE (p)-[:ACTED_IN]->(m)
+"""
+
+# ----- Parallel ingest templates (shared nodes first, then MATCH-only relationship batches) -----
+UNWIND_GENRES = """
+UNWIND $names AS name
+MERGE (:Genre {name: name})
+"""
+
+UNWIND_PERSONS = """
+UNWIND $names AS name
+MERGE (:Person {name: name})
+"""
+
+# $pairs: list of {movie_id, name}; Genre/Person nodes already exist.
+MATCH_GENRE_RELS = """
+UNWIND $pairs AS pair
+MATCH (m:Movie {movie_id: pair.movie_id})
+MATCH (g:Genre {name: pair.name})
+MERGE (m)-[:HAS_GENRE]->(g)
+"""
+
+MATCH_DIRECTOR_RELS = """
+UNWIND $pairs AS pair
+MATCH (m:Movie {movie_id: pair.movie_id})
+MATCH (p:Person {name: pair.name})
+MERGE (p)-[:DIRECTED]->(m)
+"""
+
+MATCH_ACTOR_RELS = """
+UNWIND $pairs AS pair
+MATCH (m:Movie {movie_id: pair.movie_id})
+MATCH (p:Person {name: pair.name})
+MERGE (p)-[:ACTED_IN]->(m)
+"""
+
+# ----- Incremental ingest (ingest/incremental.py) -----
+# Before a changed movie is re-written: drop the relationships its new row no longer has ($rows as above).
+# Each returns the names it unlinked, for the orphan check below.
+PRUNE_GENRE_RELS = """
+UNWIND $rows AS row
+MATCH (m:Movie {movie_id: row.movie_id})-[r:HAS_GENRE]->(g:Genre)
+WHERE NOT g.name IN row.genre
+DELETE r
+RETURN DISTINCT g.name AS name
+"""
+
+PRUNE_DIRECTOR_RELS = """
+UNWIND $rows AS row
+MATCH (p:Person)-[r:DIRECTED]->(m:Movie {movie_id: row.movie_id})
+WHERE p.name <> row.director
+DELETE r
+RETURN DISTINCT p.name AS name
+"""
+
+PRUNE_ACTOR_RELS = """
+UNWIND $rows AS row
+MATCH (p:Person)-[r:ACTED_IN]->(m:Movie {movie_id: row.movie_id})
+WHERE NOT p.name IN row.cast
+DELETE r
+RETURN DISTINCT p.name AS name
+"""
+
+# $ids: movie_ids no longer in the CSV. Returns the genres/persons they were linked to.
+DELETE_MOVIES = """
+UNWIND $ids AS id
+MATCH (m:Movie {movie_id: id})
+WITH m, [(m)-[:HAS_GENRE]->(g:Genre) | g.name] AS genres, [(p:Person)-->(m) | p.name] AS persons
+DETACH DELETE m
+RETURN genres, persons
+"""
+
+# $names: genres/persons unlinked above; deleted if no movie links to them any more. Only these
+# are checked, so the cost follows the change, not the label size. COLLABORATED_WITH (written back
+# by the phase1 analytics) does not keep a person alive: it is derived from ACTED_IN.
+DELETE_ORPHAN_GENRES = """
+UNWIND $names AS name
+MATCH (g:Genre {name: name})
+WHERE NOT EXISTS { (g)--() }
+DELETE g
+"""
+
+DELETE_ORPHAN_PERSONS = """
+UNWIND $names AS name
+MATCH (p:Person {name: name})
+WHERE NOT EXISTS { (p)-[:DIRECTED|ACTED_IN]->() }
+DETACH DELETE p
+"""
+
+# ----- Fresh-database load (ingest/fresh.py) -----
+# Only while Movie/Genre/Person are empty: every node is CREATEd once, and relationships are
+# CREATEd between nodes found through the uniqueness constraints.
+FRESH_LABELS_IN_USE = """
+RETURN EXISTS { MATCH (:Movie) } AS Movie,
+EXISTS { MATCH (:Genre) } AS Genre,
+EXISTS { MATCH (:Person) } AS Person
+"""
+
+CREATE_MOVIES = """
+UNWIND $rows AS row
+CREATE (:Movie {movie_id: row.movie_id, name: row.movie_name, year: row.year, overview: row.overview})
+"""
+
+CREATE_GENRES = """
+UNWIND $names AS name
+CREATE (:Genre {name: name})
+"""
+
+CREATE_PERSONS = """
+UNWIND $names AS name
+CREATE (:Person {name: name})
+"""
+
+CREATE_GENRE_RELS = """
+UNWIND $rows AS row
+MATCH (m:Movie {movie_id: row.movie_id})
+UNWIND row.genre AS name
+MATCH (g:Genre {name: name})
+CREATE (m)-[:HAS_GENRE]->(g)
+"""
+
+CREATE_DIRECTOR_RELS = """
+UNWIND $rows AS row
+MATCH (m:Movie {movie_id: row.movie_id})
+MATCH (p:Person {name: row.director})
+CREATE (p)-[:DIRECTED]->(m)
+"""
+
+CREATE_ACTOR_RELS = """
+UNWIND $rows AS row
+MATCH (m:Movie {movie_id: row.movie_id})
+UNWIND row.cast AS name
+MATCH (p:Person {name: name})
+CREATE (p)-[:ACTED_IN]->(m)
+"""
+
+# ----- Precomputed analytics (batch job: phase1/code/graph/analytics.py) -----
+# Passed by nl2cypher/chain.py to db.connection.get_graph(), which appends it to the NL→Cypher prompt
+# schema when the database has COLLABORATED_WITH relationships, so the LLM reads these values instead
+# of aggregating ACTED_IN. The generation property on COLLABORATED_WITH is write-back bookkeeping.
+PRECOMPUTED_SCHEMA_NOTES = """Precomputed analytics (prefer these over aggregating ACTED_IN/DIRECTED at query time):
+- (:Person)-[:COLLABORATED_WITH {weight: INTEGER}]-(:Person): two people who acted together; weight is
+  the number of movies they share. Stored once per pair, so match it without direction:
+  MATCH (a:Person {name: $name})-[c:COLLABORATED_WITH]-(b:Person) RETURN b.name, c.weight ORDER BY c.weight DESC
+- Person.pagerank (FLOAT): influence in the movie credits graph; ORDER BY p.pagerank DESC for "most influential".
+- Person.degree_centrality (FLOAT): share of all people this person has acted with; "best connected" actors."""
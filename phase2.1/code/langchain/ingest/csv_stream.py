@@ -0,0 +1,92 @@
+"""Stream movie CSV in chunks and clean/validate each chunk with vectorized pandas.
+
+Same rules as MovieModel's validators (genre/cast comma split, year digit extraction, NaN
+handling), applied per column instead of per row. Batches are lists of dicts shaped like
+MovieModel.model_dump(), ready for the UNWIND templates; no per-row pydantic or iterrows.
+"""
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+from models.movie import MovieModel
+
+# Columns that must be present (non-null) for a row to be valid.
+REQUIRED_TEXT_COLUMNS = ["movie_id", "movie_name", "overview", "director", "genre", "cast"]
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def split_list_column(values: pd.Series) -> pd.Series:
+    """Vectorized MovieModel.split_values: 'a, b ,c' -> ['a', 'b', 'c']."""
+    return values.str.strip().str.split(r"\s*,\s*", regex=True)
+
+
+def coerce_year_column(values: pd.Series) -> pd.Series:
+    """Vectorized MovieModel.coerce_year: numbers as-is, strings by their digits, else None."""
+    numeric = pd.to_numeric(values, errors="coerce")
+    digits = values.astype("string").str.replace(r"\D", "", regex=True)
+    from_digits = pd.to_numeric(digits.where(digits.str.len() > 0), errors="coerce")
+    years = np.trunc(numeric.fillna(from_digits)).astype("Int64")
+    return years.astype(object).where(years.notna(), None)
+
+
+def clean_movie_columns(df: pd.DataFrame) -> tuple[pd.DataFrame, int]:
+    """Clean one chunk column-wise. Returns (valid rows as a DataFrame of MovieModel fields, keeping
+    the chunk's index, and the number of rows dropped)."""
+    valid = df[REQUIRED_TEXT_COLUMNS].notna().all(axis=1)
+    df = df[valid]
+    if "year" in df.columns:
+        years = coerce_year_column(df["year"])
+    else:
+        years = pd.Series([None] * len(df), index=df.index, dtype=object)
+    columns = {
+        "movie_id": df["movie_id"],
+        "movie_name": df["movie_name"],
+        "year": years,
+        "overview": df["overview"],
+        "director": df["director"],
+        "genre": split_list_column(df["genre"]),
+        "cast": split_list_column(df["cast"]),
+    }
+    frame = pd.DataFrame({field: columns[field] for field in MovieModel.model_fields})
+    return frame, int((~valid).sum())
+
+
+def movie_rows(frame: pd.DataFrame) -> list[dict]:
+    """MovieModel dicts of a clean_movie_columns frame, in frame order."""
+    fields = list(MovieModel.model_fields)
+    return [
+        dict(zip(fields, values))
+        for values in zip(*(frame[field].tolist() for field in fields))
+    ]
+
+
+def clean_movie_frame(df: pd.DataFrame) -> tuple[list[dict], int]:
+    """Clean one chunk. Returns (valid rows as MovieModel dicts, number of rows dropped)."""
+    frame, dropped = clean_movie_columns(df)
+    return movie_rows(frame), dropped
+
+
+def read_movie_chunks(
+    file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, text_only: bool = False
+) -> Iterator[pd.DataFrame]:
+    """Raw CSV chunks for clean_movie_frame. text_only also reads year as text, so row
+    fingerprints (ingest/manifest.py) do not depend on the dtype pandas infers per chunk."""
+    return pd.read_csv(
+        file_path,
+        chunksize=chunk_size,
+        dtype=str if text_only else {column: str for column in REQUIRED_TEXT_COLUMNS},
+    )
+
+
+def iter_movie_batches(
+    file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[list[dict]]:
+    """Yield validated batches (MovieModel dicts) of at most chunk_size rows; memory stays bounded."""
+    for chunk in read_movie_chunks(file_path, chunk_size):
+        rows, dropped = clean_movie_frame(chunk)
+        if dropped:
+            print(f"Validation failed: {dropped} rows missing required fields")
+        if rows:
+            yield rows
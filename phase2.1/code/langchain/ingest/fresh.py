@@ -0,0 +1,127 @@
+"""Fresh-database movie ingest: CREATE instead of MERGE, for a first load into empty labels.
+
+The MERGE templates merge a Person once per cast occurrence and check for an existing edge before
+every relationship. This loader does neither:
+
+1. Nodes. One pass over the CSV CREATEs each Movie and interns the distinct Genre/Person names in
+   memory; every name is then CREATEd once, in UNWIND batches.
+2. Relationships. A second pass CREATEs HAS_GENRE / DIRECTED / ACTED_IN per chunk, finding both
+   ends through the uniqueness constraints in graph/schema.py, with no existence checks.
+
+There is nothing to merge into, so a repeated movie_id keeps its first row (the unique constraint
+would reject the rest) and a name listed twice in one row gets one relationship. The loader
+refuses to start unless Movie, Genre and Person are all empty.
+"""
+import time
+from typing import Iterator
+
+from db.connection import Neo4jConnection
+from graph import schema
+from ingest.csv_stream import (
+    DEFAULT_CHUNK_SIZE,
+    clean_movie_frame,
+    iter_movie_batches,
+    read_movie_chunks,
+)
+
+# Genre/Person names are CREATEd in slices of this size.
+NAME_BATCH_SIZE = 10_000
+
+
+def check_labels_empty(db: Neo4jConnection) -> None:
+    """Raise RuntimeError if any Movie, Genre or Person node exists."""
+    in_use = [
+        label
+        for record in db.execute_query(schema.FRESH_LABELS_IN_USE)
+        for label, used in record.items()
+        if used
+    ]
+    if in_use:
+        raise RuntimeError(
+            f"Fresh ingest needs empty labels, but nodes exist for: {', '.join(in_use)}. "
+            "Use the MERGE ingest (or incremental=True) for an existing graph."
+        )
+
+
+def unique_rows(rows: list[dict], seen: set[str]) -> list[dict]:
+    """First row per movie_id (seen is shared across chunks), with genre/cast de-duplicated."""
+    kept = []
+    for row in rows:
+        if row["movie_id"] in seen:
+            continue
+        seen.add(row["movie_id"])
+        kept.append(
+            {
+                **row,
+                "genre": list(dict.fromkeys(row["genre"])),
+                "cast": list(dict.fromkeys(row["cast"])),
+            }
+        )
+    return kept
+
+
+def write_movies(db: Neo4jConnection, rows: list[dict], genres: dict, persons: dict) -> None:
+    """Phase 1, per chunk: CREATE the movies and intern their names (dicts keep first-seen order)."""
+    db.execute_batch([(schema.CREATE_MOVIES, {"rows": rows})])
+    for row in rows:
+        genres.update(dict.fromkeys(row["genre"]))
+        persons[row["director"]] = None
+        persons.update(dict.fromkeys(row["cast"]))
+
+
+def write_names(db: Neo4jConnection, genres: dict, persons: dict) -> None:
+    """Phase 1, once: CREATE every distinct Genre and Person."""
+    for query, names in ((schema.CREATE_GENRES, list(genres)), (schema.CREATE_PERSONS, list(persons))):
+        for i in range(0, len(names), NAME_BATCH_SIZE):
+            db.execute_batch([(query, {"names": names[i : i + NAME_BATCH_SIZE]})])
+
+
+def write_relationships(db: Neo4jConnection, rows: list[dict]) -> None:
+    """Phase 2, per chunk: all relationships of the chunk in one transaction."""
+    db.execute_batch(
+        [
+            (schema.CREATE_GENRE_RELS, {"rows": rows}),
+            (schema.CREATE_DIRECTOR_RELS, {"rows": rows}),
+            (schema.CREATE_ACTOR_RELS, {"rows": rows}),
+        ]
+    )
+
+
+def _quiet_batches(file_path: str, chunk_size: int) -> Iterator[list[dict]]:
+    """Second pass: the rows of iter_movie_batches without repeating its validation messages."""
+    for chunk in read_movie_chunks(file_path, chunk_size):
+        rows, _ = clean_movie_frame(chunk)
+        if rows:
+            yield rows
+
+
+def ingest_movies_fresh(
+    db: Neo4jConnection, file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """Two-phase CREATE load of the movie CSV into an empty graph (constraints must exist).
+
+    Returns the number of movies written.
+    """
+    check_labels_empty(db)
+    start = time.perf_counter()
+    genres: dict[str, None] = {}
+    persons: dict[str, None] = {}
+    count = 0
+    seen: set[str] = set()
+    for rows in iter_movie_batches(file_path, chunk_size=chunk_size):
+        rows = unique_rows(rows, seen)
+        if rows:
+            write_movies(db, rows, genres, persons)
+            count += len(rows)
+    write_names(db, genres, persons)
+    print(
+        f"Nodes: {count} movies, {len(genres)} genres, {len(persons)} persons "
+        f"in {time.perf_counter() - start:.2f}s"
+    )
+
+    seen = set()
+    for rows in _quiet_batches(file_path, chunk_size):
+        rows = unique_rows(rows, seen)
+        if rows:
+            write_relationships(db, rows)
+    return count
@@ -0,0 +1,177 @@
+"""Incremental movie ingest: write only rows that are new or changed since the last run.
+
+1. Every CSV row is fingerprinted from its text (vectorized) and compared with the manifest
+   (ingest/manifest.py, keyed by movie_id). Unchanged rows are skipped before cleaning.
+2. New and changed rows are cleaned and written in UNWIND batches. For a changed movie, the
+   relationships its new row no longer lists (a dropped cast member, a new director) are deleted
+   in the same transaction. A row's fingerprint is recorded only once its batch is written; an
+   invalid row keeps its previous entry (the graph still holds that version), so it is retried.
+3. Movies that left the CSV are reported, or DETACH DELETEd with delete_missing. Genres and
+   persons unlinked by steps 2 and 3 are then removed if no movie links to them any more.
+
+An unchanged file never opens a connection. The manifest describes what this module wrote:
+delete it if the database is reset or edited by other means, and the next run rewrites every row.
+"""
+import time
+from typing import Optional
+
+from db.connection import Neo4jConnection, get_neo4j_connection
+from db.graph_version import bump_graph_version
+from graph import schema
+from ingest.csv_stream import (
+    DEFAULT_CHUNK_SIZE,
+    REQUIRED_TEXT_COLUMNS,
+    clean_movie_columns,
+    movie_rows,
+    read_movie_chunks,
+)
+from ingest.manifest import RowManifest, row_fingerprints
+
+DEFAULT_BATCH_SIZE = 500
+KEY = "movie_id"
+FINGERPRINT_COLUMNS = REQUIRED_TEXT_COLUMNS + ["year"]
+
+
+def _write_rows(
+    db: Neo4jConnection, rows: list[dict], changed: list[dict]
+) -> tuple[list[str], list[str]]:
+    """One transaction: prune stale relationships of changed rows, then upsert all rows.
+    Returns the genres and persons that lost a link."""
+    statements = []
+    if changed:
+        statements += [
+            (schema.PRUNE_GENRE_RELS, {"rows": changed}),
+            (schema.PRUNE_DIRECTOR_RELS, {"rows": changed}),
+            (schema.PRUNE_ACTOR_RELS, {"rows": changed}),
+        ]
+    statements += [
+        (schema.UNWIND_MOVIES, {"rows": rows}),
+        (schema.UNWIND_GENRE_RELS, {"rows": rows}),
+        (schema.UNWIND_DIRECTOR_RELS, {"rows": rows}),
+        (schema.UNWIND_ACTOR_RELS, {"rows": rows}),
+    ]
+    results = db.execute_batch(statements)
+    if not changed:
+        return [], []
+    genres, directors, actors = results[:3]
+    return [r["name"] for r in genres], [r["name"] for r in directors + actors]
+
+
+class _Writer:
+    """Batches rows to write; opens the connection (and creates constraints) on first use only."""
+
+    def __init__(self, batch_size: int, manifest: RowManifest):
+        self.batch_size = batch_size
+        self.manifest = manifest
+        self.existing = set(manifest.rows)  # movie_ids already in the graph
+        self.pending: dict[str, dict] = {}  # movie_id -> row
+        self.fingerprints: dict[str, int] = {}  # movie_id -> fingerprint of the pending row
+        self.unlinked: dict[str, set[str]] = {"genres": set(), "persons": set()}  # orphan candidates
+        self.db: Optional[Neo4jConnection] = None
+
+    def connect(self) -> Neo4jConnection:
+        if self.db is None:
+            self.db = get_neo4j_connection()
+            for constraint in schema.CREATE_CONSTRAINTS:
+                self.db.execute(constraint)
+        return self.db
+
+    def add(self, row: dict, fingerprint: int) -> None:
+        if row[KEY] in self.pending:
+            self.flush()  # same movie twice: write the earlier row first, so the later one wins
+        self.pending[row[KEY]] = row
+        self.fingerprints[row[KEY]] = fingerprint
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        rows = list(self.pending.values())
+        changed = [row for row in rows if row[KEY] in self.existing]
+        genres, persons = _write_rows(self.connect(), rows, changed)
+        self.unlinked["genres"].update(genres)
+        self.unlinked["persons"].update(persons)
+        self.manifest.rows.update(self.fingerprints)
+        self.existing.update(self.pending)
+        self.pending, self.fingerprints = {}, {}
+
+
+def ingest_movies_incremental(
+    file_path: str,
+    batch_size: Optional[int] = None,
+    delete_missing: bool = False,
+) -> dict[str, int]:
+    """Write only new and changed rows of the movie CSV.
+
+    Returns counts: new, changed, unchanged, invalid, missing (in the manifest, not in the CSV)
+    and deleted (missing rows removed because delete_missing is set).
+    """
+    start = time.perf_counter()
+    manifest = RowManifest()
+    previous = set(manifest.rows)
+    writer = _Writer(batch_size or DEFAULT_BATCH_SIZE, manifest)
+    counts = dict.fromkeys(("new", "changed", "unchanged", "invalid", "missing", "deleted"), 0)
+    seen: set[str] = set()
+    dirty = False
+
+    for chunk in read_movie_chunks(file_path, DEFAULT_CHUNK_SIZE, text_only=True):
+        chunk = chunk[chunk[KEY].notna()]
+        columns = [column for column in FINGERPRINT_COLUMNS if column in chunk.columns]
+        fingerprints = row_fingerprints(chunk, columns)
+        todo = []
+        for position, (key, fingerprint) in enumerate(
+            zip(chunk[KEY].tolist(), fingerprints.tolist())
+        ):
+            seen.add(key)
+            if manifest.rows.get(key) != fingerprint:
+                todo.append(position)
+        counts["unchanged"] += len(chunk) - len(todo)
+        if not todo:
+            continue
+        dirty = True
+        frame, dropped = clean_movie_columns(chunk.iloc[todo])
+        counts["invalid"] += dropped
+        valid = fingerprints[chunk.index.get_indexer(frame.index)].tolist()
+        for row, fingerprint in zip(movie_rows(frame), valid):
+            known = row[KEY] in writer.existing or row[KEY] in writer.pending
+            counts["changed" if known else "new"] += 1
+            writer.add(row, fingerprint)
+    writer.flush()
+
+    missing = [key for key in previous if key not in seen]
+    counts["missing"] = len(missing)
+    if missing and delete_missing:
+        db = writer.connect()
+        for i in range(0, len(missing), DEFAULT_BATCH_SIZE):
+            (deleted,) = db.execute_batch(
+                [(schema.DELETE_MOVIES, {"ids": missing[i : i + DEFAULT_BATCH_SIZE]})]
+            )
+            for record in deleted:
+                writer.unlinked["genres"].update(record["genres"])
+                writer.unlinked["persons"].update(record["persons"])
+        for key in missing:
+            del manifest.rows[key]
+        counts["deleted"] = len(missing)
+        dirty = True
+    if writer.unlinked["genres"] or writer.unlinked["persons"]:
+        writer.db.execute_batch(
+            [
+                (schema.DELETE_ORPHAN_GENRES, {"names": sorted(writer.unlinked["genres"])}),
+                (schema.DELETE_ORPHAN_PERSONS, {"names": sorted(writer.unlinked["persons"])}),
+            ]
+        )
+    if writer.db is not None:
+        # Writes are committed: bump the version so cached read results are dropped
+        bump_graph_version()
+        writer.db.close()
+    if dirty:
+        manifest.save()
+
+    kept = " (kept; delete_missing=True removes them)" if missing and not delete_missing else ""
+    print(
+        f"Incremental ingest in {time.perf_counter() - start:.2f}s: {counts['new']} new, "
+        f"{counts['changed']} changed, {counts['unchanged']} unchanged, {counts['invalid']} invalid, "
+        f"{counts['missing']} missing{kept}, {counts['deleted']} deleted"
+    )
+    return counts
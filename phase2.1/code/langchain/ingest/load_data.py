@@ -1,43 +1,109 @@
 """Load and parse movie CSV and write to Neo4j (manual ingestion). Uses db.connection + graph.schema."""
-import pandas as pd
+import time
+from typing import Optional
 
-from db.connection import get_neo4j_connection
+from db.connection import Neo4jConnection, get_neo4j_connection
+from db.graph_version import bump_graph_version
 from graph import schema
-from models.movie import MovieModel
+from ingest.csv_stream import DEFAULT_CHUNK_SIZE, iter_movie_batches
+from ingest.fresh import ingest_movies_fresh
+from ingest.incremental import ingest_movies_incremental
+from ingest.parallel import ingest_movies_parallel
 
 
-def ingest_movies(file_path: str) -> None:
-    """Load movie CSV, apply schema constraints, and create Movie/Genre/Person nodes and relationships."""
-    df = pd.read_csv(file_path)
+def _write_movie(db: Neo4jConnection, movie: dict) -> None:
+    """Write one movie (MovieModel dict) with one auto-commit statement per node/relationship."""
+    db.execute(schema.CREATE_MOVIE, movie)
+
+    for genre in movie["genre"]:
+        db.execute(
+            schema.CREATE_GENRE_REL,
+            {"movie_id": movie["movie_id"], "genre": genre},
+        )
+
+    db.execute(
+        schema.CREATE_DIRECTOR_REL,
+        {"movie_id": movie["movie_id"], "director": movie["director"]},
+    )
+
+    for actor in movie["cast"]:
+        db.execute(
+            schema.CREATE_ACTOR_REL,
+            {"movie_id": movie["movie_id"], "actor": actor},
+        )
+
+
+def _write_movie_batch(db: Neo4jConnection, rows: list[dict]) -> None:
+    """Write a chunk of movies with the UNWIND templates in one transaction (movies first)."""
+    db.execute_batch(
+        [
+            (schema.UNWIND_MOVIES, {"rows": rows}),
+            (schema.UNWIND_GENRE_RELS, {"rows": rows}),
+            (schema.UNWIND_DIRECTOR_RELS, {"rows": rows}),
+            (schema.UNWIND_ACTOR_RELS, {"rows": rows}),
+        ]
+    )
+
+
+def ingest_movies(
+    file_path: str,
+    batch_size: Optional[int] = None,
+    workers: Optional[int] = None,
+    incremental: bool = False,
+    delete_missing: bool = False,
+    fresh: bool = False,
+) -> None:
+    """Load movie CSV, apply schema constraints, and create Movie/Genre/Person nodes and relationships.
+
+    The CSV is streamed and validated in chunks (ingest/csv_stream.py). With batch_size, each
+    chunk of that size is written via the UNWIND templates in one transaction. Without it, every
+    node/relationship is its own statement. With workers, chunks are fanned out to that many
+    threads (ingest/parallel.py). Prints rows/sec so the paths can be compared.
+
+    With fresh, every node is CREATEd once and then the relationships (ingest/fresh.py); it
+    refuses to run unless the Movie/Genre/Person labels are empty.
+    With incremental, only rows that are new or changed since the last incremental run are
+    written (ingest/incremental.py); delete_missing also removes movies no longer in the CSV.
+    """
+    if incremental:
+        ingest_movies_incremental(file_path, batch_size=batch_size, delete_missing=delete_missing)
+        return
+
     db = get_neo4j_connection()
     try:
         for constraint in schema.CREATE_CONSTRAINTS:
             db.execute(constraint)
 
-        for _, row in df.iterrows():
-            try:
-                movie = MovieModel(**row.to_dict())
-            except Exception as e:
-                print(f"Validation failed: {e}")
-                continue
-
-            db.execute(schema.CREATE_MOVIE, movie.model_dump())
-
-            for genre in movie.genre:
-                db.execute(
-                    schema.CREATE_GENRE_REL,
-                    {"movie_id": movie.movie_id, "genre": genre},
-                )
-
-            db.execute(
-                schema.CREATE_DIRECTOR_REL,
-                {"movie_id": movie.movie_id, "director": movie.director},
+        start = time.perf_counter()
+        count = 0
+        if fresh:
+            count = ingest_movies_fresh(db, file_path, chunk_size=batch_size or DEFAULT_CHUNK_SIZE)
+        elif workers:
+            count = ingest_movies_parallel(
+                db, file_path, workers, chunk_size=batch_size or DEFAULT_CHUNK_SIZE
             )
+        elif batch_size:
+            for rows in iter_movie_batches(file_path, chunk_size=batch_size):
+                _write_movie_batch(db, rows)
+                count += len(rows)
+        else:
+            for rows in iter_movie_batches(file_path, chunk_size=DEFAULT_CHUNK_SIZE):
+                for movie in rows:
+                    _write_movie(db, movie)
+                count += len(rows)
+        elapsed = time.perf_counter() - start
+        # All writes are committed: bump the version so cached read results are dropped
+        bump_graph_version()
 
-            for actor in movie.cast:
-                db.execute(
-                    schema.CREATE_ACTOR_REL,
-                    {"movie_id": movie.movie_id, "actor": actor},
-                )
+        if fresh:
+            mode = f"fresh, batch_size={batch_size or DEFAULT_CHUNK_SIZE}"
+        elif workers:
+            mode = f"workers={workers}"
+        else:
+            mode = f"batch_size={batch_size}" if batch_size else "per-row"
+        print(
+            f"Ingested {count} movies in {elapsed:.2f}s "
+            f"({count / max(elapsed, 1e-9):.0f} rows/sec, {mode})"
+        )
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -3,6 +3,17 @@ from pathlib import Path
 
 from ingest.load_data import ingest_movies
 
+# Rows per UNWIND transaction; None = one statement per node/relationship (original path).
+BATCH_SIZE = 500
+# Parallel writers (ingest/parallel.py); None = single connection, serial writes.
+WORKERS = None
+# Write only rows that are new or changed since the last incremental run (ingest/incremental.py).
+INCREMENTAL = False
+# With INCREMENTAL: also delete movies that are no longer in the CSV.
+DELETE_MISSING = False
+# First load into an empty graph: CREATE each node once, then relationships (ingest/fresh.py).
+FRESH = False
+
 
 def _default_data_path() -> Path:
     """Movie CSV next to code/langchain (e.g. phase2.1/data/movie.csv)."""
@@ -15,5 +26,12 @@ if __name__ == "__main__":
         print(f"Data file not found: {path}")
         print("Usage: python main.py   (expects ../../data/movie.csv) or pass path as needed.")
         exit(1)
-    ingest_movies(str(path))
+    ingest_movies(
+        str(path),
+        batch_size=BATCH_SIZE,
+        workers=WORKERS,
+        incremental=INCREMENTAL,
+        delete_missing=DELETE_MISSING,
+        fresh=FRESH,
+    )
     print("Ingest done.")
\ No newline at end of file
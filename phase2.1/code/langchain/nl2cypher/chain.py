@@ -2,13 +2,15 @@
 from langchain_neo4j import GraphCypherQAChain
 
 from db.connection import get_graph
+from graph.schema import PRECOMPUTED_SCHEMA_NOTES
 from llm import get_llm_for_chain
 
 
 def get_qa_chain(verbose: bool = True) -> GraphCypherQAChain:
-    """Build GraphCypherQAChain from configured LLM and Neo4j graph (direct LangChain usage)."""
+    """Build GraphCypherQAChain from configured LLM and Neo4j graph (direct LangChain usage).
+    The prompt schema gets the precomputed-analytics notes when COLLABORATED_WITH is in the graph."""
     llm = get_llm_for_chain()
-    graph = get_graph()
+    graph = get_graph(schema_notes={"COLLABORATED_WITH": PRECOMPUTED_SCHEMA_NOTES})
     return GraphCypherQAChain.from_llm(
         llm=llm,
         graph=graph,
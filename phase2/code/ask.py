@@ -1,19 +1,33 @@
-from nl2cypher import ask_graph
+from core.config import settings
+from nl2cypher import NL2CypherPipeline
 
 VERBOSE = True  # set to False to hide generated Cypher
 
+def show_rows(rows) -> None:
+    """Print streamed rows as they arrive, pausing every PAGE_SIZE rows; stopping closes the result."""
+    try:
+        for n, row in enumerate(rows, 1):
+            print(row)
+            if n % settings.page_size == 0 and input("-- Enter for more, q to stop -- ").strip().lower() == "q":
+                break
+    finally:
+        rows.close()
+
 def main():
     print("Ask questions about the graph. Type 'exit' or 'quit' to stop.\n")
+    # Built once: LLM client, DB driver and prompt are reused; schema reloads only if the file changes
+    pipeline = NL2CypherPipeline()
     while True:
         try:
             question = input("You: ").strip()
             if not question or question.lower() in ("exit", "quit"):
                 break
-            out = ask_graph(question, verbose=VERBOSE)
+            out = pipeline.ask_stream(question, verbose=VERBOSE)
             print(f"Query: {out['query']}\n")   # always show query, or only when VERBOSE
+            if out.get("cached"):
+                print(f"(template cache, params: {out['params']})\n")
             print("Results:")
-            for row in out["results"]:
-                print(row)
+            show_rows(out["results"])
             print()
         except Exception as e:
             print(f"Error: {e}\n")
@@ -0,0 +1,171 @@
+"""Batch NL→Cypher: answer every question in a JSONL or CSV file and stream results to JSONL.
+
+Input: JSONL lines with a "question" field (plus an optional "id"), or a CSV with a "question"
+column (and optional "id"). Questions run through one NL2CypherPipeline with at most
+--concurrency in flight: LLM calls go through a token bucket with 429 backoff (llm/rate_limit.py)
+and Cypher runs on the shared async driver pool. Output lines are written in input order as soon
+as every earlier question is done, so a partial file is always a valid prefix.
+
+Usage (from phase2/code):
+    python batch_ask.py questions.jsonl answers.jsonl
+    python batch_ask.py questions.csv answers.jsonl --concurrency 16 --rpm 120
+"""
+import argparse
+import asyncio
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+
+from core.config import settings
+from db.connection import close_async_driver
+from llm import get_async_llm
+from llm.rate_limit import RateLimitedProvider
+from nl2cypher import NL2CypherPipeline
+from nl2cypher.metrics import get_metrics
+
+
+def read_questions(path: Path) -> list[dict]:
+    """[{"id", "question"}] from a .jsonl or .csv file; id defaults to the 1-based line number."""
+    with path.open(encoding="utf-8", newline="") as f:
+        if path.suffix.lower() == ".csv":
+            rows = list(csv.DictReader(f))
+        else:
+            rows = [json.loads(line) for line in f if line.strip()]
+    questions = []
+    for i, row in enumerate(rows, 1):
+        question = (row.get("question") or "").strip()
+        if question:
+            questions.append({"id": row.get("id") or i, "question": question})
+    return questions
+
+
+async def _answer(pipeline: NL2CypherPipeline, item: dict, max_rows: int | None) -> dict:
+    start = time.perf_counter()
+    record = {"id": item["id"], "question": item["question"]}
+    try:
+        out = await pipeline.ask_async(item["question"])
+        results = out["results"]
+        record.update(
+            query=out["query"],
+            params=out["params"],
+            cached=out["cached"],
+            rows=len(results),
+            results=results if max_rows is None else results[:max_rows],
+            error=None,
+        )
+    except Exception as e:
+        record.update(query=None, params=None, cached=False, rows=0, results=[], error=f"{type(e).__name__}: {e}")
+    record["seconds"] = round(time.perf_counter() - start, 3)
+    return record
+
+
+class _Progress:
+    def __init__(self, total: int, every: float):
+        self.total = total
+        self.every = every
+        self.done = 0
+        self.errors = 0
+        self.cached = 0
+        self.start = time.perf_counter()
+        self._last = self.start
+
+    def update(self, record: dict) -> None:
+        self.done += 1
+        self.errors += record["error"] is not None
+        self.cached += bool(record["cached"])
+        now = time.perf_counter()
+        if now - self._last >= self.every or self.done == self.total:
+            self._last = now
+            self.report(now)
+
+    def report(self, now: float) -> None:
+        elapsed = now - self.start
+        rate = self.done / max(elapsed, 1e-9)
+        eta = (self.total - self.done) / rate if rate else 0.0
+        print(
+            f"[{self.done}/{self.total}] {rate:.2f} q/s, {self.errors} errors, "
+            f"{self.cached} template-cache hits, elapsed {elapsed:.0f}s, eta {eta:.0f}s",
+            file=sys.stderr,
+        )
+
+
+async def run_batch(
+    questions: list[dict],
+    output: Path,
+    concurrency: int,
+    max_rows: int | None = None,
+    progress_every: float = 5.0,
+    rpm: float | None = None,
+) -> _Progress:
+    llm = RateLimitedProvider(get_async_llm(), requests_per_minute=rpm)
+    pipeline = NL2CypherPipeline(llm=llm)
+    queue: asyncio.Queue = asyncio.Queue()
+    for index, item in enumerate(questions):
+        queue.put_nowait((index, item))
+
+    progress = _Progress(len(questions), progress_every)
+    finished: dict[int, dict] = {}
+    next_index = 0
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with output.open("w", encoding="utf-8") as out:
+
+        def _flush() -> None:
+            # Write every record whose predecessors are all written (keeps input order)
+            nonlocal next_index
+            while next_index in finished:
+                out.write(json.dumps(finished.pop(next_index), default=str) + "\n")
+                next_index += 1
+            out.flush()
+
+        async def _worker() -> None:
+            while True:
+                try:
+                    index, item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                record = await _answer(pipeline, item, max_rows)
+                finished[index] = record
+                progress.update(record)
+                _flush()
+
+        await asyncio.gather(*(_worker() for _ in range(max(1, concurrency))))
+    await close_async_driver()
+    if llm.throttled:
+        print(f"Rate limited {llm.throttled} times (429); backed off and retried.", file=sys.stderr)
+    return progress
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Answer a file of questions with NL→Cypher.")
+    parser.add_argument("input", type=Path, help="Questions (.jsonl or .csv with a 'question' column)")
+    parser.add_argument("output", type=Path, help="Answers, one JSON object per line, in input order")
+    parser.add_argument("--concurrency", type=int, default=settings.batch_concurrency,
+                        help="Questions in flight at once")
+    parser.add_argument("--rpm", type=float, default=None,
+                        help="LLM requests per minute (default LLM_REQUESTS_PER_MINUTE)")
+    parser.add_argument("--max-rows", type=int, default=None, help="Keep at most this many result rows per answer")
+    parser.add_argument("--progress-every", type=float, default=5.0, help="Seconds between progress lines")
+    args = parser.parse_args()
+
+    questions = read_questions(args.input)
+    if not questions:
+        print(f"No questions found in {args.input}")
+        return
+    progress = asyncio.run(
+        run_batch(questions, args.output, args.concurrency, args.max_rows, args.progress_every, args.rpm)
+    )
+    elapsed = time.perf_counter() - progress.start
+    print(
+        f"Answered {progress.done} questions in {elapsed:.1f}s "
+        f"({progress.done / max(elapsed, 1e-9):.2f} q/s, {progress.errors} errors) -> {args.output}"
+    )
+    histogram = get_metrics().histogram
+    if histogram is not None:
+        print(histogram.summary())
+
+
+if __name__ == "__main__":
+    main()
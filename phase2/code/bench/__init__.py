@@ -0,0 +1 @@
+# Ingest benchmarks (synthetic data, run.py)
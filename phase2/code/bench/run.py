@@ -0,0 +1,204 @@
+"""Ingest throughput benchmark on synthetic employee data.
+
+Every (rows, strategy) case runs in a fresh process so peak memory is per case. The ingest loop is
+the one from ingest/load_data.py and ingest/parallel.py, with the clock split into
+    parse    - pandas read_csv chunks
+    validate - clean_employee_frame (EmployeeModel rules)
+    write    - Cypher statements through Neo4jConnection
+Results are appended as JSON lines to --out, one record per case, so runs can be diffed.
+
+Usage (from phase2/code):
+    python -m bench.run --rows 1000 100000 --strategies parallel --workers 8
+    python -m bench.run --rows 10000 --backend neo4j     # WIPES Employee/Department/Position nodes first
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import resource
+except ImportError:  # Windows: fall back to tracemalloc for peak memory
+    resource = None
+
+import db.connection as connection
+from bench.standin import StandInDriver
+from bench.synthetic import generate_employees
+from db.connection import Neo4jConnection
+from db.graph_version import bump_graph_version
+from graph import schema
+from ingest.csv_stream import DEFAULT_CHUNK_SIZE, clean_employee_frame, read_employee_chunks
+from ingest.load_data import _write_employee
+from ingest.parallel import _write_chunk
+from ingest.partitioned import write_names
+
+BENCH_DIR = Path(__file__).resolve().parent
+STRATEGIES = ["per-row", "parallel"]
+CLEAR_EMPLOYEE_GRAPH = """
+MATCH (n) WHERE n:Employee OR n:Department OR n:Position
+CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF 10000 ROWS
+"""
+
+
+def dataset_path(rows: int, seed: int) -> Path:
+    """CSV for (rows, seed), generated on first use and reused by later runs."""
+    path = BENCH_DIR / "data" / f"employees_{rows}_{seed}.csv"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        start = time.perf_counter()
+        tmp = path.with_name(path.name + ".tmp")
+        generate_employees(str(tmp), rows, seed=seed)
+        tmp.replace(path)
+        print(f"Generated {rows} employees in {time.perf_counter() - start:.1f}s -> {path}")
+    return path
+
+
+def _timed_batches(file_path: str, chunk_size: int, timer: dict) -> Iterator[list[dict]]:
+    chunks = read_employee_chunks(file_path, chunk_size)
+    while True:
+        t = time.perf_counter()
+        chunk = next(chunks, None)
+        timer["parse"] += time.perf_counter() - t
+        if chunk is None:
+            return
+        t = time.perf_counter()
+        rows, _ = clean_employee_frame(chunk)
+        timer["validate"] += time.perf_counter() - t
+        if rows:
+            yield rows
+
+
+def _run_per_row(db: Neo4jConnection, file_path: str, timer: dict, chunk_size: int, workers: int) -> int:
+    count = 0
+    for rows in _timed_batches(file_path, chunk_size, timer):
+        t = time.perf_counter()
+        for data in rows:
+            _write_employee(db, data)
+        timer["write"] += time.perf_counter() - t
+        count += len(rows)
+    return count
+
+
+def _run_parallel(db: Neo4jConnection, file_path: str, timer: dict, chunk_size: int, workers: int) -> int:
+    departments: set[str] = set()
+    positions: set[str] = set()
+    for rows in _timed_batches(file_path, chunk_size, timer):
+        for row in rows:
+            departments.add(row["department"])
+            positions.add(row["position"])
+    t = time.perf_counter()
+    write_names(db, schema.UNWIND_DEPARTMENTS, departments)
+    write_names(db, schema.UNWIND_POSITIONS, positions)
+    timer["write"] += time.perf_counter() - t
+
+    count = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for rows in _timed_batches(file_path, chunk_size, timer):
+            t = time.perf_counter()
+            _write_chunk(db, pool, rows, workers)
+            timer["write"] += time.perf_counter() - t
+            count += len(rows)
+    return count
+
+
+RUNNERS = {"per-row": _run_per_row, "parallel": _run_parallel}
+
+
+def _peak_memory_mb() -> tuple[float, str]:
+    """Peak RSS of this (per-case) process, or the tracemalloc peak where resource is missing."""
+    if resource is None:
+        return tracemalloc.get_traced_memory()[1] / 2**20, "tracemalloc"
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return (peak / 2**20 if sys.platform == "darwin" else peak / 2**10), "ru_maxrss"
+
+
+def run_case(case: dict) -> dict:
+    """Run one case in the current (child) process and return its result record."""
+    if resource is None:
+        tracemalloc.start()
+
+    standin = None
+    if case["backend"] == "standin":
+        standin = connection._driver = StandInDriver(latency=case["latency"])
+    db = Neo4jConnection()
+    if case["backend"] == "neo4j":
+        db.execute(CLEAR_EMPLOYEE_GRAPH)
+        for statement in schema.CREATE_CONSTRAINTS + schema.CREATE_INDEXES:
+            db.execute(statement)
+
+    timer = {"parse": 0.0, "validate": 0.0, "write": 0.0}
+    start = time.perf_counter()
+    count = RUNNERS[case["strategy"]](db, case["file"], timer, case["chunk_size"], case["workers"])
+    elapsed = time.perf_counter() - start
+    if case["backend"] == "neo4j":
+        bump_graph_version()
+
+    peak, memory_source = _peak_memory_mb()
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "dataset": "employee",
+        "rows": case["rows"],
+        "ingested": count,
+        "strategy": case["strategy"],
+        "backend": case["backend"],
+        "latency": case["latency"] if standin else None,
+        "chunk_size": case["chunk_size"],
+        "workers": case["workers"] if case["strategy"] == "parallel" else None,
+        "seconds": round(elapsed, 4),
+        "rows_per_sec": round(count / max(elapsed, 1e-9), 1),
+        "parse_s": round(timer["parse"], 4),
+        "validate_s": round(timer["validate"], 4),
+        "write_s": round(timer["write"], 4),
+        "peak_memory_mb": round(peak, 1),
+        "memory_source": memory_source,
+        "statements": standin.statements if standin else None,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark employee ingest strategies on synthetic data.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="Dataset sizes to run (e.g. 1000 ... 10000000)")
+    parser.add_argument("--strategies", nargs="+", choices=STRATEGIES, default=STRATEGIES)
+    parser.add_argument("--backend", choices=["standin", "neo4j"], default="standin",
+                        help="standin = in-process fake driver; neo4j = database from .env (cleared first)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Stand-in seconds per statement")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=str(BENCH_DIR / "results" / "ingest.jsonl"))
+    args = parser.parse_args()
+
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    ctx = get_context("spawn")
+    for rows in args.rows:
+        file_path = dataset_path(rows, args.seed)
+        for strategy in args.strategies:
+            case = {
+                "file": str(file_path), "rows": rows, "strategy": strategy, "backend": args.backend,
+                "latency": args.latency, "chunk_size": args.chunk_size, "workers": args.workers,
+            }
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                record = pool.submit(run_case, case).result()
+            with out.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+            print(
+                f"{rows:>10} {strategy:<9} {record['rows_per_sec']:>12.0f} rows/sec  "
+                f"parse {record['parse_s']:.2f}s  validate {record['validate_s']:.2f}s  "
+                f"write {record['write_s']:.2f}s  peak {record['peak_memory_mb']:.0f} MB"
+            )
+    print(f"Results appended to {out}")
+
+
+if __name__ == "__main__":
+    main()
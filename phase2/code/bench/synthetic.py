@@ -0,0 +1,83 @@
+"""Synthetic employee.csv generator for ingest benchmarks (same headers and formats as data/employee.csv).
+
+Department sizes are skewed (Zipf-like over a fixed list), so a few Department nodes receive most
+WORKS_IN relationships, as in a real company; positions are mildly skewed. Names are unique per row
+because Employee is MERGEd by name. A small share of rows has an unparseable salary and is dropped
+by validation. Rows are written in chunks, so 10^7 rows never sit in memory at once.
+"""
+import numpy as np
+import pandas as pd
+
+from ingest.csv_stream import CSV_TO_MODEL
+
+DEPARTMENTS = [
+    "IT", "Sales", "Operations", "Customer Support", "Marketing", "Finance", "Engineering",
+    "HR", "Legal", "Research", "Procurement", "Administration",
+]
+POSITIONS = ["Analyst", "Team Lead", "Junior Developer", "Senior Developer", "Manager", "Intern", "Director"]
+FIRST_NAMES = [
+    "Douglas", "Anthony", "Thomas", "Sarah", "Maria", "David", "Linda", "James", "Karen", "Robert",
+    "Emily", "Michael", "Jessica", "William", "Ashley", "Daniel", "Laura", "Kevin", "Amanda", "Brian",
+]
+LAST_NAMES = [
+    "Lindsey", "Roberson", "Miller", "Johnson", "Garcia", "Brown", "Davis", "Wilson", "Moore", "Taylor",
+    "Anderson", "Thomas", "Jackson", "White", "Harris", "Martin", "Thompson", "Young", "Allen", "King",
+]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+DEPARTMENT_SKEW = 1.2
+POSITION_SKEW = 0.8
+INVALID_SALARY_RATE = 0.001
+CHUNK_ROWS = 100_000
+
+
+def zipf_probabilities(n: int, skew: float) -> np.ndarray:
+    """P(rank k) proportional to 1/k^skew over a finite pool of n items."""
+    weights = 1.0 / np.arange(1, n + 1) ** skew
+    return weights / weights.sum()
+
+
+def employee_name(i: int) -> str:
+    """Unique, human-looking name for row i."""
+    first = FIRST_NAMES[i % len(FIRST_NAMES)]
+    last = LAST_NAMES[(i // len(FIRST_NAMES)) % len(LAST_NAMES)]
+    suffix = i // (len(FIRST_NAMES) * len(LAST_NAMES))
+    return f"{first} {last}" if suffix == 0 else f"{first} {last} {suffix + 1}"
+
+
+def _employee_chunk(rng: np.random.Generator, start: int, size: int) -> pd.DataFrame:
+    departments = np.array(DEPARTMENTS, dtype=object)[
+        rng.choice(len(DEPARTMENTS), size=size, p=zipf_probabilities(len(DEPARTMENTS), DEPARTMENT_SKEW))
+    ]
+    positions = np.array(POSITIONS, dtype=object)[
+        rng.choice(len(POSITIONS), size=size, p=zipf_probabilities(len(POSITIONS), POSITION_SKEW))
+    ]
+    salaries = rng.lognormal(mean=11.1, sigma=0.35, size=size).clip(25_000, 250_000).astype(int).astype(object)
+    salaries[rng.random(size) < INVALID_SALARY_RATE] = "n/a"
+    months = rng.integers(0, 12, size=size)
+    years = rng.integers(0, 24, size=size)
+
+    fields = {
+        "name": [employee_name(i) for i in range(start, start + size)],
+        "age": rng.integers(21, 65, size=size),
+        "gender": rng.choice(["Male", "Female"], size=size),
+        "project_completed": rng.integers(0, 26, size=size),
+        "productivity": rng.integers(0, 101, size=size),
+        "satisfaction_rate": rng.integers(0, 101, size=size),
+        "feedback_score": rng.uniform(1.0, 5.0, size=size).round(1),
+        "department": departments,
+        "position": positions,
+        "joining_date": [f"{MONTHS[m]}-{y:02d}" for m, y in zip(months, years)],
+        "salary": salaries,
+    }
+    model_to_csv = {field: csv for csv, field in CSV_TO_MODEL.items()}
+    return pd.DataFrame({model_to_csv[field]: values for field, values in fields.items()})
+
+
+def generate_employees(file_path: str, rows: int, seed: int = 0) -> None:
+    """Write `rows` synthetic employees to file_path."""
+    rng = np.random.default_rng(seed)
+    for start in range(0, rows, CHUNK_ROWS):
+        size = min(CHUNK_ROWS, rows - start)
+        chunk = _employee_chunk(rng, start, size)
+        chunk.to_csv(file_path, mode="w" if start == 0 else "a", header=start == 0, index=False)
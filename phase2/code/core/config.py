@@ -10,6 +10,13 @@ class Settings(BaseSettings):
     neo4j_password: str
     neo4j_db: str
 
+    # Shared driver pool (db/connection.py get_driver): max connections, seconds, seconds
+    neo4j_max_pool_size: int = 50
+    neo4j_max_connection_lifetime: int = 3600
+    neo4j_connection_acquisition_timeout: float = 60.0
+    # Records per network round trip when streaming results (Neo4jConnection.stream_query)
+    neo4j_fetch_size: int = 1000
+
     # LLM Provider
     llm_provider: str = "groq"
 
@@ -17,8 +24,71 @@ class Settings(BaseSettings):
     groq_api_key: Optional[str] = None
     groq_model: Optional[str] = None
 
+    # Fake provider (LLM_PROVIDER=fake): fixed reply and simulated latency in seconds, no network
+    fake_llm_response: str = "MATCH (e:Employee) RETURN e.name AS name LIMIT 5"
+    fake_llm_delay: float = 0.0
+
+    # Stream LLM replies and stop reading at the closing ``` fence (providers implementing StreamingLLMProvider)
+    llm_streaming: bool = True
+
+    # Client-side LLM rate limit (llm/rate_limit.py) and batch_ask.py concurrency
+    llm_requests_per_minute: float = 30.0
+    llm_burst: int = 5
+    llm_max_retries: int = 5
+    batch_concurrency: int = 8
+
     # Schema file for NL→Cypher (generated by scripts/generate_schema.py). Relative to phase2/code or absolute.
     schema_file: str = "nl2cypher/prompt_schema/graph_schema.txt"
+    # scripts/generate_schema.py: nodes per label / relationships per type sampled, --watch poll interval (s)
+    schema_sample_size: int = 1000
+    schema_watch_interval: float = 5.0
+    # Send only the question-relevant part of the schema in each prompt (nl2cypher/schema_pruner.py)
+    schema_pruning: bool = True
+
+    # Parameterized Cypher template cache (nl2cypher/template_cache.py). Path relative to phase2/code or absolute.
+    template_cache_enabled: bool = True
+    template_cache_file: str = "nl2cypher/cache/templates.json"
+    template_cache_size: int = 512
+
+    # Read-result cache (db/result_cache.py), invalidated when ingest bumps the graph version file
+    result_cache_enabled: bool = True
+    result_cache_ttl: float = 300.0
+    result_cache_max_bytes: int = 64 * 1024 * 1024
+    graph_version_file: str = ".cache/graph_version"
+
+    # Row fingerprints of the last incremental ingest (ingest/manifest.py), relative to phase2/code or absolute
+    ingest_manifest_file: str = ".cache/employee_manifest.npz"
+
+    # Few-shot examples (nl2cypher/few_shot.py): verified pairs from successful questions, top-k per prompt
+    few_shot_enabled: bool = True
+    few_shot_file: str = "nl2cypher/cache/examples.jsonl"
+    few_shot_k: int = 3
+
+    # Generated Cypher guard (nl2cypher/cypher_guard.py): LIMIT cap and max var-length hops
+    cypher_max_rows: int = 1000
+    cypher_max_hops: int = 10
+    # EXPLAIN generated Cypher before running it (nl2cypher/validation.py): max estimated rows of any
+    # plan operator, and LLM repair attempts after a rejection
+    cypher_explain_validation: bool = True
+    cypher_max_estimated_rows: int = 1_000_000
+    cypher_repair_attempts: int = 2
+    # Rows per page for ask_graph_page / the ask.py CLI, and the HMAC key that signs page cursors
+    # (nl2cypher/pagination.py). Empty: a random key per process, so cursors die with the process.
+    page_size: int = 50
+    page_cursor_secret: str = ""
+
+    # JSONL log of every Cypher ask_graph executes (nl2cypher/query_log.py), read by scripts/advise_indexes.py
+    query_log_enabled: bool = True
+    query_log_file: str = ".cache/query_log.jsonl"
+
+    # Per-stage latency metrics of ask_graph (nl2cypher/metrics.py): exporters are a comma-separated
+    # subset of histogram, prometheus (text endpoint on METRICS_HOST:METRICS_PORT) and json (lines in
+    # METRICS_LOG_FILE). The endpoint listens on loopback only unless METRICS_HOST says otherwise
+    metrics_enabled: bool = True
+    metrics_exporters: str = "histogram"
+    metrics_host: str = "127.0.0.1"
+    metrics_port: int = 9464
+    metrics_log_file: str = ".cache/metrics.jsonl"
 
     class Config:
         env_file = ".env"
@@ -28,11 +98,16 @@ class Settings(BaseSettings):
 settings = Settings()
 
 
-def get_schema_path() -> Path:
-    """Resolve schema file path: relative to phase2/code (this package root) or absolute."""
-    p = Path(settings.schema_file)
+def resolve_code_path(path: str) -> Path:
+    """Resolve a configured path: relative to phase2/code (this package root) or absolute."""
+    p = Path(path)
     if p.is_absolute():
         return p
     # Assume running from phase2/code; config.py lives in core/
     code_root = Path(__file__).resolve().parent.parent
-    return code_root / settings.schema_file
+    return code_root / path
+
+
+def get_schema_path() -> Path:
+    """Resolve schema file path: relative to phase2/code (this package root) or absolute."""
+    return resolve_code_path(settings.schema_file)
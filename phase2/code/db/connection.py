@@ -1,25 +1,178 @@
-from neo4j import GraphDatabase
+import atexit
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator
+
+from neo4j import AsyncDriver, AsyncGraphDatabase, Driver, GraphDatabase, Record
 from core.config import settings
+from db.result_cache import get_result_cache
 
 
+# One driver (and connection pool) per process, created lazily and shared by every Neo4jConnection
+_driver: Driver | None = None
+_driver_lock = threading.Lock()
 
-class Neo4jConnection:
+# Async counterpart for ask_graph_async; used from one event loop, so no lock needed
+_async_driver: AsyncDriver | None = None
 
-    def __init__(self):
-        self.driver = GraphDatabase.driver(
+
+def get_driver() -> Driver:
+    """Return the process-wide driver, creating it on first use with the pool settings from .env."""
+    global _driver
+    if _driver is None:
+        with _driver_lock:
+            if _driver is None:
+                _driver = GraphDatabase.driver(
+                    settings.neo4j_uri,
+                    auth=(settings.neo4j_user, settings.neo4j_password),
+                    max_connection_pool_size=settings.neo4j_max_pool_size,
+                    max_connection_lifetime=settings.neo4j_max_connection_lifetime,
+                    connection_acquisition_timeout=settings.neo4j_connection_acquisition_timeout,
+                )
+    return _driver
+
+
+def close_driver() -> None:
+    """Close the shared driver (registered with atexit; safe to call more than once)."""
+    global _driver
+    with _driver_lock:
+        if _driver is not None:
+            _driver.close()
+            _driver = None
+
+
+atexit.register(close_driver)
+
+
+def get_async_driver() -> AsyncDriver:
+    """Return the process-wide async driver (same pool settings). Create and use it inside one event loop."""
+    global _async_driver
+    if _async_driver is None:
+        _async_driver = AsyncGraphDatabase.driver(
             settings.neo4j_uri,
-            auth=(settings.neo4j_user, settings.neo4j_password)
+            auth=(settings.neo4j_user, settings.neo4j_password),
+            max_connection_pool_size=settings.neo4j_max_pool_size,
+            max_connection_lifetime=settings.neo4j_max_connection_lifetime,
+            connection_acquisition_timeout=settings.neo4j_connection_acquisition_timeout,
         )
+    return _async_driver
+
+
+async def close_async_driver() -> None:
+    """Close the async driver; await this before the event loop shuts down."""
+    global _async_driver
+    if _async_driver is not None:
+        await _async_driver.close()
+        _async_driver = None
+
+
+class Neo4jConnection:
+
+    def __init__(self):
+        self.driver = get_driver()
     
     def close(self):
-        self.driver.close()
+        # Driver is shared per process; nothing to release here. Use close_driver() on shutdown.
+        pass
+
+    @contextmanager
+    def session(self):
+        """Session on NEO4J_DB. Lets a caller run several statements on one session."""
+        with self.driver.session(database=settings.neo4j_db) as session:
+            yield session
+
+    @contextmanager
+    def transaction(self):
+        """Explicit transaction: commits when the block exits normally, rolls back on error."""
+        with self.session() as session:
+            with session.begin_transaction() as tx:
+                yield tx
     
     def execute(self,query:str,parameters:dict |None=None):
-        with self.driver.session(
-            database=settings.neo4j_db) as session:
+        with self.session() as session:
             session.run(query,parameters or {})
+
+    def execute_batch(self, statements: list[tuple[str, dict]]) -> list[list[Record]]:
+        """Run several (query, parameters) pairs in one managed write transaction (retried on transient errors).
+        Returns each statement's records."""
+        def _run_all(tx):
+            return [list(tx.run(query, parameters or {})) for query, parameters in statements]
+
+        with self.session() as session:
+            return session.execute_write(_run_all)
     
-    def execute_query(self, query: str, parameters: dict | None = None):
-        with self.driver.session(database=settings.neo4j_db) as session:
+    def execute_query(self, query: str, parameters: dict | None = None, cache: bool = False):
+        """Run a query and return all records. cache=True (read-only queries only) serves repeats
+        from the result cache until the TTL passes or ingest bumps the graph version."""
+        result_cache = get_result_cache() if cache else None
+        if result_cache:
+            records = result_cache.get(query, parameters)
+            if records is not None:
+                return records
+        with self.session() as session:
             result = session.run(query, parameters or {})
-            return list(result) 
\ No newline at end of file
+            records = list(result)
+        if result_cache:
+            result_cache.put(query, parameters, records)
+        return records
+
+    def stream_query(self, query: str, parameters: dict | None = None, fetch_size: int | None = None) -> Iterator[Record]:
+        """Yield records as the server sends them, fetch_size (NEO4J_FETCH_SIZE) at a time.
+
+        The session stays open while the caller iterates; closing the generator early (break, .close())
+        closes the session and discards the rest of the result. Not result-cached.
+        """
+        size = fetch_size or settings.neo4j_fetch_size
+        with self.driver.session(database=settings.neo4j_db, fetch_size=size) as session:
+            yield from session.run(query, parameters or {})
+
+    def explain(self, query: str, parameters: dict | None = None) -> dict | None:
+        """Plan the query under EXPLAIN without running it; returns the operator tree with estimated rows."""
+        with self.session() as session:
+            return session.run("EXPLAIN " + query, parameters or {}).consume().plan
+
+    def profile(self, query: str, parameters: dict | None = None) -> dict | None:
+        """Run the query under PROFILE; returns the operator tree with rows, db hits and page cache hits."""
+        with self.session() as session:
+            return session.run("PROFILE " + query, parameters or {}).consume().profile
+
+
+class AsyncNeo4jConnection:
+    """Async version of Neo4jConnection on the shared async driver. Many queries can be in flight on one loop."""
+
+    def __init__(self):
+        self.driver = get_async_driver()
+
+    @asynccontextmanager
+    async def session(self):
+        async with self.driver.session(database=settings.neo4j_db) as session:
+            yield session
+
+    async def execute_query(self, query: str, parameters: dict | None = None, cache: bool = False):
+        result_cache = get_result_cache() if cache else None
+        if result_cache:
+            records = result_cache.get(query, parameters)
+            if records is not None:
+                return records
+        async with self.session() as session:
+            result = await session.run(query, parameters or {})
+            records = [record async for record in result]
+        if result_cache:
+            result_cache.put(query, parameters, records)
+        return records
+
+    async def stream_query(
+        self, query: str, parameters: dict | None = None, fetch_size: int | None = None
+    ) -> AsyncIterator[Record]:
+        """Async Neo4jConnection.stream_query; aclose() the generator to stop early."""
+        size = fetch_size or settings.neo4j_fetch_size
+        async with self.driver.session(database=settings.neo4j_db, fetch_size=size) as session:
+            result = await session.run(query, parameters or {})
+            async for record in result:
+                yield record
+
+    async def explain(self, query: str, parameters: dict | None = None) -> dict | None:
+        """Async Neo4jConnection.explain."""
+        async with self.session() as session:
+            result = await session.run("EXPLAIN " + query, parameters or {})
+            return (await result.consume()).plan
@@ -0,0 +1,46 @@
+"""Graph version counter shared between ingest and readers (result cache) through a small file.
+
+Ingest calls bump_graph_version() after its writes commit; readers compare get_graph_version()
+with the version their cached data was read at. A stat() per check, re-read only when the file changes.
+"""
+import os
+import threading
+
+from core.config import resolve_code_path, settings
+
+_lock = threading.Lock()
+_seen: tuple[int, int] | None = None  # (mtime_ns, version) from the last read
+
+
+def get_graph_version() -> int:
+    """Current version (0 when no ingest has bumped it yet)."""
+    global _seen
+    path = resolve_code_path(settings.graph_version_file)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+    seen = _seen
+    if seen is not None and seen[0] == mtime:
+        return seen[1]
+    try:
+        version = int(path.read_text(encoding="utf-8").strip() or 0)
+    except (OSError, ValueError):
+        version = 0
+    _seen = (mtime, version)
+    return version
+
+
+def bump_graph_version() -> int:
+    """Increment the version (call after a write path commits). Returns the new version."""
+    path = resolve_code_path(settings.graph_version_file)
+    with _lock:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            version = int(path.read_text(encoding="utf-8").strip() or 0) + 1
+        except (OSError, ValueError):
+            version = 1
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(str(version), encoding="utf-8")
+        tmp.replace(path)
+    return version
@@ -0,0 +1,94 @@
+"""Read-result cache for execute_query(cache=True), keyed by normalized Cypher + parameters.
+
+Entries expire after a TTL, are evicted LRU-first once their estimated size passes a byte budget,
+and are all dropped when the graph version changes (see db/graph_version.py).
+"""
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from core.config import settings
+from db.graph_version import get_graph_version
+
+
+def cache_key(query: str, parameters: dict | None) -> str:
+    normalized = re.sub(r"\s+", " ", query).strip()
+    params = json.dumps(parameters or {}, sort_keys=True, default=str)
+    return normalized + "\x00" + params
+
+
+def _estimate_size(key: str, records: list) -> int:
+    # Rough but cheap: length of the textual form of the rows plus the key
+    return len(key) + sum(len(repr(r)) for r in records)
+
+
+class ResultCache:
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[list, int, float]] = OrderedDict()
+        self._bytes = 0
+        self._version = get_graph_version()
+        self._lock = threading.Lock()
+
+    def _check_version(self) -> None:
+        version = get_graph_version()
+        if version != self._version:
+            self._entries.clear()
+            self._bytes = 0
+            self._version = version
+
+    def get(self, query: str, parameters: dict | None) -> list | None:
+        key = cache_key(query, parameters)
+        with self._lock:
+            self._check_version()
+            entry = self._entries.get(key)
+            if entry is None or entry[2] < time.monotonic():
+                if entry is not None:
+                    self._drop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, query: str, parameters: dict | None, records: list) -> None:
+        key = cache_key(query, parameters)
+        size = _estimate_size(key, records)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._check_version()
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (records, size, time.monotonic() + self.ttl)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+
+    def _drop(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+_cache: ResultCache | None = None
+
+
+def get_result_cache() -> ResultCache | None:
+    """Process-wide cache from settings, or None when RESULT_CACHE_ENABLED is false."""
+    global _cache
+    if not settings.result_cache_enabled:
+        return None
+    if _cache is None:
+        _cache = ResultCache(settings.result_cache_max_bytes, settings.result_cache_ttl)
+    return _cache
@@ -0,0 +1,374 @@
+"""In-process copy of the employee graph, in CSR arrays, for hot read paths.
+
+Simple traversals (an employee's department and role, who shares a department, head counts per
+department or position, how two employees are connected) do not need a database round trip.
+
+Each label's keys (Employee.name, Department.department, Position.position) are interned to
+0..n-1: a pandas Index maps key -> id, an object array id -> key. Each relationship type is stored
+twice as CSR arrays: `out` over its start label (indptr[i]:indptr[i+1] slices the end ids of node
+i) and `in_` over its end label. Traversals gather whole frontiers with NumPy, so a lookup is a
+few array slices. Memory is the key strings plus ~4 bytes per relationship per direction and
+8 bytes per node per relationship type touching its label.
+
+Load from the CSV (same validation as ingest, csv_stream.clean_employee_columns) or snapshot the
+database. The copy does not follow later writes, so reload it after ingest.
+
+Usage (from phase2/code):
+
+    graph = CSRGraph.from_employee_csv("../data/employee.csv")   # or CSRGraph.from_neo4j(Neo4jConnection())
+    graph.neighbors("Employee", "Douglas Lindsey")              # [("Department", "IT"), ("Position", ...)]
+    graph.k_hop("Department", "IT", 1)                          # {"Employee": [...]}
+    graph.top_degrees("Department")                             # head count per department
+    graph.shortest_path(("Employee", "A"), ("Employee", "B"))
+    python -m graph.csr ../data/employee.csv                    # load, memory and query timings
+"""
+import argparse
+import time
+from typing import Callable, Iterator, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from db.connection import Neo4jConnection
+from ingest.csv_stream import DEFAULT_CHUNK_SIZE, clean_employee_columns, read_employee_chunks
+
+# Label -> key property, relationship type -> (start label, end label)
+NODE_KEYS = {"Employee": "name", "Department": "department", "Position": "position"}
+RELATIONSHIPS = {
+    "WORKS_IN": ("Employee", "Department"),
+    "HAS_ROLE": ("Employee", "Position"),
+}
+
+OUT, IN, BOTH = "out", "in", "both"
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+class CSR(NamedTuple):
+    """Compressed sparse rows: the neighbours of row i are indices[indptr[i]:indptr[i + 1]]."""
+
+    indptr: np.ndarray  # int64, one more than the rows
+    indices: np.ndarray  # int32 neighbour ids
+
+    def row(self, i: int) -> np.ndarray:
+        return self.indices[self.indptr[i] : self.indptr[i + 1]]
+
+    def gather(self, ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """(neighbours, owner of each neighbour) for a whole frontier, without a Python loop."""
+        starts = self.indptr[ids]
+        lengths = self.indptr[ids + 1] - starts
+        total = int(lengths.sum())
+        if not total:
+            return _EMPTY, _EMPTY
+        offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths) + np.arange(total)
+        return self.indices[offsets].astype(np.int64), np.repeat(ids, lengths)
+
+
+def _csr(rows: np.ndarray, cols: np.ndarray, n_rows: int) -> CSR:
+    """CSR from (row, col) pairs already sorted by row."""
+    indptr = np.zeros(n_rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n_rows), out=indptr[1:])
+    return CSR(indptr, cols.astype(np.int32))
+
+
+class Relationship(NamedTuple):
+    start: str
+    end: str
+    out: CSR  # start id -> end ids
+    in_: CSR  # end id -> start ids
+
+    @property
+    def count(self) -> int:
+        return len(self.out.indices)
+
+
+class CSRGraph:
+    """Read-only graph of interned nodes and per-type CSR adjacency."""
+
+    def __init__(self, keys: dict[str, pd.Index], relationships: dict[str, Relationship]):
+        self.keys = keys  # key -> id (hash lookup)
+        self.names = {label: index.to_numpy(dtype=object) for label, index in keys.items()}  # id -> key
+        self.relationships = relationships
+        self.labels = list(keys)
+
+    @classmethod
+    def from_pairs(
+        cls,
+        keys: dict[str, pd.Index],
+        pairs: dict[str, tuple[np.ndarray, np.ndarray]],
+        relationships: dict[str, tuple[str, str]] = RELATIONSHIPS,
+    ) -> "CSRGraph":
+        """keys: label -> unique keys; pairs: type -> (start keys, end keys), repeats allowed."""
+        built = {}
+        for rel, (start, end) in relationships.items():
+            starts, ends = pairs[rel]
+            s = keys[start].get_indexer(starts)
+            e = keys[end].get_indexer(ends)
+            known = (s >= 0) & (e >= 0)
+            n_start, n_end = len(keys[start]), max(len(keys[end]), 1)
+            # Unique (start, end) pairs sorted by start: MERGE semantics and CSR order in one step
+            combined = np.unique(s[known].astype(np.int64) * n_end + e[known])
+            s, e = combined // n_end, combined % n_end
+            order = np.argsort(e, kind="stable")
+            built[rel] = Relationship(
+                start, end, _csr(s, e, n_start), _csr(e[order], s[order], len(keys[end]))
+            )
+        return cls(keys, built)
+
+    @classmethod
+    def from_employee_csv(cls, file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE * 10) -> "CSRGraph":
+        """Load the employee CSV; rows that fail validation are left out, as in ingest."""
+        names, departments, positions = [], [], []
+        for chunk in read_employee_chunks(file_path, chunk_size):
+            frame, _ = clean_employee_columns(chunk)
+            names.append(frame["name"].to_numpy(dtype=object))
+            departments.append(frame["department"].to_numpy(dtype=object))
+            positions.append(frame["position"].to_numpy(dtype=object))
+
+        def _join(parts: list[np.ndarray]) -> np.ndarray:
+            return np.concatenate(parts) if parts else np.empty(0, dtype=object)
+
+        employee, department, position = _join(names), _join(departments), _join(positions)
+        keys = {
+            "Employee": pd.Index(pd.unique(employee)),
+            "Department": pd.Index(pd.unique(department)),
+            "Position": pd.Index(pd.unique(position)),
+        }
+        pairs = {"WORKS_IN": (employee, department), "HAS_ROLE": (employee, position)}
+        return cls.from_pairs(keys, pairs)
+
+    @classmethod
+    def from_neo4j(
+        cls,
+        db: Neo4jConnection,
+        node_keys: dict[str, str] = NODE_KEYS,
+        relationships: dict[str, tuple[str, str]] = RELATIONSHIPS,
+    ) -> "CSRGraph":
+        """Snapshot the database: one read per label and per relationship type.
+
+        Nodes without a key property are left out.
+        """
+        keys = {}
+        pairs = {}
+        with db.session() as session:
+            for label, prop in node_keys.items():
+                frame = session.run(
+                    f"MATCH (n:{label}) WHERE n.{prop} IS NOT NULL RETURN n.{prop} AS key"
+                ).to_df()
+                keys[label] = pd.Index(frame["key"].unique() if len(frame) else [], dtype=object)
+            for rel, (start, end) in relationships.items():
+                frame = session.run(
+                    f"MATCH (a:{start})-[:{rel}]->(b:{end}) "
+                    f"RETURN a.{node_keys[start]} AS start, b.{node_keys[end]} AS end"
+                ).to_df()
+                if not len(frame):
+                    frame = pd.DataFrame({"start": [], "end": []}, dtype=object)
+                pairs[rel] = (frame["start"].to_numpy(), frame["end"].to_numpy())
+        return cls.from_pairs(keys, pairs, relationships)
+
+    # ----- Lookups -----
+
+    def node_id(self, label: str, key: str) -> int:
+        """Interned id of a node; KeyError for an unknown label or key."""
+        return self.keys[label].get_loc(key)
+
+    def key(self, label: str, node: int) -> str:
+        return self.names[label][node]
+
+    def _types(self, types: list[str] | None) -> dict[str, Relationship]:
+        return self.relationships if types is None else {t: self.relationships[t] for t in types}
+
+    def expand(
+        self, label: str, ids: np.ndarray, types: list[str] | None = None, direction: str = BOTH
+    ) -> Iterator[tuple[str, np.ndarray, np.ndarray]]:
+        """One hop from the nodes `ids` of `label`: yields (neighbour label, neighbour ids, owner ids)."""
+        for rel in self._types(types).values():
+            if rel.start == label and direction != IN:
+                neighbours, owners = rel.out.gather(ids)
+                if len(neighbours):
+                    yield rel.end, neighbours, owners
+            if rel.end == label and direction != OUT:
+                neighbours, owners = rel.in_.gather(ids)
+                if len(neighbours):
+                    yield rel.start, neighbours, owners
+
+    def neighbors(
+        self, label: str, key: str, types: list[str] | None = None, direction: str = BOTH
+    ) -> list[tuple[str, str]]:
+        """Distinct neighbours of one node as (label, key) pairs."""
+        ids = np.array([self.node_id(label, key)])
+        found = []
+        for other, neighbours, _ in self.expand(label, ids, types, direction):
+            found += [(other, k) for k in self.names[other][np.unique(neighbours)].tolist()]
+        return list(dict.fromkeys(found))
+
+    def degree(self, label: str, key: str, types: list[str] | None = None, direction: str = BOTH) -> int:
+        node = self.node_id(label, key)
+        total = 0
+        for rel in self._types(types).values():
+            if rel.start == label and direction != IN:
+                total += int(rel.out.indptr[node + 1] - rel.out.indptr[node])
+            if rel.end == label and direction != OUT:
+                total += int(rel.in_.indptr[node + 1] - rel.in_.indptr[node])
+        return total
+
+    def degrees(self, label: str, types: list[str] | None = None, direction: str = BOTH) -> np.ndarray:
+        """Degree of every node of `label`, as an int64 array indexed by node id."""
+        total = np.zeros(len(self.keys[label]), dtype=np.int64)
+        for rel in self._types(types).values():
+            if rel.start == label and direction != IN:
+                total += np.diff(rel.out.indptr)
+            if rel.end == label and direction != OUT:
+                total += np.diff(rel.in_.indptr)
+        return total
+
+    def top_degrees(
+        self, label: str, types: list[str] | None = None, direction: str = BOTH, limit: int = 10
+    ) -> list[tuple[str, int]]:
+        counts = self.degrees(label, types, direction)
+        top = np.argsort(-counts, kind="stable")[:limit]
+        return list(zip(self.names[label][top].tolist(), counts[top].tolist()))
+
+    # ----- Traversals -----
+
+    def k_hop(
+        self, label: str, key: str, k: int, types: list[str] | None = None, direction: str = BOTH
+    ) -> dict[str, list[str]]:
+        """Nodes reachable in 1..k hops (not the start node), as label -> list of keys."""
+        start = self.node_id(label, key)
+        seen = {name: np.zeros(len(index), dtype=bool) for name, index in self.keys.items()}
+        seen[label][start] = True
+        frontier = {label: np.array([start])}
+        for _ in range(k):
+            reached: dict[str, list[np.ndarray]] = {}
+            for current, ids in frontier.items():
+                for other, neighbours, _ in self.expand(current, ids, types, direction):
+                    reached.setdefault(other, []).append(neighbours)
+            frontier = {}
+            for other, parts in reached.items():
+                ids = np.unique(np.concatenate(parts))
+                ids = ids[~seen[other][ids]]
+                if len(ids):
+                    seen[other][ids] = True
+                    frontier[other] = ids
+            if not frontier:
+                break
+        seen[label][start] = False
+        return {name: self.names[name][mask].tolist() for name, mask in seen.items() if mask.any()}
+
+    def shortest_path(
+        self,
+        start: tuple[str, str],
+        end: tuple[str, str],
+        types: list[str] | None = None,
+        direction: str = BOTH,
+        max_hops: int | None = None,
+    ) -> list[tuple[str, str]] | None:
+        """Bidirectional BFS; the path as a list of (label, key) from start to end, or None."""
+        codes = {name: i for i, name in enumerate(self.labels)}
+        source = (start[0], self.node_id(*start))
+        target = (end[0], self.node_id(*end))
+        if source == target:
+            return [start]
+        reverse = {OUT: IN, IN: OUT, BOTH: BOTH}[direction]
+        # Per side and label: parent id + 1 (0 = not reached) and parent label code; np.zeros is lazy
+        sides = []
+        for (label, node), side_direction in ((source, direction), (target, reverse)):
+            parents = {name: np.zeros(len(index), dtype=np.int64) for name, index in self.keys.items()}
+            parent_labels = {name: np.zeros(len(index), dtype=np.int8) for name, index in self.keys.items()}
+            parents[label][node] = node + 1
+            parent_labels[label][node] = codes[label]
+            sides.append({
+                "parents": parents,
+                "labels": parent_labels,
+                "frontier": {label: np.array([node])},
+                "direction": side_direction,
+                "root": (label, node),
+            })
+
+        hops = 0
+        while all(side["frontier"] for side in sides) and (max_hops is None or hops < max_hops):
+            # Grow the smaller frontier by one level
+            side, other = sorted(sides, key=lambda s: sum(len(ids) for ids in s["frontier"].values()))
+            hops += 1
+            meet = None
+            frontier: dict[str, list[np.ndarray]] = {}
+            for current, ids in side["frontier"].items():
+                for label, neighbours, owners in self.expand(current, ids, types, side["direction"]):
+                    fresh = side["parents"][label][neighbours] == 0
+                    neighbours, owners = neighbours[fresh], owners[fresh]
+                    if not len(neighbours):
+                        continue
+                    neighbours, first = np.unique(neighbours, return_index=True)
+                    side["parents"][label][neighbours] = owners[first] + 1
+                    side["labels"][label][neighbours] = codes[current]
+                    frontier.setdefault(label, []).append(neighbours)
+                    if meet is None:
+                        hit = np.flatnonzero(other["parents"][label][neighbours])
+                        if len(hit):
+                            meet = (label, int(neighbours[hit[0]]))
+            if meet is not None:
+                forward, backward = (side, other) if side is sides[0] else (other, side)
+                path = self._walk(forward, meet)[::-1] + self._walk(backward, meet)[1:]
+                return [(label, self.names[label][node]) for label, node in path]
+            side["frontier"] = {label: np.concatenate(parts) for label, parts in frontier.items()}
+        return None
+
+    def _walk(self, side: dict, node: tuple[str, int]) -> list[tuple[str, int]]:
+        """Parent links from node back to the side's root."""
+        path = [node]
+        while node != side["root"]:
+            label, i = node
+            node = (self.labels[side["labels"][label][i]], int(side["parents"][label][i]) - 1)
+            path.append(node)
+        return path
+
+    # ----- Size -----
+
+    def nbytes(self) -> int:
+        """Array bytes (CSR + id -> key pointers); the key strings and hash tables are extra."""
+        total = sum(names.nbytes for names in self.names.values())
+        for rel in self.relationships.values():
+            total += sum(a.nbytes for a in (rel.out.indptr, rel.out.indices, rel.in_.indptr, rel.in_.indices))
+        return total
+
+    def summary(self) -> str:
+        nodes = ", ".join(f"{len(index)} {label}" for label, index in self.keys.items())
+        rels = ", ".join(f"{rel.count} {name}" for name, rel in self.relationships.items())
+        return f"{nodes}; {rels}; {self.nbytes() / 2**20:.1f} MB arrays"
+
+
+def _time_us(fn: Callable[[], object], repeat: int = 200) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load the employee graph into CSR arrays and time sample lookups.")
+    parser.add_argument("csv", nargs="?", help="employee CSV; omit to snapshot the database from .env")
+    args = parser.parse_args()
+    start = time.perf_counter()
+    graph = CSRGraph.from_employee_csv(args.csv) if args.csv else CSRGraph.from_neo4j(Neo4jConnection())
+    print(f"Loaded in {time.perf_counter() - start:.2f}s: {graph.summary()}")
+    employees = graph.names["Employee"]
+    if len(employees) < 2:
+        return
+
+    first, last = employees[0], employees[-1]
+    department, _ = graph.top_degrees("Department", limit=1)[0]
+    checks = {
+        f"neighbors({first!r})": lambda: graph.neighbors("Employee", first),
+        f"degree({department!r})": lambda: graph.degree("Department", department),
+        "top_degrees(Position)": lambda: graph.top_degrees("Position"),
+        f"shortest_path({first!r}, {last!r})": lambda: graph.shortest_path(("Employee", first), ("Employee", last)),
+    }
+    for name, fn in checks.items():
+        print(f"  {name}: {_time_us(fn, repeat=20):.0f} us")
+    print(f"  path: {graph.shortest_path(('Employee', first), ('Employee', last))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Index advisor: turn the logged ask_graph workload into ranked CREATE INDEX statements.
+
+Each logged query is parsed for the predicates an index can serve, grouped by the label bound to
+the variable:
+    equality  e.age = 30, e.gender IN [...], (e:Employee {gender: 'Male'})   -> range index
+    range     e.salary > 50000, 30 <= e.age                                  -> range index
+    prefix    e.name STARTS WITH 'A'                                         -> range index
+    order     ORDER BY e.salary                                              -> range index
+    text      e.name CONTAINS 'son', e.name ENDS WITH 'x'                    -> text index
+Two or more equality/range properties on one variable also make a composite candidate.
+
+Candidates already covered by a constraint or existing index are skipped. With a database, each
+distinct query is EXPLAINed: a candidate's cost is the estimated rows of the label scans it could
+replace, summed over every logged execution, so frequent queries on large labels rank first.
+Offline, candidates are ranked by how many logged executions use them.
+"""
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+
+RANGE_KINDS = ("equality", "range", "prefix", "order")
+
+_STRING_RE = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NODE_RE = re.compile(r"\(\s*(\w+)\s*((?::\s*`?\w+`?\s*)+)(\{[^}]*\})?")
+_MAP_KEY_RE = re.compile(r"(\w+)\s*:")
+_PROPERTY = r"(\w+)\.(\w+)"
+_OPERATOR = r"(<=|>=|<>|=~|=|<|>|STARTS\s+WITH|ENDS\s+WITH|CONTAINS|IN\b)"
+_PREDICATE_RE = re.compile(rf"{_PROPERTY}\s*{_OPERATOR}", re.IGNORECASE)
+_REVERSED_RE = re.compile(rf"(?<![\w.])(\?|\$\w+|-?\d+(?:\.\d+)?)\s*(<=|>=|<|>|=)\s*{_PROPERTY}")
+_ORDER_BY_RE = re.compile(r"\bORDER\s+BY\s+(.*?)(?=\bSKIP\b|\bLIMIT\b|\bRETURN\b|\bWITH\b|\bUNION\b|$)",
+                          re.IGNORECASE | re.DOTALL)
+_CONSTRAINT_RE = re.compile(r"FOR\s*\(\s*\w+\s*:\s*(\w+)\s*\)\s*REQUIRE\s*\w+\.(\w+)", re.IGNORECASE)
+_SCAN_OPERATORS = ("NodeByLabelScan", "AllNodesScan")
+
+
+def _kind(operator: str) -> str | None:
+    op = " ".join(operator.upper().split())
+    if op in ("=", "IN"):
+        return "equality"
+    if op in ("<", ">", "<=", ">="):
+        return "range"
+    if op == "STARTS WITH":
+        return "prefix"
+    if op in ("ENDS WITH", "CONTAINS"):
+        return "text"
+    return None  # <> and =~ cannot use an index
+
+
+def variable_labels(cypher: str) -> dict[str, str]:
+    """Map each node variable to its first label, e.g. (e:Employee) -> {"e": "Employee"}."""
+    labels: dict[str, str] = {}
+    for m in _NODE_RE.finditer(_STRING_RE.sub("?", cypher)):
+        label = m.group(2).split(":")[1].strip().strip("`")
+        labels.setdefault(m.group(1), label)
+    return labels
+
+
+def extract_predicates(cypher: str) -> set[tuple[str, str, str]]:
+    """Return {(label, property, kind)} for the index-usable predicates in one query."""
+    text = _STRING_RE.sub("?", cypher)
+    labels = variable_labels(cypher)
+    found: set[tuple[str, str, str]] = set()
+
+    def _add(var: str, prop: str, kind: str | None) -> None:
+        if kind and var in labels:
+            found.add((labels[var], prop, kind))
+
+    for m in _NODE_RE.finditer(text):
+        if m.group(3):
+            for key in _MAP_KEY_RE.findall(m.group(3)):
+                _add(m.group(1), key, "equality")
+    for m in _PREDICATE_RE.finditer(text):
+        _add(m.group(1), m.group(2), _kind(m.group(3)))
+    for m in _REVERSED_RE.finditer(text):
+        _add(m.group(3), m.group(4), _kind(m.group(2)))
+    for m in _ORDER_BY_RE.finditer(text):
+        for var, prop in re.findall(_PROPERTY, m.group(1)):
+            _add(var, prop, "order")
+    return found
+
+
+def query_candidates(cypher: str) -> set[tuple[str, str, tuple[str, ...]]]:
+    """Index candidates one query could use: {(index type, label, properties)}."""
+    predicates = extract_predicates(cypher)
+    candidates: set[tuple[str, str, tuple[str, ...]]] = set()
+    by_label: dict[str, dict[str, str]] = defaultdict(dict)
+    for label, prop, kind in predicates:
+        if kind == "text":
+            candidates.add(("text", label, (prop,)))
+            continue
+        candidates.add(("range", label, (prop,)))
+        if kind in ("equality", "range"):
+            # equality before range: a composite index is only used up to its first range column
+            current = by_label[label].get(prop)
+            by_label[label][prop] = "equality" if "equality" in (kind, current) else kind
+    for label, props in by_label.items():
+        if len(props) >= 2:
+            ordered = sorted(props, key=lambda p: (props[p] != "equality", p))
+            candidates.add(("range", label, tuple(ordered[:3])))
+    return candidates
+
+
+def covered_by_constraints(constraints: list[str]) -> set[tuple[str, str, tuple[str, ...]]]:
+    """Uniqueness constraints are backed by range indexes; parse them from CREATE_CONSTRAINTS."""
+    return {("range", label, (prop,)) for c in constraints for label, prop in _CONSTRAINT_RE.findall(c)}
+
+
+def scan_rows(plan: dict | None, labels: dict[str, str]) -> dict[str, float]:
+    """Estimated rows of each label scanned in an EXPLAIN plan: {label: rows}."""
+    rows: dict[str, float] = {}
+    stack = [plan] if plan else []
+    while stack:
+        op = stack.pop()
+        stack.extend(op.get("children", []))
+        operator = op.get("operatorType", "")
+        if not operator.startswith(_SCAN_OPERATORS):
+            continue
+        args = op.get("args", {})
+        details = str(args.get("Details", ""))
+        if ":" in details:
+            var, label = (part.strip() for part in details.split(":", 1))
+        else:
+            var, label = details.strip(), labels.get(details.strip())
+        label = label or labels.get(var)
+        if label:
+            rows[label] = max(rows.get(label, 0.0), float(args.get("EstimatedRows", 0.0)))
+    return rows
+
+
+@dataclass
+class Recommendation:
+    index_type: str
+    label: str
+    properties: tuple[str, ...]
+    uses: int = 0
+    cost: float = 0.0
+    examples: list[str] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        suffix = "_text" if self.index_type == "text" else ""
+        return f"{self.label.lower()}_{'_'.join(self.properties)}{suffix}"
+
+    @property
+    def statement(self) -> str:
+        keyword = "CREATE TEXT INDEX" if self.index_type == "text" else "CREATE INDEX"
+        props = ", ".join(f"n.{p}" for p in self.properties)
+        return f"{keyword} {self.name} IF NOT EXISTS FOR (n:{self.label}) ON ({props})"
+
+
+def recommend(
+    entries: list[dict],
+    covered: set[tuple[str, str, tuple[str, ...]]],
+    explain=None,
+    min_uses: int = 1,
+) -> list[Recommendation]:
+    """Rank index candidates for logged entries ({"query", "params"}).
+
+    explain(query, params) -> plan dict is optional; with it, candidates are scored by the label-scan
+    rows they would replace and candidates whose label is never scanned are dropped.
+    """
+    counts = Counter(entry["query"] for entry in entries)
+    params = {entry["query"]: entry.get("params") or {} for entry in entries}
+    recs: dict[tuple[str, str, tuple[str, ...]], Recommendation] = {}
+    for query, n in counts.items():
+        candidates = query_candidates(query) - covered
+        if not candidates:
+            continue
+        scans = None
+        if explain is not None:
+            try:
+                scans = scan_rows(explain(query, params[query]), variable_labels(query))
+            except Exception as e:
+                print(f"EXPLAIN failed, counting uses only: {e}")
+        for key in candidates:
+            rec = recs.setdefault(key, Recommendation(*key))
+            rec.uses += n
+            rec.cost += n * (scans.get(key[1], 0.0) if scans is not None else 1.0)
+            if len(rec.examples) < 3:
+                rec.examples.append(" ".join(query.split()))
+    ranked = [r for r in recs.values() if r.uses >= min_uses and (explain is None or r.cost > 0)]
+    ranked.sort(key=lambda r: (-r.cost, -r.uses, r.name))
+    return ranked
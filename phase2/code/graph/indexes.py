@@ -0,0 +1,3 @@
+# Indexes recommended by scripts/advise_indexes.py from the ask_graph query log.
+# Regenerate with: python scripts/advise_indexes.py --write   (ingest creates them after CREATE_CONSTRAINTS)
+CREATE_INDEXES = []
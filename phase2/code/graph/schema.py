@@ -1,3 +1,5 @@
+from graph.indexes import CREATE_INDEXES  # noqa: F401  (generated; run after CREATE_CONSTRAINTS)
+
 CREATE_CONSTRAINTS=["""
 CREATE CONSTRAINT employee_name IF NOT EXISTS
 FOR (e:Employee) REQUIRE e.name IS UNIQUE
@@ -34,4 +36,106 @@ MERGE (p:Position {position: $position})
 WITH p
 MATCH (e:Employee {name: $name})
 MERGE (e)-[:HAS_ROLE]->(p)
-"""
\ No newline at end of file
+"""
+
+
+# Parallel ingest: shared nodes first, then MATCH-only batches ($rows / $pairs lists)
+UNWIND_DEPARTMENTS="""
+UNWIND $names AS name
+MERGE (:Department {department: name})
+"""
+
+UNWIND_POSITIONS="""
+UNWIND $names AS name
+MERGE (:Position {position: name})
+"""
+
+UNWIND_EMPLOYEES="""
+UNWIND $rows AS row
+MERGE (e:Employee {name: row.name})
+SET e.age = row.age,
+    e.gender = row.gender,
+    e.project_completed = row.project_completed,
+    e.productivity = row.productivity,
+    e.satisfaction_rate = row.satisfaction_rate,
+    e.feedback_score = row.feedback_score,
+    e.joining_date = row.joining_date,
+    e.salary = row.salary
+"""
+
+# $pairs: list of {employee, name}
+MATCH_WORKS_IN_RELS="""
+UNWIND $pairs AS pair
+MATCH (e:Employee {name: pair.employee})
+MATCH (d:Department {department: pair.name})
+MERGE (e)-[:WORKS_IN]->(d)
+"""
+
+MATCH_HAS_ROLE_RELS="""
+UNWIND $pairs AS pair
+MATCH (e:Employee {name: pair.employee})
+MATCH (p:Position {position: pair.name})
+MERGE (e)-[:HAS_ROLE]->(p)
+"""
+
+
+# Incremental ingest (ingest/incremental.py): $rows of EmployeeModel dicts, Department/Position MERGEd inline
+UNWIND_WORKS_IN_RELS="""
+UNWIND $rows AS row
+MERGE (d:Department {department: row.department})
+WITH d, row
+MATCH (e:Employee {name: row.name})
+MERGE (e)-[:WORKS_IN]->(d)
+"""
+
+UNWIND_HAS_ROLE_RELS="""
+UNWIND $rows AS row
+MERGE (p:Position {position: row.position})
+WITH p, row
+MATCH (e:Employee {name: row.name})
+MERGE (e)-[:HAS_ROLE]->(p)
+"""
+
+# Before a changed employee is re-written: drop the department/position links its new row no longer has.
+# Each returns the names it unlinked, for the orphan check below
+PRUNE_WORKS_IN_RELS="""
+UNWIND $rows AS row
+MATCH (e:Employee {name: row.name})-[r:WORKS_IN]->(d:Department)
+WHERE d.department <> row.department
+DELETE r
+RETURN DISTINCT d.department AS name
+"""
+
+PRUNE_HAS_ROLE_RELS="""
+UNWIND $rows AS row
+MATCH (e:Employee {name: row.name})-[r:HAS_ROLE]->(p:Position)
+WHERE p.position <> row.position
+DELETE r
+RETURN DISTINCT p.position AS name
+"""
+
+# $names: employees no longer in the CSV. Returns the departments/positions they were linked to
+DELETE_EMPLOYEES="""
+UNWIND $names AS name
+MATCH (e:Employee {name: name})
+WITH e, [(e)-[:WORKS_IN]->(d:Department) | d.department] AS departments,
+     [(e)-[:HAS_ROLE]->(p:Position) | p.position] AS positions
+DETACH DELETE e
+RETURN departments, positions
+"""
+
+# $names: departments/positions unlinked above; deleted if nothing links to them any more.
+# Only these are checked, so the cost follows the change, not the size of the labels
+DELETE_ORPHAN_DEPARTMENTS="""
+UNWIND $names AS name
+MATCH (d:Department {department: name})
+WHERE NOT EXISTS { (d)--() }
+DELETE d
+"""
+
+DELETE_ORPHAN_POSITIONS="""
+UNWIND $names AS name
+MATCH (p:Position {position: name})
+WHERE NOT EXISTS { (p)--() }
+DELETE p
+"""
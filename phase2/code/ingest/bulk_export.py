@@ -0,0 +1,173 @@
+"""Offline bulk-import export: employee CSV -> node/relationship CSVs for `neo4j-admin database import`.
+
+For a first load into an empty database. The importer writes the store files directly (no
+transactions, no MERGE), which is minutes instead of hours for millions of rows.
+
+1. Rows go through the same validation as ingest (csv_stream.clean_employee_columns), column-wise
+   per chunk. Employees keep their name as import ID; the first row wins for a repeated name.
+2. Department and Position names are interned in memory: each distinct name gets one integer ID,
+   in order of first appearance, so the same CSV always exports the same IDs.
+3. After the import, start the database and create graph/schema.py's constraints and indexes.
+
+Files are streamed chunk by chunk; only the name -> ID maps and the set of employee names stay in
+memory. Usage (from phase2/code):
+
+    python -m ingest.bulk_export export ../data/employee.csv import/
+    neo4j-admin database import full ... neo4j      # database stopped; the command is printed above
+    python -m ingest.bulk_export constraints        # database running
+"""
+import argparse
+import shlex
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from core.config import settings
+from db.connection import Neo4jConnection
+from db.graph_version import bump_graph_version
+from graph import schema
+from ingest.csv_stream import clean_employee_columns, read_employee_chunks
+
+EXPORT_CHUNK_SIZE = 100_000
+
+# label / relationship type -> (file name, header); property columns follow EmployeeModel
+NODE_FILES = {
+    "Employee": ("employees.csv", [
+        "name:ID(Employee)", "age:int", "gender", "project_completed:int", "productivity:float",
+        "satisfaction_rate:float", "feedback_score:float", "joining_date", "salary:int",
+    ]),
+    "Department": ("departments.csv", [":ID(Department)", "department"]),
+    "Position": ("positions.csv", [":ID(Position)", "position"]),
+}
+RELATIONSHIP_FILES = {
+    "WORKS_IN": ("works_in.csv", [":START_ID(Employee)", ":END_ID(Department)"]),
+    "HAS_ROLE": ("has_role.csv", [":START_ID(Employee)", ":END_ID(Position)"]),
+}
+EMPLOYEE_COLUMNS = [
+    "name", "age", "gender", "project_completed", "productivity",
+    "satisfaction_rate", "feedback_score", "joining_date", "salary",
+]
+
+
+class Interner:
+    """Name -> stable integer ID (order of first appearance), looked up a chunk at a time."""
+
+    def __init__(self):
+        self.names = pd.Index([], dtype=object)
+
+    def __call__(self, names: pd.Series):
+        ids = self.names.get_indexer(names)
+        new = names[ids < 0].unique()
+        if len(new):
+            self.names = self.names.append(pd.Index(new))
+            ids = self.names.get_indexer(names)
+        return ids
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def import_command(out_dir: Path, database: str) -> str:
+    """The neo4j-admin command that loads the files written by export_employees."""
+    args = ["neo4j-admin", "database", "import", "full", "--overwrite-destination"]
+    args += [f"--nodes={label}={out_dir / name}" for label, (name, _) in NODE_FILES.items()]
+    args += [f"--relationships={rel}={out_dir / name}" for rel, (name, _) in RELATIONSHIP_FILES.items()]
+    args.append(database)
+    return " ".join(shlex.quote(str(a)) for a in args)
+
+
+def export_employees(
+    file_path: str, out_dir: str | Path, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> dict[str, int]:
+    """Write import CSVs for the employee CSV into out_dir; returns counts per label / relationship type."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    departments, positions = Interner(), Interner()
+    employees: set[str] = set()
+    counts = dict.fromkeys([*NODE_FILES, *RELATIONSHIP_FILES], 0)
+    skipped = dropped = 0
+
+    specs = {**NODE_FILES, **RELATIONSHIP_FILES}
+    files = {key: (out_dir / name).open("w", newline="", encoding="utf-8") for key, (name, _) in specs.items()}
+    try:
+        for key, (_, header) in specs.items():
+            files[key].write(",".join(header) + "\n")
+
+        for chunk in read_employee_chunks(file_path, chunk_size):
+            frame, invalid = clean_employee_columns(chunk)
+            dropped += invalid
+            # First row wins for a repeated name, in this chunk or an earlier one
+            first = []
+            for name in frame["name"].tolist():
+                first.append(name not in employees)
+                employees.add(name)
+            skipped += len(first) - sum(first)
+            frame = frame[first]
+            if frame.empty:
+                continue
+
+            frame[EMPLOYEE_COLUMNS].to_csv(files["Employee"], header=False, index=False)
+            pd.DataFrame({"name": frame["name"], "department": departments(frame["department"])}).to_csv(
+                files["WORKS_IN"], header=False, index=False
+            )
+            pd.DataFrame({"name": frame["name"], "position": positions(frame["position"])}).to_csv(
+                files["HAS_ROLE"], header=False, index=False
+            )
+            counts["Employee"] += len(frame)
+            counts["WORKS_IN"] += len(frame)
+            counts["HAS_ROLE"] += len(frame)
+
+        for label, interner in (("Department", departments), ("Position", positions)):
+            pd.DataFrame({"id": range(len(interner)), "name": interner.names}).to_csv(
+                files[label], header=False, index=False
+            )
+            counts[label] = len(interner)
+    finally:
+        for f in files.values():
+            f.close()
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"Exported {counts['Employee']} employees, {counts['Department']} departments, "
+        f"{counts['Position']} positions, {counts['WORKS_IN'] + counts['HAS_ROLE']} relationships "
+        f"in {elapsed:.2f}s -> {out_dir}"
+    )
+    if dropped:
+        print(f"Validation failed: {dropped} rows skipped")
+    if skipped:
+        print(f"Skipped {skipped} rows with a repeated name")
+    print("Stop the database, then run:")
+    print("  " + import_command(out_dir, settings.neo4j_db))
+    return counts
+
+
+def apply_constraints() -> None:
+    """After the import, with the database running: same constraints and indexes as the MERGE ingest."""
+    db = Neo4jConnection()
+    statements = schema.CREATE_CONSTRAINTS + schema.CREATE_INDEXES
+    for statement in statements:
+        db.execute(statement)
+    bump_graph_version()
+    db.close()
+    print(f"Applied {len(statements)} constraints and indexes")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export the employee CSV for neo4j-admin database import.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    export = sub.add_parser("export", help="Write node/relationship CSVs and print the import command")
+    export.add_argument("csv")
+    export.add_argument("out_dir")
+    export.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE)
+    sub.add_parser("constraints", help="Create graph/schema.py constraints and indexes after the import")
+    args = parser.parse_args()
+    if args.command == "export":
+        export_employees(args.csv, args.out_dir, chunk_size=args.chunk_size)
+    else:
+        apply_constraints()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Stream employee CSV in chunks and validate each chunk with vectorized pandas.
+
+Applies EmployeeModel's field types column-wise (CSV_TO_MODEL renames, NaN handling, int/float
+coercion) instead of iterrows + EmployeeModel per row. Batches are lists of dicts shaped like
+EmployeeModel.model_dump(), ready for the Cypher templates in graph/schema.py.
+"""
+from typing import Iterator
+
+import pandas as pd
+
+from models.employee import EmployeeModel
+
+# Map CSV column headers to EmployeeModel field names
+CSV_TO_MODEL = {
+    "Name": "name",
+    "Age": "age",
+    "Gender": "gender",
+    "Projects Completed": "project_completed",
+    "Productivity (%)": "productivity",
+    "Satisfaction Rate (%)": "satisfaction_rate",
+    "Feedback Score": "feedback_score",
+    "Department": "department",
+    "Position": "position",
+    "Joining Date": "joining_date",
+    "Salary": "salary",
+}
+
+STR_FIELDS = ["name", "gender", "department", "position", "joining_date"]
+INT_FIELDS = ["age", "project_completed", "salary"]
+FLOAT_FIELDS = ["productivity", "satisfaction_rate", "feedback_score"]
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def clean_employee_columns(df: pd.DataFrame) -> tuple[pd.DataFrame, int]:
+    """Validate one renamed chunk column-wise.
+
+    Returns (valid rows as a DataFrame of EmployeeModel fields, rows dropped). The int fields are
+    int64 and missing floats stay NaN; ingest/bulk_export.py writes these columns as they are.
+    """
+    valid = df[STR_FIELDS].notna().all(axis=1)
+    columns = {field: df[field] for field in STR_FIELDS}
+    for field in INT_FIELDS:
+        numeric = pd.to_numeric(df[field], errors="coerce")
+        valid &= numeric.notna() & (numeric % 1 == 0)
+        columns[field] = numeric
+    for field in FLOAT_FIELDS:
+        # Missing floats stay NaN (EmployeeModel accepts them); unparseable text is invalid
+        numeric = pd.to_numeric(df[field], errors="coerce").astype(float)
+        valid &= numeric.notna() | df[field].isna()
+        columns[field] = numeric
+
+    frame = pd.DataFrame({field: columns[field][valid] for field in EmployeeModel.model_fields})
+    for field in INT_FIELDS:
+        frame[field] = frame[field].astype("int64")
+    return frame, int((~valid).sum())
+
+
+def employee_rows(frame: pd.DataFrame) -> list[dict]:
+    """EmployeeModel dicts of a clean_employee_columns frame, in frame order."""
+    fields = list(EmployeeModel.model_fields)
+    return [dict(zip(fields, values)) for values in zip(*(frame[field].tolist() for field in fields))]
+
+
+def clean_employee_frame(df: pd.DataFrame) -> tuple[list[dict], int]:
+    """Validate one renamed chunk. Returns (valid rows as EmployeeModel dicts, rows dropped)."""
+    frame, dropped = clean_employee_columns(df)
+    return employee_rows(frame), dropped
+
+
+def read_employee_chunks(
+    file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, text_only: bool = False
+) -> Iterator[pd.DataFrame]:
+    """Raw CSV chunks with columns renamed to EmployeeModel fields, ready for clean_employee_frame.
+
+    text_only reads the numeric columns as text too, so row fingerprints (ingest/manifest.py) do
+    not depend on the dtype pandas infers for each chunk.
+    """
+    text_columns = {csv: str for csv, field in CSV_TO_MODEL.items() if field in STR_FIELDS}
+    for chunk in pd.read_csv(file_path, chunksize=chunk_size, dtype=str if text_only else text_columns):
+        yield chunk.rename(columns=CSV_TO_MODEL)
+
+
+def iter_employee_batches(
+    file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[list[dict]]:
+    """Yield validated batches (EmployeeModel dicts) of at most chunk_size rows."""
+    for chunk in read_employee_chunks(file_path, chunk_size):
+        rows, dropped = clean_employee_frame(chunk)
+        if dropped:
+            print(f"Validation failed: {dropped} rows skipped")
+        if rows:
+            yield rows
@@ -0,0 +1,161 @@
+"""Incremental employee ingest: write only rows that are new or changed since the last run.
+
+1. Every CSV row is fingerprinted from its text (vectorized) and compared with the manifest
+   (ingest/manifest.py, keyed by employee name). Unchanged rows are skipped before validation.
+2. New and changed rows are validated and written in UNWIND batches. For a changed employee, a
+   WORKS_IN / HAS_ROLE link to a department or position the new row no longer names is deleted in
+   the same transaction. A row's fingerprint is recorded only once its batch is written; an
+   invalid row keeps its previous entry (the graph still holds that version), so it is retried.
+3. Employees that left the CSV are reported, or DETACH DELETEd with delete_missing. Departments
+   and positions unlinked by steps 2 and 3 are then removed if nothing else links to them.
+
+An unchanged file never opens a connection. The manifest describes what this module wrote:
+delete it if the database is reset or edited by other means, and the next run rewrites every row.
+"""
+import time
+
+from db.connection import Neo4jConnection
+from db.graph_version import bump_graph_version
+from graph import schema
+from ingest.csv_stream import DEFAULT_CHUNK_SIZE, clean_employee_columns, employee_rows, read_employee_chunks
+from ingest.manifest import RowManifest, row_fingerprints
+from models.employee import EmployeeModel
+
+DEFAULT_BATCH_SIZE = 500
+KEY = "name"
+FINGERPRINT_COLUMNS = list(EmployeeModel.model_fields)
+
+
+def _write_rows(db: Neo4jConnection, rows: list[dict], changed: list[dict]) -> tuple[list[str], list[str]]:
+    """One transaction: prune stale relationships of changed rows, then upsert all rows.
+    Returns the departments and positions that lost a link."""
+    statements = []
+    if changed:
+        statements += [
+            (schema.PRUNE_WORKS_IN_RELS, {"rows": changed}),
+            (schema.PRUNE_HAS_ROLE_RELS, {"rows": changed}),
+        ]
+    statements += [
+        (schema.UNWIND_EMPLOYEES, {"rows": rows}),
+        (schema.UNWIND_WORKS_IN_RELS, {"rows": rows}),
+        (schema.UNWIND_HAS_ROLE_RELS, {"rows": rows}),
+    ]
+    results = db.execute_batch(statements)
+    if not changed:
+        return [], []
+    return [r["name"] for r in results[0]], [r["name"] for r in results[1]]
+
+
+class _Writer:
+    """Batches rows to write; opens the connection (and creates constraints) on first use only."""
+
+    def __init__(self, batch_size: int, manifest: RowManifest):
+        self.batch_size = batch_size
+        self.manifest = manifest
+        self.existing = set(manifest.rows)  # employee names already in the graph
+        self.pending: dict[str, dict] = {}  # name -> row
+        self.fingerprints: dict[str, int] = {}  # name -> fingerprint of the pending row
+        self.unlinked: dict[str, set[str]] = {"departments": set(), "positions": set()}  # orphan candidates
+        self.db: Neo4jConnection | None = None
+
+    def connect(self) -> Neo4jConnection:
+        if self.db is None:
+            self.db = Neo4jConnection()
+            for constraint in schema.CREATE_CONSTRAINTS:
+                self.db.execute(constraint)
+            for index in schema.CREATE_INDEXES:
+                self.db.execute(index)
+        return self.db
+
+    def add(self, row: dict, fingerprint: int) -> None:
+        if row[KEY] in self.pending:
+            self.flush()  # same employee twice: write the earlier row first, so the later one wins
+        self.pending[row[KEY]] = row
+        self.fingerprints[row[KEY]] = fingerprint
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        rows = list(self.pending.values())
+        departments, positions = _write_rows(self.connect(), rows, [row for row in rows if row[KEY] in self.existing])
+        self.unlinked["departments"].update(departments)
+        self.unlinked["positions"].update(positions)
+        self.manifest.rows.update(self.fingerprints)
+        self.existing.update(self.pending)
+        self.pending, self.fingerprints = {}, {}
+
+
+def ingest_employee_incremental(
+    file_path: str,
+    batch_size: int | None = None,
+    delete_missing: bool = False,
+) -> dict[str, int]:
+    """Write only new and changed rows of the employee CSV.
+
+    Returns counts: new, changed, unchanged, invalid, missing (in the manifest, not in the CSV)
+    and deleted (missing rows removed because delete_missing is set).
+    """
+    start = time.perf_counter()
+    manifest = RowManifest()
+    previous = set(manifest.rows)
+    writer = _Writer(batch_size or DEFAULT_BATCH_SIZE, manifest)
+    counts = dict.fromkeys(("new", "changed", "unchanged", "invalid", "missing", "deleted"), 0)
+    seen: set[str] = set()
+    dirty = False
+
+    for chunk in read_employee_chunks(file_path, DEFAULT_CHUNK_SIZE, text_only=True):
+        chunk = chunk[chunk[KEY].notna()]
+        columns = [column for column in FINGERPRINT_COLUMNS if column in chunk.columns]
+        fingerprints = row_fingerprints(chunk, columns)
+        todo = []
+        for position, (key, fingerprint) in enumerate(zip(chunk[KEY].tolist(), fingerprints.tolist())):
+            seen.add(key)
+            if manifest.rows.get(key) != fingerprint:
+                todo.append(position)
+        counts["unchanged"] += len(chunk) - len(todo)
+        if not todo:
+            continue
+        dirty = True
+        frame, dropped = clean_employee_columns(chunk.iloc[todo])
+        counts["invalid"] += dropped
+        valid = fingerprints[chunk.index.get_indexer(frame.index)].tolist()
+        for row, fingerprint in zip(employee_rows(frame), valid):
+            known = row[KEY] in writer.existing or row[KEY] in writer.pending
+            counts["changed" if known else "new"] += 1
+            writer.add(row, fingerprint)
+    writer.flush()
+
+    missing = [key for key in previous if key not in seen]
+    counts["missing"] = len(missing)
+    if missing and delete_missing:
+        db = writer.connect()
+        for i in range(0, len(missing), DEFAULT_BATCH_SIZE):
+            (deleted,) = db.execute_batch([(schema.DELETE_EMPLOYEES, {"names": missing[i : i + DEFAULT_BATCH_SIZE]})])
+            for record in deleted:
+                writer.unlinked["departments"].update(record["departments"])
+                writer.unlinked["positions"].update(record["positions"])
+        for key in missing:
+            del manifest.rows[key]
+        counts["deleted"] = len(missing)
+        dirty = True
+    if writer.unlinked["departments"] or writer.unlinked["positions"]:
+        writer.db.execute_batch([
+            (schema.DELETE_ORPHAN_DEPARTMENTS, {"names": sorted(writer.unlinked["departments"])}),
+            (schema.DELETE_ORPHAN_POSITIONS, {"names": sorted(writer.unlinked["positions"])}),
+        ])
+    if writer.db is not None:
+        # Writes are committed; invalidate cached read results (db/result_cache.py)
+        bump_graph_version()
+        writer.db.close()
+    if dirty:
+        manifest.save()
+
+    kept = " (kept; delete_missing=True removes them)" if missing and not delete_missing else ""
+    print(
+        f"Incremental ingest in {time.perf_counter() - start:.2f}s: {counts['new']} new, "
+        f"{counts['changed']} changed, {counts['unchanged']} unchanged, {counts['invalid']} invalid, "
+        f"{counts['missing']} missing{kept}, {counts['deleted']} deleted"
+    )
+    return counts
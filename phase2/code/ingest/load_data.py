@@ -1,44 +1,52 @@
-import pandas as pd
+import time
+
 from db.connection import Neo4jConnection
+from db.graph_version import bump_graph_version
 from graph import schema
-from models.employee import EmployeeModel
-
-# Map CSV column headers to EmployeeModel field names
-CSV_TO_MODEL = {
-    "Name": "name",
-    "Age": "age",
-    "Gender": "gender",
-    "Projects Completed": "project_completed",
-    "Productivity (%)": "productivity",
-    "Satisfaction Rate (%)": "satisfaction_rate",
-    "Feedback Score": "feedback_score",
-    "Department": "department",
-    "Position": "position",
-    "Joining Date": "joining_date",
-    "Salary": "salary",
-}
-
-
-def ingest_employee(file_path: str):
-    df = pd.read_csv(file_path)
-    df = df.rename(columns=CSV_TO_MODEL)
+from ingest.csv_stream import iter_employee_batches
+from ingest.incremental import ingest_employee_incremental
+from ingest.parallel import ingest_employee_parallel
+
+
+def _write_employee(db: Neo4jConnection, data: dict):
+    db.execute(schema.CREATE_EMPLOYEE, data)
+    db.execute(schema.CREATE_HAS_ROLE_REL, data)
+    db.execute(schema.CREATE_WORKS_IN_REL, data)
+
+
+def ingest_employee(
+    file_path: str, workers: int | None = None, incremental: bool = False, delete_missing: bool = False
+):
+    # CSV is read and validated in chunks (see ingest/csv_stream.py; CSV_TO_MODEL lives there).
+    # With workers, writes are fanned out to a thread pool (see ingest/parallel.py).
+    # With incremental, only rows new or changed since the last incremental run are written and
+    # delete_missing removes employees no longer in the CSV (see ingest/incremental.py).
+    if incremental:
+        ingest_employee_incremental(file_path, delete_missing=delete_missing)
+        return
+
     db = Neo4jConnection()
 
     for constraint in schema.CREATE_CONSTRAINTS:
         db.execute(constraint)
-
-    for _, row in df.iterrows():
-        try:
-            employee = EmployeeModel(**row.to_dict())
-        except Exception as e:
-            print(f"Validation failed: {e}")
-            continue
-
-        data = employee.model_dump()
-        db.execute(schema.CREATE_EMPLOYEE, data)
-        db.execute(schema.CREATE_HAS_ROLE_REL, data)
-        db.execute(schema.CREATE_WORKS_IN_REL, data)
+    for index in schema.CREATE_INDEXES:
+        db.execute(index)
+
+    start = time.perf_counter()
+    count = 0
+    if workers:
+        count = ingest_employee_parallel(db, file_path, workers)
+    else:
+        for rows in iter_employee_batches(file_path):
+            for data in rows:
+                _write_employee(db, data)
+            count += len(rows)
+    elapsed = time.perf_counter() - start
+    # Writes are committed; invalidate cached read results (db/result_cache.py)
+    bump_graph_version()
+    mode = f"workers={workers}" if workers else "per-row"
+    print(f"Ingested {count} employees in {elapsed:.2f}s ({count / max(elapsed, 1e-9):.0f} rows/sec, {mode})")
 
     db.close()  
 
-    
\ No newline at end of file
+    
@@ -0,0 +1,55 @@
+"""Row fingerprint manifest for incremental ingest (ingest/incremental.py).
+
+For every ingested row it keeps key (employee name) -> 64-bit hash of the row's CSV text, so the next
+run can tell new, changed, unchanged and vanished rows apart without asking the database. On disk
+it is one compressed .npz: the keys joined by NUL as UTF-8 bytes, and the fingerprints as a uint64
+array (about 8 bytes plus the key per row).
+"""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.config import resolve_code_path, settings
+
+_SEPARATOR = "\x00"
+
+
+def manifest_path() -> Path:
+    """INGEST_MANIFEST_FILE, relative to phase2/code or absolute."""
+    return resolve_code_path(settings.ingest_manifest_file)
+
+
+def row_fingerprints(frame: pd.DataFrame, columns: list[str]) -> np.ndarray:
+    """Vectorized uint64 hash per row of the given columns (read the CSV as text first)."""
+    return pd.util.hash_pandas_object(frame[columns], index=False, categorize=False).to_numpy()
+
+
+class RowManifest:
+    """key -> fingerprint of the row last written for that key (.rows), loaded from and saved to disk."""
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or manifest_path()
+        self.rows: dict[str, int] = self._load()
+
+    def _load(self) -> dict[str, int]:
+        try:
+            with np.load(self.path) as data:
+                fingerprints = data["fingerprints"].tolist()
+                keys = data["keys"].tobytes().decode("utf-8").split(_SEPARATOR) if fingerprints else []
+        except FileNotFoundError:
+            return {}
+        return dict(zip(keys, fingerprints))
+
+    def save(self) -> None:
+        """Write the manifest (atomic replace)."""
+        keys = _SEPARATOR.join(self.rows).encode("utf-8")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with tmp.open("wb") as f:
+            np.savez_compressed(
+                f,
+                keys=np.frombuffer(keys, dtype=np.uint8),
+                fingerprints=np.fromiter(self.rows.values(), dtype=np.uint64, count=len(self.rows)),
+            )
+        tmp.replace(self.path)
@@ -1,7 +1,7 @@
 from core.config import settings
 
-from llm.base import LLMProvider
-from llm.providers import GroqProvider
+from llm.base import AsyncLLMProvider, LLMProvider
+from llm.providers import FakeProvider, GroqProvider
 
 
 
@@ -10,4 +10,14 @@ def get_llm() -> LLMProvider:
     provider = (settings.llm_provider or "groq").strip().lower()
     if provider == "groq":
         return GroqProvider()
-    raise ValueError(f"Unknown LLM_PROVIDER={settings.llm_provider}. Use groq, gemini, or add in llm/providers/.")
\ No newline at end of file
+    if provider == "fake":
+        return FakeProvider()
+    raise ValueError(f"Unknown LLM_PROVIDER={settings.llm_provider}. Use groq, fake, gemini, or add in llm/providers/.")
+
+
+def get_async_llm() -> AsyncLLMProvider:
+    """Same as get_llm(), but the provider must also implement agenerate (see llm/base.py)."""
+    llm = get_llm()
+    if not isinstance(llm, AsyncLLMProvider):
+        raise ValueError(f"LLM_PROVIDER={settings.llm_provider} has no async support (agenerate).")
+    return llm
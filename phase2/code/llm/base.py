@@ -1,4 +1,4 @@
-from typing import Protocol, runtime_checkable
+from typing import AsyncIterator, Iterator, Protocol, runtime_checkable
 
 
 @runtime_checkable
@@ -8,3 +8,29 @@ class LLMProvider(Protocol):
     def generate(self,system:str,user:str,max_tokens:int=512) -> str:
         """Generate a response from the LLM."""
         ...
+
+
+@runtime_checkable
+class AsyncLLMProvider(LLMProvider, Protocol):
+    """LLMProvider that can also generate without blocking the event loop (used by ask_graph_async)."""
+
+    async def agenerate(self,system:str,user:str,max_tokens:int=512) -> str:
+        """Generate a response from the LLM; awaits the network call instead of blocking."""
+        ...
+
+
+@runtime_checkable
+class StreamingLLMProvider(LLMProvider, Protocol):
+    """LLMProvider that yields the reply piece by piece as it arrives (used when LLM_STREAMING=true).
+
+    Both methods are generators: closing them early (close() / aclose()) must cancel the request,
+    so the pipeline can stop paying for tokens once the Cypher block is complete.
+    """
+
+    def stream(self,system:str,user:str,max_tokens:int=512) -> Iterator[str]:
+        """Yield text chunks of the response."""
+        ...
+
+    def astream(self,system:str,user:str,max_tokens:int=512) -> AsyncIterator[str]:
+        """Async generator of text chunks of the response."""
+        ...
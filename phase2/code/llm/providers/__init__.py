@@ -1,3 +1,4 @@
+from .fake import FakeProvider
 from .groq import GroqProvider
 
-__all__ = ["GroqProvider"]
\ No newline at end of file
+__all__ = ["FakeProvider", "GroqProvider"]
@@ -0,0 +1,46 @@
+import asyncio
+import re
+import time
+from typing import AsyncIterator, Iterator
+
+from core.config import settings
+
+
+class FakeProvider:
+    """Local stand-in for a real LLM: returns a fixed reply after an optional delay. No network.
+
+    Useful for exercising the pipeline (and ask_graph_async concurrency) without an API key.
+    Reply and delay come from FAKE_LLM_RESPONSE / FAKE_LLM_DELAY unless passed in. stream/astream
+    yield the reply word by word with the delay spread evenly over the pieces.
+    """
+
+    def __init__(self, response: str | None = None, delay: float | None = None):
+        self._response = response if response is not None else settings.fake_llm_response
+        self._delay = delay if delay is not None else settings.fake_llm_delay
+
+    def generate(self, system: str, user: str, max_tokens: int = 512) -> str:
+        if self._delay:
+            time.sleep(self._delay)
+        return self._response
+
+    async def agenerate(self, system: str, user: str, max_tokens: int = 512) -> str:
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        return self._response
+
+    def _pieces(self) -> list[str]:
+        return re.findall(r"\S+\s*|\s+", self._response) or [""]
+
+    def stream(self, system: str, user: str, max_tokens: int = 512) -> Iterator[str]:
+        pieces = self._pieces()
+        for piece in pieces:
+            if self._delay:
+                time.sleep(self._delay / len(pieces))
+            yield piece
+
+    async def astream(self, system: str, user: str, max_tokens: int = 512) -> AsyncIterator[str]:
+        pieces = self._pieces()
+        for piece in pieces:
+            if self._delay:
+                await asyncio.sleep(self._delay / len(pieces))
+            yield piece
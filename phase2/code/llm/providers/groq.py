@@ -1,4 +1,6 @@
-from groq import Groq
+from typing import AsyncIterator, Iterator
+
+from groq import AsyncGroq, Groq
 
 from core.config import settings
 
@@ -8,16 +10,56 @@ class GroqProvider:
         if not settings.groq_api_key or not settings.groq_model:
             raise ValueError("Set GROQ_API_KEY and GROQ_MODEL when LLM_PROVIDER=groq")
         self._client = Groq(api_key=settings.groq_api_key)
+        self._async_client = AsyncGroq(api_key=settings.groq_api_key)
         self._model = settings.groq_model
 
+    def _messages(self, system: str, user: str) -> list[dict]:
+        return [
+            {"role": "system", "content": system},
+            {"role": "user", "content": user},
+        ]
         
     def generate(self, system: str, user: str, max_tokens: int = 512) -> str:
         resp = self._client.chat.completions.create(
             model=self._model,
-            messages=[
-                {"role": "system", "content": system},
-                {"role": "user", "content": user},
-            ],
+            messages=self._messages(system, user),
+            max_tokens=max_tokens,
+        )
+        return (resp.choices[0].message.content or "").strip()
+
+    async def agenerate(self, system: str, user: str, max_tokens: int = 512) -> str:
+        resp = await self._async_client.chat.completions.create(
+            model=self._model,
+            messages=self._messages(system, user),
+            max_tokens=max_tokens,
+        )
+        return (resp.choices[0].message.content or "").strip()
+
+    def stream(self, system: str, user: str, max_tokens: int = 512) -> Iterator[str]:
+        stream = self._client.chat.completions.create(
+            model=self._model,
+            messages=self._messages(system, user),
+            max_tokens=max_tokens,
+            stream=True,
+        )
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            # Runs on early close() too: drops the HTTP response, so generation stops being billed
+            stream.close()
+
+    async def astream(self, system: str, user: str, max_tokens: int = 512) -> AsyncIterator[str]:
+        stream = await self._async_client.chat.completions.create(
+            model=self._model,
+            messages=self._messages(system, user),
             max_tokens=max_tokens,
+            stream=True,
         )
-        return (resp.choices[0].message.content or "").strip()
\ No newline at end of file
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            await stream.close()
@@ -0,0 +1,151 @@
+"""Client-side rate limiting for LLM providers: token bucket plus backoff on HTTP 429.
+
+RateLimitedProvider wraps any LLMProvider / AsyncLLMProvider. Every call first takes a token from
+a shared bucket (LLM_REQUESTS_PER_MINUTE, bursts up to LLM_BURST). If the provider still answers
+429, the bucket is paused for the backoff (Retry-After when given, else exponential with jitter),
+so the retry and every concurrent caller wait, and the call is retried up to LLM_MAX_RETRIES times.
+"""
+import asyncio
+import random
+import threading
+import time
+from typing import AsyncIterator, Iterator
+
+from core.config import settings
+from llm.base import LLMProvider
+
+
+class TokenBucket:
+    """Thread-safe token bucket. Callers reserve a token and sleep for the returned wait outside the lock."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate  # tokens per second
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1  # may go negative: that is a reservation on future refill
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for about `seconds` (used after a 429)."""
+        with self._lock:
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+
+def _retry_after(error: Exception) -> float | None:
+    """Seconds to wait if error is an HTTP 429 (None otherwise)."""
+    response = getattr(error, "response", None)
+    status = getattr(error, "status_code", None) or getattr(response, "status_code", None)
+    if status != 429:
+        return None
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after", 0))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class RateLimitedProvider:
+    """LLMProvider wrapper that enforces the bucket and retries 429s. Counts retries in .throttled."""
+
+    def __init__(
+        self,
+        llm: LLMProvider,
+        requests_per_minute: float | None = None,
+        burst: int | None = None,
+        max_retries: int | None = None,
+    ):
+        self.llm = llm
+        rpm = requests_per_minute or settings.llm_requests_per_minute
+        self.bucket = TokenBucket(rpm / 60.0, burst or settings.llm_burst)
+        self.max_retries = settings.llm_max_retries if max_retries is None else max_retries
+        self.throttled = 0
+
+    def _backoff(self, attempt: int, retry_after: float) -> None:
+        # Pausing the bucket delays this retry (its next acquire) and every other caller alike
+        delay = max(retry_after, min(60.0, 2.0**attempt)) * (1 + random.random() * 0.25)
+        self.throttled += 1
+        self.bucket.pause(delay)
+
+    def generate(self, system: str, user: str, max_tokens: int = 512) -> str:
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire()
+            try:
+                return self.llm.generate(system, user, max_tokens)
+            except Exception as e:
+                retry_after = _retry_after(e)
+                if retry_after is None or attempt == self.max_retries:
+                    raise
+                self._backoff(attempt, retry_after)
+
+    async def agenerate(self, system: str, user: str, max_tokens: int = 512) -> str:
+        for attempt in range(self.max_retries + 1):
+            await self.bucket.aacquire()
+            try:
+                return await self.llm.agenerate(system, user, max_tokens)
+            except Exception as e:
+                retry_after = _retry_after(e)
+                if retry_after is None or attempt == self.max_retries:
+                    raise
+                self._backoff(attempt, retry_after)
+
+    # Streaming passthrough (only used when the wrapped provider streams). A 429 surfaces on the first
+    # chunk, so only that read is retried; closing the wrapper closes the inner stream.
+
+    def stream(self, system: str, user: str, max_tokens: int = 512) -> Iterator[str]:
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire()
+            inner = self.llm.stream(system, user, max_tokens)
+            try:
+                first = next(inner, None)
+            except Exception as e:
+                retry_after = _retry_after(e)
+                if retry_after is None or attempt == self.max_retries:
+                    raise
+                self._backoff(attempt, retry_after)
+                continue
+            try:
+                if first is not None:
+                    yield first
+                yield from inner
+            finally:
+                inner.close()
+            return
+
+    async def astream(self, system: str, user: str, max_tokens: int = 512) -> AsyncIterator[str]:
+        for attempt in range(self.max_retries + 1):
+            await self.bucket.aacquire()
+            inner = self.llm.astream(system, user, max_tokens)
+            try:
+                first = await anext(inner, None)
+            except Exception as e:
+                retry_after = _retry_after(e)
+                if retry_after is None or attempt == self.max_retries:
+                    raise
+                self._backoff(attempt, retry_after)
+                continue
+            try:
+                if first is not None:
+                    yield first
+                async for chunk in inner:
+                    yield chunk
+            finally:
+                await inner.aclose()
+            return
@@ -1,4 +1,12 @@
 from ingest.load_data import ingest_employee
 
+# Parallel writers (ingest/parallel.py); None = serial writes on one connection
+WORKERS = None
+# Write only rows that are new or changed since the last incremental run (ingest/incremental.py)
+INCREMENTAL = False
+# With INCREMENTAL: also delete employees that are no longer in the CSV
+DELETE_MISSING = False
+
 if __name__=="__main__":
-    ingest_employee(r"C:\WORK_DIR\Projects\Knowledge_graph\phase2\data\employee.csv")
\ No newline at end of file
+    ingest_employee(r"C:\WORK_DIR\Projects\Knowledge_graph\phase2\data\employee.csv", workers=WORKERS,
+                    incremental=INCREMENTAL, delete_missing=DELETE_MISSING)
@@ -1,3 +1,10 @@
-from nl2cypher.pipeline import ask_graph
+from nl2cypher.pipeline import (
+    NL2CypherPipeline,
+    ask_graph,
+    ask_graph_async,
+    ask_graph_page,
+    ask_graph_stream,
+    get_pipeline,
+)
 
-__all__ = ["ask_graph"]
\ No newline at end of file
+__all__ = ["NL2CypherPipeline", "ask_graph", "ask_graph_async", "ask_graph_page", "ask_graph_stream", "get_pipeline"]
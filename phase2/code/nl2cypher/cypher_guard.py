@@ -0,0 +1,394 @@
+"""Lightweight Cypher lexer and clause splitter used to vet generated queries before they run.
+
+guard_query() works on tokens, not substrings, so 'SET' inside a string, a property such as
+e.offset or a label such as :Settings is fine. It:
+  - rejects write and admin clauses (CREATE, MERGE, SET, DELETE, LOAD CSV, CALL procedure, SHOW, ...),
+  - rejects variable-length relationships without an upper bound (or above CYPHER_MAX_HOPS): [*],
+    [:R*2..], and the Neo4j 5 quantifiers after a relationship or a parenthesised path group
+    (-[:R]->+, (()-[:R]->()){1,}, ...),
+  - rejects Cartesian products: patterns in one MATCH scope that share no variable (a WITH that
+    aggregates to a single row starts a fresh scope),
+  - appends LIMIT CYPHER_MAX_ROWS to a RETURN without one, caps a larger literal or $param LIMIT and
+    replaces any other LIMIT expression with CYPHER_MAX_ROWS.
+Rejections raise CypherRejected (a ValueError) before the query reaches the database.
+"""
+import re
+from dataclasses import dataclass
+
+from core.config import settings
+
+
+class CypherRejected(ValueError):
+    """Generated Cypher is not allowed to run."""
+
+
+@dataclass
+class Token:
+    kind: str  # "name", "quoted" (`...`), "string", "number", "param", "op"
+    text: str
+    start: int
+    end: int
+
+    @property
+    def upper(self) -> str:
+        return self.text.upper() if self.kind == "name" else self.text
+
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<ws>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+  | (?P<quoted>`(?:[^`]|``)*`)
+  | (?P<param>\$\w+)
+  | (?P<number>\d+(?:\.\d+(?!\.))?(?:[eE][+-]?\d+)?)
+  | (?P<name>[A-Za-z_][A-Za-z_0-9]*)
+  | (?P<op><=|>=|<>|=~|->|<-|\.\.|::|\+=|[^\s\w])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+WRITE_KEYWORDS = {
+    "CREATE", "MERGE", "DELETE", "DETACH", "SET", "REMOVE", "DROP", "FOREACH", "LOAD",
+    "ALTER", "GRANT", "DENY", "REVOKE", "RENAME", "START", "STOP", "TERMINATE", "FINISH", "SHOW",
+}
+# Clause keywords that start a new top-level clause (OPTIONAL MATCH and ORDER BY are two words)
+CLAUSE_KEYWORDS = {
+    "MATCH", "OPTIONAL", "WHERE", "WITH", "RETURN", "ORDER", "SKIP", "OFFSET", "LIMIT", "UNWIND",
+    "UNION", "CALL", "USE",
+} | WRITE_KEYWORDS
+
+
+def tokenize(cypher: str) -> list[Token]:
+    tokens = []
+    pos = 0
+    while pos < len(cypher):
+        m = _TOKEN_RE.match(cypher, pos)
+        if not m:
+            raise CypherRejected(f"Cannot tokenize Cypher near: {cypher[pos:pos + 20]!r}")
+        kind = m.lastgroup
+        if kind == "op" and m.group() in ("'", '"', "`"):
+            raise CypherRejected("Unterminated string or identifier")
+        if kind != "ws":
+            tokens.append(Token(kind, m.group(), m.start(), m.end()))
+        pos = m.end()
+    return tokens
+
+
+def _is_keyword(tokens: list[Token], i: int) -> bool:
+    """Unquoted name in keyword position: not a property (e.x), label (:X) or map key ({x: ...})."""
+    if tokens[i].kind != "name":
+        return False
+    prev = tokens[i - 1].text if i > 0 else ""
+    nxt = tokens[i + 1].text if i + 1 < len(tokens) else ""
+    return prev not in (".", ":") and nxt != ":"
+
+
+@dataclass
+class Clause:
+    keyword: str  # e.g. "MATCH", "OPTIONAL MATCH", "ORDER BY", "RETURN"
+    tokens: list[Token]  # tokens after the keyword, up to the next top-level clause
+    start: int = 0  # offset of the keyword in the query text
+
+
+def split_clauses(tokens: list[Token]) -> list[Clause]:
+    """Top-level clauses (keywords inside (), [] or {} belong to the enclosing clause)."""
+    clauses: list[Clause] = []
+    depth = 0
+    i = 0
+    while i < len(tokens):
+        tok = tokens[i]
+        if tok.text in "([{":
+            depth += 1
+        elif tok.text in ")]}":
+            depth -= 1
+        if depth == 0 and tok.upper in CLAUSE_KEYWORDS and _is_keyword(tokens, i):
+            keyword = tok.upper
+            nxt = tokens[i + 1].upper if i + 1 < len(tokens) else ""
+            if keyword == "OPTIONAL" and nxt == "MATCH" or keyword == "ORDER" and nxt == "BY":
+                keyword = f"{keyword} {nxt}"
+                i += 1
+            clauses.append(Clause(keyword, [], tok.start))
+        elif clauses:
+            clauses[-1].tokens.append(tok)
+        i += 1
+    return clauses
+
+
+def write_keywords(tokens: list[Token]) -> list[str]:
+    """Write/admin keywords in keyword position, and CALL of a procedure (CALL { subquery } is fine)."""
+    found = []
+    for i, tok in enumerate(tokens):
+        if tok.upper in WRITE_KEYWORDS and _is_keyword(tokens, i):
+            found.append(tok.upper)
+        elif tok.upper == "CALL" and _is_keyword(tokens, i):
+            if i + 1 >= len(tokens) or tokens[i + 1].text != "{":
+                found.append("CALL procedure")
+    return found
+
+
+_UNBOUNDED = "Unbounded variable-length relationship; give it an upper bound, e.g. [:REL*1..3] or {1,3}"
+QUANTIFIERS = ("+", "*", "{")
+
+
+def _check_hops(upper: int | None, max_hops: int) -> None:
+    if upper is None:
+        raise CypherRejected(_UNBOUNDED)
+    if upper > max_hops:
+        raise CypherRejected(f"Variable-length relationship up to {upper} hops exceeds the limit of {max_hops}")
+
+
+def _quantifier_upper(tokens: list[Token], j: int) -> int | None:
+    """Upper bound of the quantifier at tokens[j]: None for +, *, {n,}; n for {n}; m for {,m} and {n,m}."""
+    if tokens[j].text != "{":
+        return None
+    body = []
+    for tok in tokens[j + 1 :]:
+        if tok.text == "}":
+            break
+        body.append(tok)
+    bounds = [t for t in body if t.text != ","]
+    if any(t.kind != "number" for t in bounds):
+        return None  # {$n}, {n, $m}: not a literal bound
+    if not body or body[-1].text == ",":
+        return None
+    return int(float(body[-1].text))
+
+
+def _is_path_group(tokens: list[Token]) -> bool:
+    """Tokens inside a parenthesised group: does it contain a relationship (->, <-, -[, --)?"""
+    for i, tok in enumerate(tokens):
+        if tok.text in ("->", "<-"):
+            return True
+        if tok.text == "-" and i + 1 < len(tokens) and tokens[i + 1].text in ("[", "-"):
+            return True
+    return False
+
+
+def _ends_relationship(tokens: list[Token], i: int) -> bool:
+    """tokens[i] closes a relationship pattern: ]-, ]->, --, -->, <--."""
+    if i < 1 or tokens[i].text not in ("-", "->"):
+        return False
+    return tokens[i - 1].text in ("]", "-", "<-")
+
+
+def _check_var_length(tokens: list[Token], max_hops: int) -> None:
+    """Reject [*], [:R*], [*2..], unbounded quantifiers (-[:R]->+, (...)*, {n,}) and upper bounds above max_hops."""
+    brackets: list[bool] = []  # per open '[': is it a relationship (-[...]) rather than a list?
+    parens: list[int] = []  # token index of each open '('
+    for i, tok in enumerate(tokens):
+        nxt = tokens[i + 1].text if i + 1 < len(tokens) else ""
+        if tok.text == "(":
+            parens.append(i)
+        elif tok.text == ")" and parens:
+            start = parens.pop()
+            if nxt in QUANTIFIERS and _is_path_group(tokens[start + 1 : i]):
+                _check_hops(_quantifier_upper(tokens, i + 1), max_hops)
+        elif nxt in QUANTIFIERS and _ends_relationship(tokens, i):
+            _check_hops(_quantifier_upper(tokens, i + 1), max_hops)
+        if tok.text == "[":
+            brackets.append(i > 0 and tokens[i - 1].text in ("-", "<-"))
+        elif tok.text == "]" and brackets:
+            brackets.pop()
+        if not brackets or not brackets[-1] or tok.text != "*":
+            continue
+        j = i + 1
+        lower = upper = None
+        if j < len(tokens) and tokens[j].kind == "number":
+            lower = upper = int(float(tokens[j].text))
+            j += 1
+        if j < len(tokens) and tokens[j].text == "..":
+            upper = None
+            j += 1
+            if j < len(tokens) and tokens[j].kind == "number":
+                upper = int(float(tokens[j].text))
+        elif lower is None:
+            upper = None
+        _check_hops(upper, max_hops)
+
+
+def _pattern_variables(tokens: list[Token]) -> list[set[str]]:
+    """Comma-separated top-level patterns of a MATCH clause -> variables each one binds or references."""
+    patterns: list[set[str]] = [set()]
+    depth = maps = 0
+    for i, tok in enumerate(tokens):
+        if tok.text in "([{":
+            depth += 1
+            maps += tok.text == "{"
+        elif tok.text in ")]}":
+            depth -= 1
+            maps -= tok.text == "}"
+        elif tok.text == "," and depth == 0:
+            patterns.append(set())
+            continue
+        if tok.kind not in ("name", "quoted"):
+            continue
+        prev = tokens[i - 1].text if i else ""
+        nxt = tokens[i + 1].text if i + 1 < len(tokens) else ""
+        binds = prev in ("(", "[") or (depth == 0 and nxt == "=")  # (a:..), [r:..], p = (...)
+        references = maps and prev != "." and nxt != ":"  # {name: a.name} or {name: x}
+        if binds or references:
+            patterns[-1].add(tok.text)
+    for n, variables in enumerate(patterns):
+        if not variables:
+            variables.add(f"\x00anonymous{n}")  # (:Label) alone connects to nothing
+    return patterns
+
+
+def _projected_names(tokens: list[Token]) -> set[str] | None:
+    """Names still in scope after WITH: aliases and bare variables (None for WITH *)."""
+    if tokens and tokens[0].text == "*":
+        return None
+    names = set()
+    depth = 0
+    for i, tok in enumerate(tokens):
+        if tok.text in "([{":
+            depth += 1
+        elif tok.text in ")]}":
+            depth -= 1
+        if depth or tok.kind not in ("name", "quoted"):
+            continue
+        prev = tokens[i - 1].upper if i else ","
+        nxt = tokens[i + 1].text if i + 1 < len(tokens) else ","
+        if prev == "AS" or prev in (",", "DISTINCT") and nxt == ",":
+            names.add(tok.text)
+    return names
+
+
+AGGREGATES = {
+    "COUNT", "SUM", "AVG", "MIN", "MAX", "COLLECT", "STDEV", "STDEVP", "PERCENTILECONT", "PERCENTILEDISC",
+}
+
+
+def _items(tokens: list[Token]) -> list[list[Token]]:
+    """Comma-separated top-level items of a WITH/RETURN clause."""
+    items: list[list[Token]] = [[]]
+    depth = 0
+    for tok in tokens:
+        if tok.text in "([{":
+            depth += 1
+        elif tok.text in ")]}":
+            depth -= 1
+        elif tok.text == "," and depth == 0:
+            items.append([])
+            continue
+        items[-1].append(tok)
+    return items
+
+
+def _aggregated(item: list[Token]) -> bool:
+    return any(t.upper in AGGREGATES and n + 1 < len(item) and item[n + 1].text == "(" for n, t in enumerate(item))
+
+
+def _single_row(tokens: list[Token]) -> bool:
+    """WITH/RETURN items that are all aggregates (no grouping key), so the clause yields one row."""
+    items = _items(tokens)
+    if not items[0] or items[0][0].text == "*":
+        return False
+    return all(_aggregated(item) for item in items)
+
+
+def _check_cartesian(clauses: list[Clause]) -> None:
+    """Within each scope (between WITH clauses), every MATCH pattern must connect to the others."""
+    bound: set[str] = set()
+    patterns: list[set[str]] = []
+
+    def _flush() -> None:
+        groups = [set(bound)] if bound else []
+        for variables in patterns:
+            merged = set(variables)
+            rest = []
+            for group in groups:
+                if group & merged:
+                    merged |= group
+                else:
+                    rest.append(group)
+            groups = rest + [merged]
+        if len(groups) > 1:
+            raise CypherRejected(
+                "Cartesian product: MATCH patterns share no variable; connect them with a relationship"
+            )
+
+    for clause in clauses:
+        if clause.keyword in ("MATCH", "OPTIONAL MATCH"):
+            patterns.extend(_pattern_variables(clause.tokens))
+        elif clause.keyword == "UNWIND":
+            names = [t.text for i, t in enumerate(clause.tokens) if i and clause.tokens[i - 1].upper == "AS"]
+            bound.update(names)
+        elif clause.keyword in ("WITH", "RETURN", "UNION"):
+            _flush()
+            for variables in patterns:
+                bound |= variables
+            patterns = []
+            if clause.keyword == "WITH":
+                projected = _projected_names(clause.tokens)
+                bound = bound if projected is None else projected
+                if _single_row(clause.tokens):
+                    bound = set()  # one row of scalars: joining later patterns to it multiplies nothing
+            elif clause.keyword == "UNION":
+                bound = set()
+    _flush()
+
+
+def _limit_edits(tokens: list[Token], params: dict, max_rows: int) -> list[tuple[int, int, str]]:
+    """(start, end, replacement) edits that add or cap the LIMIT of every RETURN (per UNION part)."""
+    edits = []
+    parts: list[list[Token]] = [[]]
+    depth = 0
+    for i, tok in enumerate(tokens):
+        if tok.text in "([{":
+            depth += 1
+        elif tok.text in ")]}":
+            depth -= 1
+        if depth == 0 and tok.upper == "UNION" and _is_keyword(tokens, i):
+            parts.append([])
+            continue
+        parts[-1].append(tok)
+    for part in parts:
+        if part and part[0].upper == "ALL":
+            part = part[1:]
+        clauses = split_clauses(part)
+        returns = [n for n, c in enumerate(clauses) if c.keyword == "RETURN"]
+        if not returns:
+            continue
+        limits = [c for c in clauses[returns[-1]:] if c.keyword == "LIMIT"]
+        if not limits:
+            edits.append((part[-1].end, part[-1].end, f" LIMIT {max_rows}"))
+            continue
+        value = limits[-1].tokens
+        if len(value) == 1 and value[0].kind == "number":
+            if float(value[0].text) > max_rows:
+                edits.append((value[0].start, value[0].end, str(max_rows)))
+        elif len(value) == 1 and value[0].kind == "param":
+            name = value[0].text[1:]
+            if isinstance(params.get(name), (int, float)) and params[name] > max_rows:
+                params[name] = max_rows
+        elif value:
+            # an expression (10*100000, toInteger("9999999"), ...) cannot be capped safely
+            edits.append((value[0].start, value[-1].end, str(max_rows)))
+    return edits
+
+
+def guard_query(
+    cypher: str,
+    params: dict | None = None,
+    max_rows: int | None = None,
+    max_hops: int | None = None,
+) -> tuple[str, dict]:
+    """Validate cypher and return (cypher with a bounded LIMIT, params with capped LIMIT values)."""
+    max_rows = max_rows or settings.cypher_max_rows
+    max_hops = max_hops or settings.cypher_max_hops
+    params = dict(params or {})
+    cypher = cypher.strip().rstrip(";").rstrip()
+    tokens = tokenize(cypher)
+    if not tokens:
+        raise CypherRejected("Empty query")
+    if ";" in (t.text for t in tokens):
+        raise CypherRejected("Only one statement is allowed")
+    writes = write_keywords(tokens)
+    if writes:
+        raise CypherRejected(f"Only read-only Cypher is allowed (found {', '.join(sorted(set(writes)))})")
+    _check_var_length(tokens, max_hops)
+    _check_cartesian(split_clauses(tokens))
+    for start, end, text in sorted(_limit_edits(tokens, params, max_rows), reverse=True):
+        cypher = cypher[:start] + text + cypher[end:]
+    return cypher, params
@@ -1,12 +1,16 @@
 """Extract and validate Cypher from LLM output. No LLM-specific code."""
 import re
 
+from nl2cypher.cypher_guard import CypherRejected, tokenize, write_keywords
+
+_FENCE_RE = re.compile(r"```(?:cypher)?\s*(.*?)```", re.DOTALL | re.IGNORECASE)
+
 
 def extract_cypher(text: str) -> str | None:
     """Get Cypher from LLM reply (handles markdown code blocks or plain text)."""
     text = (text or "").strip()
     # Try markdown code block first: ```cypher ... ``` or ``` ... ```
-    m = re.search(r"```(?:cypher)?\s*(.*?)```", text, re.DOTALL | re.IGNORECASE)
+    m = _FENCE_RE.search(text)
     if m:
         return m.group(1).strip()
     # Otherwise use first line that looks like Cypher
@@ -18,7 +22,40 @@ def extract_cypher(text: str) -> str | None:
     return text if text else None
 
 
+class StreamingCypherExtractor:
+    """Incremental extract_cypher for streamed replies.
+
+    feed() each chunk as it arrives; it returns the Cypher as soon as a ``` block has closed, and
+    .text then holds the reply up to that fence, so the caller can cancel the rest of the stream.
+    Replies without a fence are only complete at the end of the stream: use extract_cypher(.text).
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.cypher: str | None = None
+        self._scan_from = 0
+
+    def feed(self, chunk: str) -> str | None:
+        if self.cypher is not None:
+            return self.cypher
+        self.text += chunk
+        start = self.text.find("```", self._scan_from)
+        if start < 0:
+            # Keep the last two characters: a fence may be split across chunks
+            self._scan_from = max(0, len(self.text) - 2)
+            return None
+        self._scan_from = start
+        m = _FENCE_RE.search(self.text, start)
+        if m:
+            self.cypher = m.group(1).strip()
+            self.text = self.text[: m.end()]
+        return self.cypher
+
+
 def is_read_only(cypher: str) -> bool:
-    """Allow only read-style Cypher (no CREATE, MERGE, DELETE, etc.)."""
-    forbidden = ("CREATE", "MERGE", "DELETE", "SET", "REMOVE", "DROP")
-    return not any(f in cypher.upper() for f in forbidden)
+    """Allow only read-style Cypher (no CREATE, MERGE, DELETE, etc.), checked on tokens so keywords
+    inside strings, property names or labels don't count. guard_query() does this and more."""
+    try:
+        return not write_keywords(tokenize(cypher))
+    except CypherRejected:  # not even tokenizable (e.g. an unterminated string)
+        return False
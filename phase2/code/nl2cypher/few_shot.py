@@ -0,0 +1,249 @@
+"""Few-shot example store: verified (question, Cypher) pairs retrieved by BM25 for each prompt.
+
+Pairs are added when a generated query runs successfully and returns rows, or by hand with
+scripts/manage_examples.py. The store is an append-only JSONL file (FEW_SHOT_FILE): one
+{"question", "cypher"} per line, or {"question", "deleted": true} for a removal. For a repeated
+question, the latest line wins.
+
+The BM25 inverted index uses the same terms as the schema pruner. Each term has a posting list of
+example ids and term frequencies, kept in growable arrays. A search views the posting lists of the
+question's terms as NumPy arrays and scores them vectorized against cached per-example length
+norms. Terms found in nearly every example are skipped. A search stays under a millisecond with
+tens of thousands of examples. A removed example stays in the posting lists, but its norm is
+infinite, so it scores 0.
+
+The index is snapshotted to <file>.index.npz at exit and after every SNAPSHOT_EVERY changes
+(or 10% of the store, whichever is more). On start the snapshot is loaded and only the JSONL lines
+written after it are indexed. The file is meant to have a single writer process.
+"""
+import atexit
+import json
+import math
+import threading
+from array import array
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+from core.config import resolve_code_path, settings
+from nl2cypher.schema_pruner import terms
+from nl2cypher.template_cache import normalize_question
+
+K1 = 1.2
+B = 0.75
+SNAPSHOT_EVERY = 200
+INDEX_VERSION = 1
+MIN_IDF = 0.1
+
+
+class ExampleStore:
+    """Append-only example file plus an incrementally maintained BM25 index."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.index_path = path.with_name(path.name + ".index.npz")
+        self._lock = threading.Lock()
+        self._reset()
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _reset(self) -> None:
+        self.questions: list[str | None] = []  # by example id; None once removed
+        self.cyphers: list[str | None] = []
+        self._ids: dict[str, int] = {}  # normalized question -> example id
+        self._postings: dict[str, tuple[array, array]] = {}  # term -> (ids int32, tf float32)
+        self._lengths = array("f")  # terms per example
+        self._alive = array("b")  # 1 while the example is current
+        self._total_length = 0.0
+        self._lines = 0  # JSONL lines reflected in the index
+        self._unsaved = 0
+        self._norms: np.ndarray | None = None
+
+    def _load(self) -> None:
+        try:
+            with np.load(self.index_path, allow_pickle=False) as snapshot:
+                meta = json.loads(str(snapshot["meta"]))
+                if meta["version"] == INDEX_VERSION:
+                    self._load_snapshot(meta, snapshot)
+        except (OSError, ValueError, KeyError):
+            self._reset()
+        if not self.path.exists():
+            return
+        with self.path.open(encoding="utf-8") as f:
+            lines = f.readlines()
+        if len(lines) < self._lines:  # file replaced or truncated: snapshot is stale, rebuild
+            self._reset()
+        for line in lines[self._lines:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # torn last write
+            if entry.get("deleted"):
+                self._remove(entry["question"])
+            else:
+                self._add(entry["question"], entry["cypher"])
+        self._unsaved += len(lines) - self._lines
+        self._lines = len(lines)
+
+    def _load_snapshot(self, meta: dict, snapshot) -> None:
+        self.questions, self.cyphers, self._lines = meta["questions"], meta["cyphers"], meta["lines"]
+        self._lengths = array("f", snapshot["lengths"].tobytes())
+        self._alive = array("b", snapshot["alive"].tobytes())
+        self._total_length = float(np.dot(snapshot["lengths"], snapshot["alive"]))
+        self._norms = None
+        ids, tfs, offsets = snapshot["ids"], snapshot["tfs"], snapshot["offsets"]
+        for n, term in enumerate(meta["terms"]):
+            a, b = offsets[n], offsets[n + 1]
+            self._postings[term] = (array("i", ids[a:b].tobytes()), array("f", tfs[a:b].tobytes()))
+        self._ids = {normalize_question(q).lower(): i for i, q in enumerate(self.questions) if q is not None}
+
+    def save(self) -> None:
+        """Write the index snapshot (atomic replace)."""
+        with self._lock:
+            if not self._unsaved:
+                return
+            terms_order = list(self._postings)
+            sizes = [len(self._postings[t][0]) for t in terms_order]
+            meta = {"version": INDEX_VERSION, "lines": self._lines, "terms": terms_order,
+                    "questions": self.questions, "cyphers": self.cyphers}
+            arrays = {
+                "meta": np.array(json.dumps(meta)),
+                "ids": np.frombuffer(b"".join(self._postings[t][0].tobytes() for t in terms_order), dtype=np.int32),
+                "tfs": np.frombuffer(b"".join(self._postings[t][1].tobytes() for t in terms_order), dtype=np.float32),
+                "offsets": np.concatenate([[0], np.cumsum(sizes, dtype=np.int64)]),
+                "lengths": np.frombuffer(self._lengths, dtype=np.float32),
+                "alive": np.frombuffer(self._alive, dtype=np.int8),
+            }
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_path.with_name(self.index_path.name + ".tmp")
+            with tmp.open("wb") as f:
+                np.savez(f, **arrays)
+            tmp.replace(self.index_path)
+            self._unsaved = 0
+
+    def _append(self, entry: dict) -> bool:
+        """Append one line; True when a snapshot is due."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        self._lines += 1
+        self._unsaved += 1
+        return self._unsaved >= max(SNAPSHOT_EVERY, len(self._ids) // 10)
+
+    def _add(self, question: str, cypher: str) -> bool:
+        key = normalize_question(question).lower()
+        if key in self._ids:
+            doc = self._ids[key]
+            changed = self.cyphers[doc] != cypher
+            self.cyphers[doc] = cypher
+            return changed
+        doc = len(self.questions)
+        self._norms = None
+        counts = Counter(terms(question))
+        self.questions.append(question)
+        self.cyphers.append(cypher)
+        self._lengths.append(sum(counts.values()))
+        self._alive.append(1)
+        self._total_length += self._lengths[doc]
+        self._ids[key] = doc
+        for term, tf in counts.items():
+            ids, tfs = self._postings.setdefault(term, (array("i"), array("f")))
+            ids.append(doc)
+            tfs.append(tf)
+        return True
+
+    def _remove(self, question: str) -> bool:
+        doc = self._ids.pop(normalize_question(question).lower(), None)
+        if doc is None:
+            return False
+        self._alive[doc] = 0
+        self._norms = None
+        self._total_length -= self._lengths[doc]
+        self.questions[doc] = self.cyphers[doc] = None
+        return True
+
+    def add(self, question: str, cypher: str) -> bool:
+        """Store a verified pair (replacing the Cypher of an identical question). True if anything changed."""
+        with self._lock:
+            if not self._add(question, cypher):
+                return False
+            due = self._append({"question": question, "cypher": cypher})
+        if due:
+            self.save()
+        return True
+
+    def remove(self, question: str) -> bool:
+        with self._lock:
+            if not self._remove(question):
+                return False
+            due = self._append({"question": question, "deleted": True})
+        if due:
+            self.save()
+        return True
+
+    def _doc_norms(self) -> np.ndarray:
+        """BM25 length normalisation per example (inf for removed ones, so they score 0); cached until the next change."""
+        if self._norms is None:
+            lengths = np.frombuffer(self._lengths, dtype=np.float32).copy()
+            avg_length = self._total_length / max(len(self._ids), 1) or 1.0
+            norms = K1 * (1 - B + B * lengths / avg_length)
+            norms[np.frombuffer(self._alive, dtype=np.int8) == 0] = np.inf
+            self._norms = norms
+        return self._norms
+
+    def search(self, question: str, k: int = 3) -> list[tuple[str, str, float]]:
+        """Top-k (question, cypher, score) by BM25 similarity to question."""
+        with self._lock:
+            n = len(self._ids)
+            if not n or k <= 0:
+                return []
+            norms = self._doc_norms()
+            scores = np.zeros(len(norms), dtype=np.float32)
+            for term in set(terms(question)):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                df = len(postings[0])  # removed examples still count; close enough for ranking
+                idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+                if idf < MIN_IDF:
+                    continue  # in (nearly) every example, e.g. "employee": cannot change the ranking much
+                ids = np.frombuffer(postings[0], dtype=np.int32)
+                tfs = np.frombuffer(postings[1], dtype=np.float32)
+                scores[ids] += idf * (K1 + 1) * tfs / (tfs + norms[ids])
+            best = []
+            for _ in range(min(k, len(scores))):  # k is small: repeated argmax beats a full partition
+                doc = int(scores.argmax())
+                if scores[doc] <= 0:
+                    break
+                best.append((self.questions[doc], self.cyphers[doc], float(scores[doc])))
+                scores[doc] = 0
+            return best
+
+
+def format_examples(examples: list[tuple[str, str, float]]) -> str:
+    """Prompt block for retrieved examples (empty string when there are none)."""
+    if not examples:
+        return ""
+    parts = ["Examples of correct queries for similar questions:"]
+    for question, cypher, _ in examples:
+        parts.append(f"Question: {question}\n```cypher\n{cypher}\n```")
+    return "\n\n".join(parts)
+
+
+_store: ExampleStore | None = None
+_store_lock = threading.Lock()  # first use may come from several asyncio.to_thread workers at once
+
+
+def get_example_store() -> ExampleStore | None:
+    """Process-wide store from settings, or None when FEW_SHOT_ENABLED is false."""
+    global _store
+    if not settings.few_shot_enabled:
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = ExampleStore(resolve_code_path(settings.few_shot_file))
+            atexit.register(_store.save)
+    return _store
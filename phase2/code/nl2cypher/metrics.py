@@ -0,0 +1,306 @@
+"""Per-stage latency metrics of ask_graph: one Trace per question, handed to pluggable exporters.
+
+A Trace records the milliseconds spent in each stage of one question:
+  schema    stat (and, if changed, re-read) the schema file
+  template  template-cache lookup
+  prompt    system prompt build (schema pruning, few-shot retrieval)
+  generate  LLMProvider.generate / stream, summed over repair attempts
+  extract   extract_cypher on the reply
+  guard     cypher_guard checks
+  explain   EXPLAIN validation
+  execute   driver round trip; for streamed results the time spent waiting on the driver, for pages
+            reading the page (record conversion included)
+  convert   records -> row dicts
+  total     the whole call
+plus counts: estimated prompt/completion tokens (schema_pruner.estimate_tokens), result rows and
+validation attempts. The generate/extract/guard/explain times come from the ValidationReport.
+
+Exporters (METRICS_EXPORTERS, comma-separated):
+  histogram   in-memory latency histograms per stage, with quantiles (get_metrics().histogram)
+  prometheus  the histograms in Prometheus text format on http://METRICS_HOST:METRICS_PORT/metrics
+              (METRICS_HOST is 127.0.0.1 by default; set 0.0.0.0 only where the port is firewalled)
+  json        one JSON line per question appended to METRICS_LOG_FILE
+Recording a trace is a few dict updates and a bisect under a lock (~10 us; ~35 us with the json
+exporter), so metrics stay on by default.
+"""
+import json
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator, Protocol
+
+from core.config import resolve_code_path, settings
+from nl2cypher.cypher_guard import CypherRejected
+
+STAGES = ("schema", "template", "prompt", "generate", "extract", "guard", "explain", "execute", "convert", "total")
+COUNTS = ("prompt_tokens", "completion_tokens", "rows", "attempts")
+# Histogram bucket upper bounds in milliseconds (Prometheus "le" labels are in seconds)
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+@dataclass
+class Trace:
+    """Timings and counts of one pipeline call. status: ok, rejected (no valid Cypher) or error."""
+
+    operation: str  # ask, ask_async, ask_stream, ask_stream_async, ask_page, ask_page_async
+    question: str
+    ms: dict[str, float] = field(default_factory=dict)  # stage -> milliseconds
+    counts: Counter = field(default_factory=Counter)
+    cached: bool = False
+    status: str = "ok"
+    ts: float = field(default_factory=time.time)
+    deferred: bool = False  # finished by the caller (streamed rows), not when traced() exits
+    exported: bool = False
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+
+    def add(self, stage: str, ms: float) -> None:
+        self.ms[stage] = self.ms.get(stage, 0.0) + ms
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, (time.perf_counter() - started) * 1000)
+
+    def finish(self) -> None:
+        self.ms["total"] = (time.perf_counter() - self._started) * 1000
+
+    def to_dict(self) -> dict:
+        return {
+            "ts": round(self.ts, 3),
+            "operation": self.operation,
+            "question": self.question,
+            "status": self.status,
+            "cached": self.cached,
+            "ms": {stage: round(ms, 3) for stage, ms in self.ms.items()},
+            **{name: self.counts[name] for name in COUNTS},
+        }
+
+    def summary(self) -> str:
+        timing = ", ".join(f"{s} {self.ms[s]:.1f} ms" for s in STAGES if s in self.ms)
+        counts = ", ".join(f"{name} {self.counts[name]}" for name in COUNTS if self.counts[name])
+        return f"{self.operation} {self.status}: {timing}" + (f" ({counts})" if counts else "")
+
+
+class Exporter(Protocol):
+    """Receives every finished Trace. Must be thread-safe; called on the asking thread."""
+
+    def export(self, trace: Trace) -> None:
+        ...
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (milliseconds)."""
+
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot: above the largest bucket
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect_left(self.buckets, ms)] += 1
+        self.total += 1
+        self.sum += ms
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (inf past the largest bucket)."""
+        rank, seen = q * self.total, 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank and seen:
+                return bound
+        return 0.0
+
+
+class HistogramExporter:
+    """In-memory histograms per stage plus counters by operation/status and token/row totals."""
+
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS_MS):
+        self.buckets = buckets
+        self.stages: dict[str, Histogram] = {}
+        self.questions: Counter = Counter()  # (operation, status) -> count
+        self.counts: Counter = Counter()  # prompt_tokens, completion_tokens, rows, attempts
+        self.cached = 0
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        with self._lock:
+            for stage, ms in trace.ms.items():
+                hist = self.stages.get(stage)
+                if hist is None:
+                    hist = self.stages[stage] = Histogram(self.buckets)
+                hist.observe(ms)
+            self.questions[(trace.operation, trace.status)] += 1
+            self.counts.update(trace.counts)
+            self.cached += trace.cached
+
+    def summary(self) -> str:
+        """One line per stage: count, mean and bucketed p50/p95/p99 in ms."""
+        with self._lock:
+            lines = [f"{sum(self.questions.values())} questions ({self.cached} from the template cache)"]
+            for stage in STAGES:
+                hist = self.stages.get(stage)
+                if hist is None:
+                    continue
+                q = ", ".join(f"p{int(p * 100)} <= {hist.quantile(p):g}" for p in (0.5, 0.95, 0.99))
+                lines.append(f"  {stage:<9} n={hist.total} mean {hist.sum / hist.total:.1f} ms, {q} ms")
+            if self.counts:
+                lines.append("  " + ", ".join(f"{name} {self.counts[name]}" for name in COUNTS))
+            return "\n".join(lines)
+
+    def prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            lines = [
+                "# HELP nl2cypher_stage_seconds Time spent per ask_graph stage.",
+                "# TYPE nl2cypher_stage_seconds histogram",
+            ]
+            for stage, hist in self.stages.items():
+                seen = 0
+                for bound, count in zip(self.buckets, hist.counts):
+                    seen += count
+                    lines.append(f'nl2cypher_stage_seconds_bucket{{stage="{stage}",le="{bound / 1000:g}"}} {seen}')
+                lines.append(f'nl2cypher_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} {hist.total}')
+                lines.append(f'nl2cypher_stage_seconds_sum{{stage="{stage}"}} {hist.sum / 1000:.6f}')
+                lines.append(f'nl2cypher_stage_seconds_count{{stage="{stage}"}} {hist.total}')
+            lines += [
+                "# HELP nl2cypher_questions_total Pipeline calls by operation and outcome.",
+                "# TYPE nl2cypher_questions_total counter",
+            ]
+            for (operation, status), count in sorted(self.questions.items()):
+                lines.append(f'nl2cypher_questions_total{{operation="{operation}",status="{status}"}} {count}')
+            lines += [
+                "# HELP nl2cypher_template_hits_total Questions answered from the template cache.",
+                "# TYPE nl2cypher_template_hits_total counter",
+                f"nl2cypher_template_hits_total {self.cached}",
+            ]
+            for name in COUNTS:
+                lines += [f"# TYPE nl2cypher_{name}_total counter", f"nl2cypher_{name}_total {self.counts[name]}"]
+            return "\n".join(lines) + "\n"
+
+
+class JsonLogExporter:
+    """Appends Trace.to_dict() as one JSON line per question. The file stays open (line-buffered),
+    so a trace costs one write instead of an open/close as in query_log.py."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        line = json.dumps(trace.to_dict(), default=str)
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8", buffering=1)
+            self._file.write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def serve_metrics(histogram: HistogramExporter, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve histogram.prometheus() at /metrics from a daemon thread; returns the server (shutdown() stops it)."""
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = histogram.prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args) -> None:  # scrapes would flood stderr
+            pass
+
+    server = ThreadingHTTPServer((host, port), _Handler)
+    threading.Thread(target=server.serve_forever, name="nl2cypher-metrics", daemon=True).start()
+    return server
+
+
+class Metrics:
+    """Sends finished traces to every exporter. An exporter failure is printed, never raised to the asker."""
+
+    def __init__(self, exporters: list[Exporter] | None = None):
+        self.exporters = list(exporters or [])
+        self.histogram = next((e for e in self.exporters if isinstance(e, HistogramExporter)), None)
+        self.server: ThreadingHTTPServer | None = None
+
+    def finish(self, trace: Trace) -> None:
+        """Export trace; a second call for the same trace does nothing."""
+        if trace.exported:
+            return
+        trace.exported = True
+        trace.finish()
+        for exporter in self.exporters:
+            try:
+                exporter.export(trace)
+            except Exception as e:
+                print(f"Metrics exporter {type(exporter).__name__} failed: {e}")
+
+    def finish_with(self, trace: Trace, results: object) -> None:
+        """Export a deferred trace when results (a row generator) is garbage-collected. Once iterated,
+        the generator's own finally exports it first; this covers a generator that is never started,
+        whose body (and finally) never runs."""
+        weakref.finalize(results, self.finish, trace)
+
+    @contextmanager
+    def traced(self, operation: str, question: str) -> Iterator[Trace]:
+        """Trace of one call; status follows the exception that escapes, exported on exit unless deferred."""
+        trace = Trace(operation, question)
+        try:
+            yield trace
+        except CypherRejected:
+            trace.status = "rejected"
+            raise
+        except BaseException:
+            trace.status = "error"
+            raise
+        finally:
+            if not trace.deferred or trace.status != "ok":
+                self.finish(trace)
+
+
+def build_metrics() -> Metrics:
+    """Metrics with the exporters named in METRICS_EXPORTERS (prometheus implies histogram)."""
+    names = {n.strip().lower() for n in settings.metrics_exporters.split(",") if n.strip()}
+    unknown = names - {"histogram", "prometheus", "json"}
+    if unknown:
+        raise ValueError(f"Unknown METRICS_EXPORTERS {sorted(unknown)}. Use histogram, prometheus, json.")
+    exporters: list[Exporter] = []
+    if names & {"histogram", "prometheus"}:
+        exporters.append(HistogramExporter())
+    if "json" in names:
+        exporters.append(JsonLogExporter(resolve_code_path(settings.metrics_log_file)))
+    metrics = Metrics(exporters)
+    if "prometheus" in names:
+        metrics.server = serve_metrics(metrics.histogram, settings.metrics_port, settings.metrics_host)
+    return metrics
+
+
+_metrics: Metrics | None = None
+
+
+def get_metrics() -> Metrics:
+    """Process-wide metrics from settings; no exporters when METRICS_ENABLED is false."""
+    global _metrics
+    if _metrics is None:
+        _metrics = build_metrics() if settings.metrics_enabled else Metrics()
+    return _metrics
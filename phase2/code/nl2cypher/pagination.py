@@ -0,0 +1,224 @@
+"""Cursor pagination for ask_graph results.
+
+page_query() rewrites a guarded query (see cypher_guard.py) so it fetches a single page. It asks
+for page_size + 1 rows; the extra row only shows whether there is a next page. There are three modes:
+    keyset  a single-part query whose RETURN is neither aggregated nor DISTINCT and ends in
+            ORDER BY n.prop [ASC|DESC], where n is a node matched on its own (no relationship,
+            second pattern or UNWIND fans it out, unless a WITH DISTINCT n or WITH n, count(..)
+            collapses it again) and the only entity the RETURN projects. Then (n.prop,
+            elementId(n)) identifies a row and the next page starts after the last row's key, so
+            earlier pages are not read again.
+    offset  any other query with one RETURN: SKIP $_page_skip LIMIT $_page_limit.
+    client  UNION queries and non-literal LIMITs: the query is unchanged and rows are skipped while
+            streaming. Every page re-reads all rows before it, so paging through n rows costs
+            O(n^2) reads; client paging stops after CYPHER_MAX_ROWS rows.
+The query's own LIMIT (the guard cap, or e.g. "top 5") still bounds the total across pages.
+
+The cursor is an opaque URL-safe token that holds the query, its params and the position, signed
+with HMAC-SHA256 under PAGE_CURSOR_SECRET (a random per-process key when that is empty, so cursors
+then only work in the process that issued them). A cursor whose signature does not match is
+rejected; the query of a valid one is still guarded and EXPLAINed again before it runs.
+"""
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+from typing import Any
+
+from core.config import settings
+from nl2cypher.cypher_guard import (
+    Clause, CypherRejected, Token, _aggregated, _items, _projected_names, split_clauses, tokenize,
+)
+
+PAGE_COLUMNS = ("_page_key", "_page_id")
+_DIRECTIONS = {"ASC": False, "ASCENDING": False, "DESC": True, "DESCENDING": True}
+_RELATIONSHIP = {"[", "-", "->", "<-"}
+_process_secret = secrets.token_bytes(32)
+
+
+def _b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _signature(payload: str) -> str:
+    key = settings.page_cursor_secret.encode("utf-8") or _process_secret
+    return _b64(hmac.new(key, payload.encode("ascii"), hashlib.sha256).digest())
+
+
+def encode_cursor(state: dict) -> str:
+    payload = _b64(json.dumps(state, separators=(",", ":")).encode("utf-8"))
+    return f"{payload}.{_signature(payload)}"
+
+
+def decode_cursor(cursor: str) -> dict:
+    """State of a cursor made by encode_cursor; raises CypherRejected if it is malformed or was not signed here."""
+    payload, _, signature = cursor.partition(".")
+    if not signature or not hmac.compare_digest(signature, _signature(payload)):
+        raise CypherRejected("Invalid page cursor")
+    try:
+        state = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        if not isinstance(state.get("query"), str) or not isinstance(state.get("offset"), int):
+            raise ValueError
+    except (ValueError, AttributeError):
+        raise CypherRejected("Invalid page cursor") from None
+    return state
+
+
+def _node_patterns(tokens: list[Token]) -> int:
+    """Top-level (...) of a MATCH clause: node patterns and quantified groups."""
+    count = depth = 0
+    for tok in tokens:
+        if tok.text in "([{":
+            count += depth == 0 and tok.text == "("
+            depth += 1
+        elif tok.text in ")]}":
+            depth -= 1
+    return count
+
+
+def _collapses_to(tokens: list[Token], var: str) -> bool:
+    """WITH DISTINCT var, or WITH var, <aggregates>: one row per var afterwards."""
+    items = _items(tokens)
+    distinct = bool(items[0]) and items[0][0].upper == "DISTINCT"
+    if distinct:
+        items[0] = items[0][1:]
+    keys = [[t.text for t in item] for item in items if not _aggregated(item)]
+    return keys in ([[var]], [[var, "AS", var]]) and (distinct or len(keys) < len(items))
+
+
+def _keyset_order(clauses: list[Clause], ret: int) -> tuple[str, str, bool] | None:
+    """(variable, property, descending) if the query can be paged by keyset, else None.
+
+    Keyset paging needs (var.prop, elementId(var)) to identify a row; when var can repeat across
+    rows the next page would skip rows, so anything that may fan it out falls back to offset.
+    """
+    items = clauses[ret].tokens
+    if items and items[0].upper == "DISTINCT":
+        return None
+    if any(_aggregated(item) for item in _items(items)):
+        return None
+    order = [c for c in clauses[ret + 1:] if c.keyword == "ORDER BY"]
+    if len(order) != 1 or any(c.keyword in ("SKIP", "OFFSET") for c in clauses[ret + 1:]):
+        return None
+    keys = order[0].tokens
+    descending = False
+    if len(keys) == 4 and keys[3].upper in _DIRECTIONS:
+        descending = _DIRECTIONS[keys[3].upper]
+        keys = keys[:3]
+    if len(keys) != 3 or keys[1].text != "." or keys[0].kind != "name" or keys[2].kind != "name":
+        return None
+    var = keys[0].text
+
+    # var must be a matched node that is still in scope at the RETURN, and one row per var
+    entities: set[str] = set()
+    nodes = 0  # node patterns since rows were last one per var
+    unique = True
+    for clause in clauses[:ret]:
+        tokens = clause.tokens
+        if clause.keyword in ("MATCH", "OPTIONAL MATCH"):
+            entities |= {t.text for i, t in enumerate(tokens) if i and tokens[i - 1].text in ("(", "[")}
+            nodes += _node_patterns(tokens)
+            if nodes > 1 or any(t.text in _RELATIONSHIP for t in tokens):
+                unique = False
+        elif clause.keyword == "WITH":
+            projected = _projected_names(tokens)
+            if projected is not None:
+                entities &= projected
+            if _collapses_to(tokens, var):
+                unique, nodes = True, 1
+        elif clause.keyword != "WHERE":
+            unique = False  # UNWIND, CALL { }, USE: rows no longer follow var
+    if not unique or var not in entities:
+        return None
+    returned = {t.text for i, t in enumerate(items) if t.text in entities and (not i or items[i - 1].text != ".")}
+    return (var, keys[2].text, descending) if returned == {var} else None
+
+
+def _after_condition(var: str, prop: str, descending: bool, key: Any) -> str:
+    """Rows strictly after (key, id) in ORDER BY var.prop [DESC], elementId(var) (nulls sort last ASC, first DESC)."""
+    value, eid = f"{var}.{prop}", f"elementId({var})"
+    if not descending:
+        if key is None:
+            return f"{value} IS NULL AND {eid} > $_page_id"
+        return f"{value} > $_page_key OR {value} = $_page_key AND {eid} > $_page_id OR {value} IS NULL"
+    if key is None:
+        return f"{value} IS NOT NULL OR {eid} > $_page_id"
+    return f"{value} < $_page_key OR {value} = $_page_key AND {eid} > $_page_id"
+
+
+def _limit_value(tokens: list[Token], params: dict) -> int | None:
+    if len(tokens) == 1 and tokens[0].kind == "number":
+        return int(float(tokens[0].text))
+    if len(tokens) == 1 and tokens[0].kind == "param":
+        value = params.get(tokens[0].text[1:])
+        return int(value) if isinstance(value, (int, float)) else None
+    return None
+
+
+def page_query(cypher: str, params: dict, page_size: int, state: dict) -> tuple[str, dict, str]:
+    """(query, params, mode) that fetch up to page_size + 1 rows starting at the cursor state."""
+    tokens = tokenize(cypher)
+    clauses = split_clauses(tokens)
+    if any(c.keyword == "UNION" for c in clauses):
+        return cypher, params, "client"
+    returns = [n for n, c in enumerate(clauses) if c.keyword == "RETURN"]
+    if not returns:
+        return cypher, params, "client"
+    ret = returns[-1]
+    tail = [c for c in clauses[ret + 1:] if c.keyword in ("SKIP", "OFFSET", "LIMIT")]
+    limits = [c for c in tail if c.keyword == "LIMIT"]
+    skips = [c for c in tail if c.keyword != "LIMIT"]
+    total = _limit_value(limits[-1].tokens, params) if limits else None
+    skip = _limit_value(skips[-1].tokens, params) if skips else 0
+    if total is None or skip is None:
+        return cypher, params, "client"
+
+    offset = state["offset"]
+    params = dict(params, _page_limit=max(0, min(page_size + 1, total - offset)))
+    edits = [(tail[0].start, len(cypher), "LIMIT $_page_limit")]
+    keyset = None if state.get("no_keyset") else _keyset_order(clauses, ret)
+    if keyset:
+        mode = "keyset"
+        var, prop, descending = keyset
+        order = next(c for c in clauses[ret + 1:] if c.keyword == "ORDER BY")
+        edits.append((order.tokens[-1].end, order.tokens[-1].end, f", elementId({var})"))
+        items = clauses[ret].tokens
+        edits.append((items[-1].end, items[-1].end, f", {var}.{prop} AS _page_key, elementId({var}) AS _page_id"))
+        if "after" in state:
+            key, eid = state["after"]
+            params.update(_page_key=key, _page_id=eid)
+            where = _after_condition(var, prop, descending, key)
+            edits.append((clauses[ret].start, clauses[ret].start, f"WITH * WHERE {where}\n"))
+    else:
+        mode = "offset"
+        params["_page_skip"] = skip + offset
+        edits[0] = (tail[0].start, len(cypher), "SKIP $_page_skip LIMIT $_page_limit")
+    for start, end, text in sorted(edits, reverse=True):
+        cypher = cypher[:start] + text + cypher[end:]
+    return cypher, params, mode
+
+
+def finish_page(rows: list[dict], page_size: int, state: dict, mode: str) -> tuple[list[dict], str | None]:
+    """Trim the look-ahead row and hidden columns; return (rows, next cursor or None)."""
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    last = dict(rows[-1]) if rows else {}
+    for row in rows:
+        for column in PAGE_COLUMNS:
+            row.pop(column, None)
+    if not has_more:
+        return rows, None
+    following = {key: state[key] for key in ("query", "params") if key in state}
+    following["offset"] = state["offset"] + len(rows)
+    if mode == "client" and following["offset"] >= settings.cypher_max_rows:
+        return rows, None  # each client page re-reads every earlier row: stop at the row cap
+    if mode == "keyset":
+        key = last.get("_page_key")
+        if key is None or isinstance(key, (str, int, float, bool)):
+            following["after"] = [key, last.get("_page_id")]
+        else:  # dates, points, lists: not JSON-safe in a cursor, continue by offset
+            following["no_keyset"] = True
+    elif state.get("no_keyset"):
+        following["no_keyset"] = True
+    return rows, encode_cursor(following)
@@ -1,13 +1,27 @@
 """NL → Cypher → Neo4j. Uses get_llm() and prompts; schema loaded from file (see scripts/generate_schema.py)."""
 
-from typing import Any
+import asyncio
+import hashlib
+import threading
+import time
+from itertools import islice
+from typing import Any, AsyncIterator, Iterator
 
-from core.config import get_schema_path
-from db.connection import Neo4jConnection
+from core.config import get_schema_path, settings
+from db.connection import AsyncNeo4jConnection, Neo4jConnection
 from llm import get_llm
+from llm.base import AsyncLLMProvider, LLMProvider, StreamingLLMProvider
 
 from nl2cypher.prompts import SYSTEM_PROMPT
-from nl2cypher.cypher_utils import extract_cypher, is_read_only
+from nl2cypher.cypher_guard import CypherRejected, guard_query
+from nl2cypher.cypher_utils import StreamingCypherExtractor, extract_cypher
+from nl2cypher.few_shot import format_examples, get_example_store
+from nl2cypher.metrics import Metrics, Trace, get_metrics
+from nl2cypher.pagination import decode_cursor, finish_page, page_query
+from nl2cypher.query_log import log_query
+from nl2cypher.schema_pruner import PrunedSchema, SchemaPruner, estimate_tokens
+from nl2cypher.template_cache import get_template_cache
+from nl2cypher.validation import Attempt, ValidationReport, ValidationTotals, check_plan, repair_message
 
 
 def load_schema_text() -> str:
@@ -20,30 +34,544 @@ def load_schema_text() -> str:
     return path.read_text(encoding="utf-8").strip()
 
 
-def ask_graph(question: str,verbose:bool=False) -> list[dict[str, Any]]:
-    schema_text = load_schema_text()
-    llm = get_llm()
-    raw = llm.generate(SYSTEM_PROMPT + "\n\n" + schema_text, question)
+def _extracted_cypher(raw: str, verbose: bool) -> str:
+    """Cypher from the LLM reply (raises CypherRejected if there is none). Shared by the sync and async paths."""
     if verbose:
         print("--------------------------------")
         print(f"Raw Cypher: {raw}")
         print("--------------------------------")
-        
+
     cypher = extract_cypher(raw)
     if not cypher:
-        raise ValueError("No Cypher found in LLM response")
-    if not is_read_only(cypher):
-        raise ValueError("Only read-only Cypher is allowed")
-    
+        raise CypherRejected("No Cypher found in LLM response")
+    return cypher
+
+
+def _checked_cypher(cypher: str, verbose: bool) -> str:
+    """Run extracted Cypher through guard_query (read-only, bounded LIMIT, no unbounded var-length
+    paths or Cartesian products)."""
+    cypher, _ = guard_query(cypher)
+
     if verbose:
         print("--------------------------------")
         print(f"Generated Cypher: {cypher}")
         print("--------------------------------")
-    
-    db=Neo4jConnection()
+    return cypher
+
+
+def _cursor_state(cursor: str) -> tuple[str, dict, dict]:
+    """(cypher, params, state) of a signed page cursor. The query is guarded again: the cursor comes from the client."""
+    state = decode_cursor(cursor)
+    cypher, params = guard_query(state["query"], state.get("params"))
+    return cypher, params, state
+
+
+def _to_dicts(records: list) -> list[dict[str, Any]]:
+    return [r.data() if hasattr(r, "data") else dict(r) for r in records]
+
+
+def _timed_rows(trace: Trace, records: Iterator) -> Iterator[dict[str, Any]]:
+    """record.data() of each streamed record. Time spent waiting on the driver counts as execute,
+    data() as convert; the caller's time between rows counts as neither."""
+    clock = time.perf_counter
+    execute = convert = 0.0
     try:
-        records = db.execute_query(cypher)
-        results= [r.data() if hasattr(r, "data") else dict(r) for r in records]
-        return {"query": cypher, "results": results}
+        while True:
+            started = clock()
+            record = next(records, None)
+            fetched = clock()
+            execute += fetched - started
+            if record is None:
+                return
+            row = record.data()
+            convert += clock() - fetched
+            trace.counts["rows"] += 1
+            yield row
     finally:
-        db.close()
\ No newline at end of file
+        records.close()
+        trace.add("execute", execute * 1000)
+        trace.add("convert", convert * 1000)
+
+
+async def _atimed_rows(trace: Trace, records: AsyncIterator) -> AsyncIterator[dict[str, Any]]:
+    clock = time.perf_counter
+    execute = convert = 0.0
+    try:
+        while True:
+            started = clock()
+            record = await anext(records, None)
+            fetched = clock()
+            execute += fetched - started
+            if record is None:
+                return
+            row = record.data()
+            convert += clock() - fetched
+            trace.counts["rows"] += 1
+            yield row
+    finally:
+        await records.aclose()
+        trace.add("execute", execute * 1000)
+        trace.add("convert", convert * 1000)
+
+
+class NL2CypherPipeline:
+    """Long-lived NL → Cypher pipeline: holds the LLM client, the DB connection and the prompt.
+
+    Build it once per process (ask.py, a service) and call ask()/ask_async() per question.
+    The schema file is stat()ed on each question and only re-read when its mtime or size
+    changes; the system prompt is rebuilt only when the text's hash actually differs. With
+    SCHEMA_PRUNING, each prompt carries only the schema subgraph relevant to the question
+    (nl2cypher/schema_pruner.py); .last_pruning and .pruning_totals report the token savings.
+    The FEW_SHOT_K most similar verified examples (nl2cypher/few_shot.py) are appended to the prompt.
+    Generated Cypher is EXPLAINed before it runs and sent back to the LLM for repair when rejected
+    (nl2cypher/validation.py); .last_validation and .validation_totals report attempts and stage times.
+    Every call is traced stage by stage (nl2cypher/metrics.py) and handed to the METRICS_EXPORTERS.
+    The async methods run the file I/O (schema stat/read, template cache, example store, query log)
+    and the prompt build (schema pruning, few-shot search) in worker threads via asyncio.to_thread,
+    so concurrent questions never wait on the disk or on CPU-bound retrieval.
+    """
+
+    def __init__(
+        self, llm: LLMProvider | None = None, db: Neo4jConnection | None = None, metrics: Metrics | None = None
+    ):
+        self.llm = llm or get_llm()
+        self.db = db or Neo4jConnection()
+        self.metrics = metrics or get_metrics()
+        self._schema_stat: tuple[int, int] | None = None  # (mtime_ns, size)
+        self._schema_hash: str | None = None
+        self._schema_lock = threading.Lock()  # refresh_schema also runs in to_thread workers
+        self.schema_text = ""
+        self.system_prompt = ""
+        self.pruner: SchemaPruner | None = None
+        self.last_pruning: PrunedSchema | None = None
+        self.pruning_totals = {"questions": 0, "full_tokens": 0, "prompt_tokens": 0}
+        self._pruning_lock = threading.Lock()  # async questions build their prompts in to_thread workers
+        self.last_validation: ValidationReport | None = None
+        self.validation_totals = ValidationTotals()
+        self.refresh_schema()
+
+    def refresh_schema(self) -> str:
+        """Reload the schema file if it changed on disk; returns the current schema text."""
+        path = get_schema_path()
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Schema file not found: {path}. Run from phase2/code: python scripts/generate_schema.py"
+            ) from None
+        stat_key = (st.st_mtime_ns, st.st_size)
+        with self._schema_lock:
+            if stat_key == self._schema_stat:
+                return self.schema_text
+            text = path.read_text(encoding="utf-8").strip()
+            digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            if digest != self._schema_hash:
+                self.schema_text = text
+                self.system_prompt = SYSTEM_PROMPT + "\n\n" + text
+                self.pruner = SchemaPruner(text) if settings.schema_pruning else None
+                self._schema_hash = digest
+            self._schema_stat = stat_key
+            return self.schema_text
+
+    def _streaming(self) -> bool:
+        llm = getattr(self.llm, "llm", self.llm)  # look through wrappers such as RateLimitedProvider
+        return settings.llm_streaming and isinstance(llm, StreamingLLMProvider)
+
+    def _prompt(self, question: str, verbose: bool) -> str:
+        """System prompt for question: the full schema, or only its relevant part when pruning,
+        followed by similar verified examples when there are any."""
+        prompt = self.system_prompt
+        if self.pruner is not None:
+            pruned = self.pruner.prune(question)
+            with self._pruning_lock:
+                self.last_pruning = pruned
+                self.pruning_totals["questions"] += 1
+                self.pruning_totals["full_tokens"] += pruned.full_tokens
+                self.pruning_totals["prompt_tokens"] += pruned.tokens
+            if verbose:
+                print(pruned.summary())
+            prompt = SYSTEM_PROMPT + "\n\n" + pruned.text
+        store = get_example_store()
+        examples = store.search(question, settings.few_shot_k) if store is not None else []
+        if verbose and examples:
+            print(f"Few-shot examples: {[q for q, _, _ in examples]}")
+        return prompt + "\n\n" + format_examples(examples) if examples else prompt
+
+    def _generate(self, question: str, system: str) -> str:
+        """LLM reply for question. When streaming, stops reading (and closes the stream) at the closing fence."""
+        if not self._streaming():
+            return self.llm.generate(system, question)
+        extractor = StreamingCypherExtractor()
+        stream = self.llm.stream(system, question)
+        try:
+            for chunk in stream:
+                if extractor.feed(chunk):
+                    break
+        finally:
+            stream.close()
+        return extractor.text
+
+    async def _agenerate(self, question: str, system: str) -> str:
+        if not self._streaming():
+            return await self.llm.agenerate(system, question)
+        extractor = StreamingCypherExtractor()
+        stream = self.llm.astream(system, question)
+        try:
+            async for chunk in stream:
+                if extractor.feed(chunk):
+                    break
+        finally:
+            await stream.aclose()
+        return extractor.text
+
+    def _lookup(self, question: str, verbose: bool, trace: Trace) -> tuple[str, tuple[str, dict] | None]:
+        """(schema text, guarded template-cache hit or None)."""
+        with trace.span("schema"):
+            schema_text = self.refresh_schema()
+        cache = get_template_cache()
+        with trace.span("template"):
+            hit = cache.lookup(question, schema_text) if cache is not None else None
+        if hit:
+            # Same question shape answered before: reuse its Cypher with this question's values, no LLM call.
+            # Re-guarded so this question's LIMIT value is capped too.
+            hit = guard_query(*hit)
+            if verbose:
+                print(f"Template cache hit: {hit[0]} {hit[1]}")
+        return schema_text, hit
+
+    @staticmethod
+    def _candidate(report: ValidationReport, attempt: Attempt, raw: str, verbose: bool) -> str:
+        """Guarded Cypher of an LLM reply (raises CypherRejected)."""
+        attempt.cypher = raw.strip()
+        with report.stage(attempt, "extract"):
+            attempt.cypher = _extracted_cypher(raw, verbose)
+        with report.stage(attempt, "guard"):
+            return _checked_cypher(attempt.cypher, verbose)
+
+    @staticmethod
+    def _rejected(report: ValidationReport, error: CypherRejected, verbose: bool) -> str:
+        """After a rejected attempt: the repair message for the next one."""
+        if verbose:
+            print(f"Rejected ({report.attempts[-1].stage}): {error}")
+        return repair_message(report.question, report.attempts[-1].cypher, error)
+
+    def _finish(self, report: ValidationReport, verbose: bool, trace: Trace) -> None:
+        self.last_validation = report
+        self.validation_totals.add(report)
+        trace.counts["attempts"] += len(report.attempts)
+        for attempt in report.attempts:
+            for stage, ms in attempt.ms.items():
+                trace.add(stage, ms)
+        if verbose:
+            print(report.summary())
+
+    def _resolve(self, question: str, verbose: bool, trace: Trace) -> tuple[str, dict, bool, str]:
+        """(cypher, params, cached, schema text) for question: template cache first, else the LLM.
+        Either way the query must pass EXPLAIN; a rejected template is dropped, a rejected LLM answer repaired."""
+        schema_text, hit = self._lookup(question, verbose, trace)
+        report = ValidationReport(question)
+        try:
+            if hit:
+                attempt = report.start()
+                attempt.cypher = hit[0]
+                try:
+                    self._explain(report, attempt, *hit)
+                    trace.cached = True
+                    return hit[0], hit[1], True, schema_text
+                except CypherRejected as e:
+                    if verbose:
+                        print(f"Template rejected, asking the LLM: {e}")
+            with trace.span("prompt"):
+                system, user = self._prompt(question, verbose), question
+            system_tokens = estimate_tokens(system)
+            for _ in range(1 + max(settings.cypher_repair_attempts, 0)):
+                attempt = report.start()
+                with report.stage(attempt, "generate"):
+                    raw = self._generate(user, system)
+                trace.counts["prompt_tokens"] += system_tokens + estimate_tokens(user)
+                trace.counts["completion_tokens"] += estimate_tokens(raw)
+                try:
+                    cypher = self._candidate(report, attempt, raw, verbose)
+                    self._explain(report, attempt, cypher, {})
+                    return cypher, {}, False, schema_text
+                except CypherRejected as e:
+                    user = self._rejected(report, e, verbose)
+            raise CypherRejected(f"No valid Cypher after {len(report.attempts)} attempt(s): {report.attempts[-1].reason}")
+        finally:
+            self._finish(report, verbose, trace)
+
+    async def _aresolve(self, question: str, verbose: bool, trace: Trace) -> tuple[str, dict, bool, str]:
+        llm = getattr(self.llm, "llm", self.llm)  # a RateLimitedProvider has agenerate even around a sync provider
+        if not isinstance(llm, AsyncLLMProvider):
+            raise ValueError(f"{type(llm).__name__} has no async support (agenerate).")
+        schema_text, hit = await asyncio.to_thread(self._lookup, question, verbose, trace)
+        report = ValidationReport(question)
+        try:
+            if hit:
+                attempt = report.start()
+                attempt.cypher = hit[0]
+                try:
+                    await self._aexplain(report, attempt, *hit)
+                    trace.cached = True
+                    return hit[0], hit[1], True, schema_text
+                except CypherRejected as e:
+                    if verbose:
+                        print(f"Template rejected, asking the LLM: {e}")
+            with trace.span("prompt"):
+                system, user = await asyncio.to_thread(self._prompt, question, verbose), question
+            system_tokens = estimate_tokens(system)
+            for _ in range(1 + max(settings.cypher_repair_attempts, 0)):
+                attempt = report.start()
+                with report.stage(attempt, "generate"):
+                    raw = await self._agenerate(user, system)
+                trace.counts["prompt_tokens"] += system_tokens + estimate_tokens(user)
+                trace.counts["completion_tokens"] += estimate_tokens(raw)
+                try:
+                    cypher = self._candidate(report, attempt, raw, verbose)
+                    await self._aexplain(report, attempt, cypher, {})
+                    return cypher, {}, False, schema_text
+                except CypherRejected as e:
+                    user = self._rejected(report, e, verbose)
+            raise CypherRejected(f"No valid Cypher after {len(report.attempts)} attempt(s): {report.attempts[-1].reason}")
+        finally:
+            self._finish(report, verbose, trace)
+
+    def _explain(self, report: ValidationReport, attempt: Attempt, cypher: str, params: dict) -> None:
+        """Plan the query under EXPLAIN (when CYPHER_EXPLAIN_VALIDATION) and check its estimated rows."""
+        if settings.cypher_explain_validation:
+            with report.stage(attempt, "explain"):
+                check_plan(self.db.explain(cypher, params))
+
+    async def _aexplain(self, report: ValidationReport, attempt: Attempt, cypher: str, params: dict) -> None:
+        if settings.cypher_explain_validation:
+            with report.stage(attempt, "explain"):
+                check_plan(await AsyncNeo4jConnection().explain(cypher, params))
+
+    def _from_cursor(self, cursor: str, trace: Trace) -> tuple[str, dict, dict]:
+        """(cypher, params, state) of a page cursor, its query EXPLAINed again like a template hit."""
+        cypher, params, state = _cursor_state(cursor)
+        report = ValidationReport("")
+        attempt = report.start()
+        attempt.cypher = cypher
+        try:
+            self._explain(report, attempt, cypher, params)
+        finally:
+            for stage, ms in attempt.ms.items():
+                trace.add(stage, ms)
+        return cypher, params, state
+
+    async def _afrom_cursor(self, cursor: str, trace: Trace) -> tuple[str, dict, dict]:
+        cypher, params, state = _cursor_state(cursor)
+        report = ValidationReport("")
+        attempt = report.start()
+        attempt.cypher = cypher
+        try:
+            await self._aexplain(report, attempt, cypher, params)
+        finally:
+            for stage, ms in attempt.ms.items():
+                trace.add(stage, ms)
+        return cypher, params, state
+
+    @staticmethod
+    def _remember(question: str, cypher: str, params: dict, cached: bool, schema_text: str, rows: bool) -> None:
+        """After a successful run: log the query, store new Cypher as a template and, if it returned
+        rows, as a few-shot example."""
+        log_query(cypher, params, cached=cached)
+        if cached:
+            return
+        cache = get_template_cache()
+        if cache is not None:
+            cache.store(question, cypher, schema_text)
+        store = get_example_store()
+        if store is not None and rows:
+            store.add(question, cypher)
+
+    def ask(self, question: str, verbose: bool = False) -> dict[str, Any]:
+        with self.metrics.traced("ask", question) as trace:
+            cypher, params, cached, schema_text = self._resolve(question, verbose, trace)
+            with trace.span("execute"):
+                records = self.db.execute_query(cypher, params, cache=True)
+            with trace.span("convert"):
+                results = _to_dicts(records)
+            trace.counts["rows"] = len(results)
+            self._remember(question, cypher, params, cached, schema_text, bool(records))
+        if verbose:
+            print(trace.summary())
+        return {"query": cypher, "params": params, "cached": cached, "results": results}
+
+    async def ask_async(self, question: str, verbose: bool = False) -> dict[str, Any]:
+        """Async ask: awaits the LLM (agenerate) and the async driver, so one event loop can keep
+        many questions in flight, e.g. asyncio.gather(*(pipeline.ask_async(q) for q in questions)).
+        """
+        with self.metrics.traced("ask_async", question) as trace:
+            cypher, params, cached, schema_text = await self._aresolve(question, verbose, trace)
+            with trace.span("execute"):
+                records = await AsyncNeo4jConnection().execute_query(cypher, params, cache=True)
+            with trace.span("convert"):
+                results = _to_dicts(records)
+            trace.counts["rows"] = len(results)
+            await asyncio.to_thread(self._remember, question, cypher, params, cached, schema_text, bool(records))
+        if verbose:
+            print(trace.summary())
+        return {"query": cypher, "params": params, "cached": cached, "results": results}
+
+    def ask_stream(self, question: str, verbose: bool = False, fetch_size: int | None = None) -> dict[str, Any]:
+        """Like ask(), but "results" is a generator of row dicts read from the open result fetch_size at
+        a time, so the first rows can be shown right away in constant memory. Stop early with .close().
+        The call's trace is exported when the generator finishes or is closed, or, if it is never
+        iterated, when it is garbage-collected.
+        """
+        with self.metrics.traced("ask_stream", question) as trace:
+            cypher, params, cached, schema_text = self._resolve(question, verbose, trace)
+            trace.deferred = True
+
+        def _rows() -> Iterator[dict[str, Any]]:
+            remembered = False
+            try:
+                for row in _timed_rows(trace, self.db.stream_query(cypher, params, fetch_size)):
+                    if not remembered:
+                        remembered = True
+                        self._remember(question, cypher, params, cached, schema_text, True)
+                    yield row
+                if not remembered:
+                    self._remember(question, cypher, params, cached, schema_text, False)
+            except Exception:
+                trace.status = "error"
+                raise
+            finally:
+                self.metrics.finish(trace)
+                if verbose:
+                    print(trace.summary())
+
+        rows = _rows()
+        self.metrics.finish_with(trace, rows)
+        return {"query": cypher, "params": params, "cached": cached, "results": rows}
+
+    async def ask_stream_async(
+        self, question: str, verbose: bool = False, fetch_size: int | None = None
+    ) -> dict[str, Any]:
+        """Async ask_stream: "results" is an async generator (aclose() it to stop early)."""
+        with self.metrics.traced("ask_stream_async", question) as trace:
+            cypher, params, cached, schema_text = await self._aresolve(question, verbose, trace)
+            trace.deferred = True
+
+        async def _rows() -> AsyncIterator[dict[str, Any]]:
+            remembered = False
+            try:
+                stream = AsyncNeo4jConnection().stream_query(cypher, params, fetch_size)
+                async for row in _atimed_rows(trace, stream):
+                    if not remembered:
+                        remembered = True
+                        await asyncio.to_thread(self._remember, question, cypher, params, cached, schema_text, True)
+                    yield row
+                if not remembered:
+                    await asyncio.to_thread(self._remember, question, cypher, params, cached, schema_text, False)
+            except Exception:
+                trace.status = "error"
+                raise
+            finally:
+                self.metrics.finish(trace)
+                if verbose:
+                    print(trace.summary())
+
+        rows = _rows()
+        self.metrics.finish_with(trace, rows)
+        return {"query": cypher, "params": params, "cached": cached, "results": rows}
+
+    def ask_page(
+        self, question: str, page_size: int | None = None, cursor: str | None = None, verbose: bool = False
+    ) -> dict[str, Any]:
+        """One page of results: {query, params, cached, results, mode, next_cursor}.
+
+        Pass next_cursor back for the following page (the question is then not re-asked); None means
+        this was the last page. See nl2cypher/pagination.py for keyset vs offset paging.
+        """
+        page_size = page_size or settings.page_size
+        with self.metrics.traced("ask_page", question) as trace:
+            if cursor:
+                cypher, params, state = self._from_cursor(cursor, trace)
+            else:
+                cypher, params, cached, schema_text = self._resolve(question, verbose, trace)
+                state = {"query": cypher, "params": params, "offset": 0}
+            query, page_params, mode = page_query(cypher, params, page_size, state)
+            skip = state["offset"] if mode == "client" else 0
+            with trace.span("execute"):
+                stream = self.db.stream_query(query, page_params, fetch_size=page_size + 1)
+                try:
+                    rows = [record.data() for record in islice(stream, skip, skip + page_size + 1)]
+                finally:
+                    stream.close()
+            if not cursor:
+                self._remember(question, cypher, params, cached, schema_text, bool(rows))
+            rows, next_cursor = finish_page(rows, page_size, state, mode)
+            trace.counts["rows"] = len(rows)
+        if verbose:
+            print(trace.summary())
+        return {"query": cypher, "params": params, "cached": not cursor and cached, "results": rows,
+                "mode": mode, "next_cursor": next_cursor}
+
+    async def ask_page_async(
+        self, question: str, page_size: int | None = None, cursor: str | None = None, verbose: bool = False
+    ) -> dict[str, Any]:
+        """Async ask_page."""
+        page_size = page_size or settings.page_size
+        with self.metrics.traced("ask_page_async", question) as trace:
+            if cursor:
+                cypher, params, state = await self._afrom_cursor(cursor, trace)
+            else:
+                cypher, params, cached, schema_text = await self._aresolve(question, verbose, trace)
+                state = {"query": cypher, "params": params, "offset": 0}
+            query, page_params, mode = page_query(cypher, params, page_size, state)
+            skip = state["offset"] if mode == "client" else 0
+            with trace.span("execute"):
+                stream = AsyncNeo4jConnection().stream_query(query, page_params, fetch_size=page_size + 1)
+                rows, seen = [], 0
+                try:
+                    async for record in stream:
+                        seen += 1
+                        if seen > skip:
+                            rows.append(record.data())
+                        if len(rows) > page_size:
+                            break
+                finally:
+                    await stream.aclose()
+            if not cursor:
+                await asyncio.to_thread(self._remember, question, cypher, params, cached, schema_text, bool(rows))
+            rows, next_cursor = finish_page(rows, page_size, state, mode)
+            trace.counts["rows"] = len(rows)
+        if verbose:
+            print(trace.summary())
+        return {"query": cypher, "params": params, "cached": not cursor and cached, "results": rows,
+                "mode": mode, "next_cursor": next_cursor}
+
+
+_pipeline: NL2CypherPipeline | None = None
+
+
+def get_pipeline() -> NL2CypherPipeline:
+    """Process-wide pipeline used by ask_graph / ask_graph_async (created on first question)."""
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = NL2CypherPipeline()
+    return _pipeline
+
+
+def ask_graph(question: str,verbose:bool=False) -> dict[str, Any]:
+    return get_pipeline().ask(question, verbose=verbose)
+
+
+async def ask_graph_async(question: str, verbose: bool = False) -> dict[str, Any]:
+    """Async ask_graph on the shared pipeline (see NL2CypherPipeline.ask_async)."""
+    return await get_pipeline().ask_async(question, verbose=verbose)
+
+
+def ask_graph_stream(question: str, verbose: bool = False, fetch_size: int | None = None) -> dict[str, Any]:
+    """ask_graph with "results" as a row generator (see NL2CypherPipeline.ask_stream)."""
+    return get_pipeline().ask_stream(question, verbose=verbose, fetch_size=fetch_size)
+
+
+def ask_graph_page(
+    question: str, page_size: int | None = None, cursor: str | None = None, verbose: bool = False
+) -> dict[str, Any]:
+    """One page of ask_graph results plus next_cursor (see NL2CypherPipeline.ask_page)."""
+    return get_pipeline().ask_page(question, page_size=page_size, cursor=cursor, verbose=verbose)
@@ -5,4 +5,17 @@ Use only MATCH, RETURN, WHERE, WITH, ORDER BY, LIMIT. No CREATE/MERGE/DELETE. No
 
 Relationship direction is critical: (A)-[:REL]->(B) means A has the outgoing relationship to B. Always use the exact directions from the schema—do not reverse them.
 Relationships are path patterns in MATCH, e.g. (a)-[:REL_TYPE]->(b). Do not use relationship types as properties (e.g. a.REL_TYPE = b is invalid).
-"""
\ No newline at end of file
+"""
+# User message for a repair attempt (nl2cypher/validation.py): the previous query and why it was rejected
+REPAIR_PROMPT = """Question: {question}
+
+Your previous query was rejected before it ran:
+```cypher
+{cypher}
+```
+Reason: {error}
+Most expensive plan operators:
+{hints}
+
+Reply with ONLY a corrected Cypher READ query for the question.
+"""
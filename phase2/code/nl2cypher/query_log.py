@@ -0,0 +1,46 @@
+"""Append-only JSONL log of the Cypher that ask_graph executes (input to scripts/advise_indexes.py).
+
+One line per executed query: {"ts", "query", "params", "cached"}. Writes are serialized with a
+lock so threads and the async path can share the file; disable with QUERY_LOG_ENABLED=false.
+"""
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Iterator
+
+from core.config import resolve_code_path, settings
+
+_lock = threading.Lock()
+
+
+def get_query_log_path() -> Path:
+    return resolve_code_path(settings.query_log_file)
+
+
+def log_query(query: str, params: dict | None = None, cached: bool = False) -> None:
+    """Record one executed query (no-op when the log is disabled)."""
+    if not settings.query_log_enabled:
+        return
+    line = json.dumps(
+        {"ts": round(time.time(), 3), "query": query, "params": params or {}, "cached": cached},
+        default=str,
+    )
+    path = get_query_log_path()
+    with _lock:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def read_query_log(path: Path | None = None) -> Iterator[dict]:
+    """Yield logged entries, skipping lines that are not valid JSON (e.g. a torn last write)."""
+    path = path or get_query_log_path()
+    if not path.exists():
+        return
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
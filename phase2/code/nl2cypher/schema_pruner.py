@@ -0,0 +1,174 @@
+"""Question-relevant schema pruning: send the LLM only the part of graph_schema.txt a question needs.
+
+The schema text (format of scripts/generate_schema.build_schema_text) is parsed into labels with
+their properties and (from)-[:TYPE]->(to) relationships. Each label and each relationship type is
+indexed under the words of its name and properties. camelCase and snake_case are split, and words
+are lower-cased and lightly stemmed, so "salaries" finds `salary` and "works in" finds WORKS_IN.
+Words are weighted by IDF across the schema.
+
+For a question, the best-scoring labels and relationships (at most MAX_CORE, each scoring at least
+MIN_RELATIVE_SCORE of the best, so a common property such as `name` does not pull in every label)
+make up the core. Endpoints of matched relationships are added to it. The pruned schema is the core plus every relationship
+touching it and the label at the other end (one hop). If nothing matches, the full schema is used.
+Try it on the current schema with scripts/prune_schema.py.
+"""
+import math
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+HEADER = "Graph schema (Neo4j Cypher):"
+MAX_CORE = 8
+MIN_RELATIVE_SCORE = 0.25
+_REL_RE = re.compile(r"\(([^()]+)\)-\[:([^\]]+)\]->\(([^()]+)\)")
+_NODE_RE = re.compile(r"\s*([^(),]+?)\s*(?:\(([^()]*)\))?\s*(?:,|$)")
+_CAMEL_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+_STOPWORDS = {
+    "a", "all", "an", "and", "are", "as", "at", "by", "do", "does", "each", "for", "from", "get",
+    "give", "has", "have", "how", "in", "is", "it", "list", "many", "me", "most", "much", "of",
+    "on", "or", "show", "than", "that", "the", "their", "there", "to", "was", "were", "what",
+    "which", "who", "whose", "with",
+}
+
+
+def _stem(word: str) -> str:
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"  # salaries -> salary
+    if len(word) > 4 and word.endswith(("ses", "xes", "zes", "ches", "shes")):
+        return word[:-2]  # classes -> class
+    for suffix in ("ing", "ed", "s"):
+        if len(word) - len(suffix) >= 3 and word.endswith(suffix) and not word.endswith("ss"):
+            return word[: -len(suffix)]  # employees -> employee, works -> work
+    return word
+
+
+def terms(text: str) -> list[str]:
+    """Index terms of a question or identifier: split camelCase/snake_case, lower-case, stem, drop stopwords."""
+    words = [w.lower() for part in re.findall(r"[A-Za-z0-9]+", text) for w in _CAMEL_RE.findall(part)]
+    return [_stem(w) for w in words if w not in _STOPWORDS]
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough LLM token count (words and punctuation), enough to compare prompt sizes."""
+    return len(re.findall(r"\w+|[^\w\s]", text))
+
+
+@dataclass
+class GraphSchema:
+    labels: dict[str, list[str]]  # label -> properties, in file order
+    relationships: list[tuple[str, str, str]]  # (from label, type, to label)
+
+    @classmethod
+    def parse(cls, text: str) -> "GraphSchema | None":
+        """Parse build_schema_text output; None if the text is not in that format (e.g. hand-written)."""
+        labels: dict[str, list[str]] = {}
+        relationships: list[tuple[str, str, str]] = []
+        found = False
+        for line in text.splitlines():
+            line = line.strip()
+            if line.startswith("- Nodes:"):
+                found = True
+                for m in _NODE_RE.finditer(line[len("- Nodes:"):]):
+                    if m.group(1):
+                        props = [p.strip() for p in (m.group(2) or "").split(",") if p.strip()]
+                        labels[m.group(1)] = props
+            elif line.startswith("- Relationships:"):
+                relationships = [tuple(part.strip() for part in m.groups()) for m in _REL_RE.finditer(line)]
+        if not found:
+            return None
+        for start, _, end in relationships:
+            labels.setdefault(start, [])
+            labels.setdefault(end, [])
+        return cls(labels, relationships)
+
+    def render(self, labels: set[str] | None = None, relationships: list[tuple[str, str, str]] | None = None) -> str:
+        """Schema text for a subset (same format as build_schema_text)."""
+        keep = self.labels if labels is None else labels
+        rels = self.relationships if relationships is None else relationships
+        nodes = [f"{label} ({', '.join(self.labels[label])})" if self.labels[label] else label
+                 for label in sorted(keep)]
+        lines = [HEADER, "- Nodes: " + ", ".join(nodes)]
+        lines.append("- Relationships: " + ", ".join(f"({f})-[:{t}]->({to})" for f, t, to in rels))
+        return "\n".join(lines)
+
+
+@dataclass
+class PrunedSchema:
+    text: str
+    labels: list[str]
+    relationships: list[str]
+    full_tokens: int
+    tokens: int
+    matched: list[str] = field(default_factory=list)  # question terms that hit the schema
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.full_tokens - self.tokens
+
+    def summary(self) -> str:
+        pct = 100.0 * self.saved_tokens / self.full_tokens if self.full_tokens else 0.0
+        return (f"Schema pruned to {len(self.labels)} labels / {len(self.relationships)} relationships: "
+                f"~{self.tokens} of ~{self.full_tokens} tokens ({pct:.0f}% saved)")
+
+
+class SchemaPruner:
+    """Lexical index over one schema text; build once per schema change, prune() per question."""
+
+    def __init__(self, schema_text: str):
+        self.text = schema_text
+        self.full_tokens = estimate_tokens(schema_text)
+        self.schema = GraphSchema.parse(schema_text)
+        # term -> {("label", name) | ("rel", type): weight}; label/type words count double vs properties
+        self._postings: dict[str, dict[tuple[str, str], float]] = defaultdict(dict)
+        if self.schema is None:
+            return
+        documents: dict[tuple[str, str], dict[str, float]] = {}
+        for label, props in self.schema.labels.items():
+            doc = {t: 1.0 for p in props for t in terms(p)}
+            doc.update({t: 2.0 for t in terms(label)})
+            documents[("label", label)] = doc
+        for _, rel_type, _ in self.schema.relationships:
+            documents[("rel", rel_type)] = {t: 2.0 for t in terms(rel_type)}
+        frequency: dict[str, int] = defaultdict(int)
+        for doc in documents.values():
+            for term in doc:
+                frequency[term] += 1
+        for key, doc in documents.items():
+            for term, weight in doc.items():
+                self._postings[term][key] = weight * math.log(1 + len(documents) / frequency[term])
+
+    def scores(self, question: str) -> tuple[dict[tuple[str, str], float], list[str]]:
+        """({("label" | "rel", name): score}, matched terms) for the question."""
+        scores: dict[tuple[str, str], float] = defaultdict(float)
+        matched = []
+        for term in dict.fromkeys(terms(question)):
+            postings = self._postings.get(term)
+            if postings:
+                matched.append(term)
+                for key, weight in postings.items():
+                    scores[key] += weight
+        return scores, matched
+
+    def prune(self, question: str) -> PrunedSchema:
+        if self.schema is None:
+            return PrunedSchema(self.text, [], [], self.full_tokens, self.full_tokens)
+        scores, matched = self.scores(question)
+        rels = self.schema.relationships
+        ranked = sorted(scores.items(), key=lambda item: -item[1])[:MAX_CORE]
+        best = ranked[0][1] if ranked else 0.0
+        selected = [key for key, score in ranked if score >= best * MIN_RELATIVE_SCORE]
+        core = {name for kind, name in selected if kind == "label"}
+        matched_types = {name for kind, name in selected if kind == "rel"}
+        for start, rel_type, end in rels:
+            if rel_type in matched_types:
+                core |= {start, end}
+        if not core:
+            return PrunedSchema(self.text, sorted(self.schema.labels), [t for _, t, _ in rels],
+                                self.full_tokens, self.full_tokens, matched)
+        # One hop: every relationship touching the core, and the label at its other end
+        kept_rels = [r for r in rels if r[0] in core or r[2] in core]
+        labels = core | {r[0] for r in kept_rels} | {r[2] for r in kept_rels}
+        text = self.schema.render(labels, kept_rels)
+        return PrunedSchema(text, sorted(labels), [t for _, t, _ in kept_rels],
+                            self.full_tokens, estimate_tokens(text), matched)
+
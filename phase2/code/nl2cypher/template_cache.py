@@ -0,0 +1,270 @@
+"""Parameterized Cypher template cache: reuse a verified query for questions of the same shape.
+
+When a generated query runs successfully, literals that also appear verbatim in the question
+(e.g. 'Sales', 30) are lifted out as $p0, $p1, ... and the question becomes a pattern such as
+"employees in department {p0} older than {p1}". A later question matching that pattern reuses
+the template with its own values and skips the LLM.
+
+A string placeholder matches whole words only, and a match is refused (the LLM is asked instead)
+when a captured string contains the pattern's own fixed words or a literal left in the template,
+contains more conjunctions (and, or, nor, a comma) than that value did, or is more than
+STRING_SLACK_WORDS words longer than it: such a capture has swallowed part of a differently
+shaped question, e.g. "movies directed by {p0}" against "movies directed by Nolan released after
+2010", or "employees in the {p0} department" against "employees in the Sales or IT department".
+
+Entries are kept in LRU order, persisted to a JSON file every SAVE_EVERY changes and at exit, and
+dropped when the schema text changes. All access is serialized with a lock.
+"""
+import atexit
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from core.config import resolve_code_path, settings
+
+# String literal or standalone number in Cypher (numbers inside identifiers / ranges are skipped).
+_LITERAL_RE = re.compile(
+    r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")|(?<![\w$.])(-?\d+(?:\.\d+)?)(?![\w.])"""
+)
+_PLACEHOLDER_RE = re.compile(r"\{(p\d+)\}")
+_NUMBER_GROUP = r"-?\d+(?:\.\d+)?"
+_STRING_GROUP = r"(?<!\w)\S(?:.*?\S)?(?!\w)"
+_CONJUNCTION_RE = re.compile(r"(?<!\w)(?:and|or|nor)(?!\w)|[,&]", re.IGNORECASE)
+STRING_SLACK_WORDS = 2
+SAVE_EVERY = 20
+
+
+def normalize_question(question: str) -> str:
+    """Collapse whitespace and drop trailing punctuation; case is kept (it is part of entity values)."""
+    return re.sub(r"\s+", " ", question).strip().rstrip("?.!").strip()
+
+
+def schema_hash(schema_text: str) -> str:
+    return hashlib.sha256(schema_text.encode("utf-8")).hexdigest()
+
+
+def _find_once(text: str, value: str, numeric: bool) -> tuple[int, int] | None:
+    """Span of value in text if it occurs exactly once (as a whole number for numerics)."""
+    if numeric:
+        pattern = rf"(?<![\w.]){re.escape(value)}(?!\w|\.\d)"
+    else:
+        pattern = re.escape(value)
+    spans = [m.span() for m in re.finditer(pattern, text)]
+    return spans[0] if len(spans) == 1 else None
+
+
+def parameterize(question: str, cypher: str) -> tuple[str, str, dict[str, str]] | None:
+    """Lift literals shared by question and Cypher. Returns (pattern, template, {param: type}) or None."""
+    text = normalize_question(question)
+    if "{" in text or "}" in text:
+        return None
+
+    lifted: dict[str, tuple[str, str]] = {}  # literal token -> (param name, type)
+    spans: list[tuple[int, int, str]] = []
+    for m in _LITERAL_RE.finditer(cypher):
+        token = m.group(0)
+        if token in lifted:
+            continue
+        numeric = m.group(2) is not None
+        value = token if numeric else token[1:-1]
+        if not value or ("\\" in value):
+            continue
+        span = _find_once(text, value, numeric)
+        if span is None or any(s < span[1] and span[0] < e for s, e, _ in spans):
+            continue
+        name = f"p{len(lifted)}"
+        lifted[token] = (name, "number" if numeric else "string")
+        spans.append((span[0], span[1], name))
+
+    pattern = text
+    for start, end, name in sorted(spans, reverse=True):
+        pattern = pattern[:start] + "{" + name + "}" + pattern[end:]
+    # A pattern that is (almost) all placeholders would match unrelated questions
+    if len(re.findall(r"\w+", _PLACEHOLDER_RE.sub(" ", pattern))) < 2:
+        return None
+
+    def _replace(m: re.Match) -> str:
+        hit = lifted.get(m.group(0))
+        return f"${hit[0]}" if hit else m.group(0)
+
+    template = _LITERAL_RE.sub(_replace, cypher)
+    return pattern, template, {name: kind for name, kind in lifted.values()}
+
+
+def _compile(pattern: str, types: dict[str, str]) -> re.Pattern:
+    parts = _PLACEHOLDER_RE.split(pattern)
+    regex = []
+    for i, part in enumerate(parts):
+        if i % 2 == 0:
+            regex.append(re.escape(part))
+        else:
+            group = _NUMBER_GROUP if types.get(part) == "number" else _STRING_GROUP
+            regex.append(f"(?P<{part}>{group})")
+    return re.compile("".join(regex), re.IGNORECASE)
+
+
+def _fixed_words(pattern: str, template: str) -> re.Pattern | None:
+    """Whole-word regex of the pattern's fixed text and the template's remaining string literals."""
+    texts = [part.strip() for part in _PLACEHOLDER_RE.sub("\x00", pattern).split("\x00")]
+    texts += [m.group(1)[1:-1] for m in _LITERAL_RE.finditer(template) if m.group(1)]
+    texts = [t for t in texts if re.search(r"\w", t)]
+    if not texts:
+        return None
+    return re.compile("|".join(rf"(?<!\w){re.escape(t)}(?!\w)" for t in texts), re.IGNORECASE)
+
+
+def _plausible(entry: dict, fixed: re.Pattern | None, values: dict[str, str]) -> bool:
+    """False when a captured string looks like it swallowed part of a different question."""
+    for name, value in values.items():
+        if entry["types"][name] != "string":
+            continue
+        if fixed is not None and fixed.search(value):
+            return False
+        if len(_CONJUNCTION_RE.findall(value)) > entry.get("joins", {}).get(name, 0):
+            return False
+        words = entry.get("words", {}).get(name)
+        if words is not None and len(value.split()) > words + STRING_SLACK_WORDS:
+            return False
+    return True
+
+
+def _cast(value: str, kind: str):
+    if kind == "number":
+        return float(value) if "." in value else int(value)
+    return value
+
+
+class TemplateCache:
+    """LRU map of question pattern -> (Cypher template, param types), persisted as JSON."""
+
+    def __init__(self, path: Path, max_entries: int = 512):
+        self.path = path
+        self.max_entries = max_entries
+        self._schema_hash: str | None = None
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._compiled: dict[str, tuple[re.Pattern, re.Pattern | None]] = {}
+        self._unsaved = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        self._schema_hash = data.get("schema_hash")
+        for entry in data.get("entries", []):
+            self._entries[entry["pattern"]] = entry
+
+    def save(self) -> None:
+        """Write the cache file if anything changed since the last save (atomic replace)."""
+        with self._lock:
+            if not self._unsaved:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            data = {"schema_hash": self._schema_hash, "entries": list(self._entries.values())}
+            tmp.write_text(json.dumps(data, indent=1), encoding="utf-8")
+            tmp.replace(self.path)
+            self._unsaved = 0
+
+    def _changed(self) -> bool:
+        """Count one change; True when a save is due."""
+        self._unsaved += 1
+        return self._unsaved >= SAVE_EVERY
+
+    def _check_schema(self, schema_text: str) -> bool:
+        """Drop every template when the schema file's contents change; True when a save is due."""
+        current = schema_hash(schema_text)
+        if self._schema_hash == current:
+            return False
+        had_entries = bool(self._entries)
+        self._entries.clear()
+        self._compiled.clear()
+        self._schema_hash = current
+        if had_entries:
+            self._unsaved = SAVE_EVERY  # write the empty cache right away
+        return had_entries
+
+    def _matcher(self, pattern: str, entry: dict) -> tuple[re.Pattern, re.Pattern | None]:
+        compiled = self._compiled.get(pattern)
+        if compiled is None:
+            compiled = self._compiled[pattern] = (
+                _compile(pattern, entry["types"]),
+                _fixed_words(pattern, entry["cypher"]),
+            )
+        return compiled
+
+    def lookup(self, question: str, schema_text: str) -> tuple[str, dict] | None:
+        """Return (Cypher template, params) for a question matching a cached pattern, else None."""
+        text = normalize_question(question)
+        found = None
+        with self._lock:
+            due = self._check_schema(schema_text)
+            for pattern in reversed(self._entries):
+                entry = self._entries[pattern]
+                regex, fixed = self._matcher(pattern, entry)
+                m = regex.fullmatch(text)
+                if m and _plausible(entry, fixed, m.groupdict()):
+                    self._entries.move_to_end(pattern)
+                    params = {name: _cast(value, entry["types"][name]) for name, value in m.groupdict().items()}
+                    found = entry["cypher"], params
+                    break
+        if due:
+            self.save()
+        return found
+
+    def store(self, question: str, cypher: str, schema_text: str) -> None:
+        """Remember a query that ran successfully for this question."""
+        lifted = parameterize(question, cypher)
+        with self._lock:
+            due = self._check_schema(schema_text)
+            if lifted is not None:
+                due = self._add(question, *lifted) or due
+        if due:
+            self.save()
+
+    def _add(self, question: str, pattern: str, template: str, types: dict[str, str]) -> bool:
+        m = _compile(pattern, types).fullmatch(normalize_question(question))
+        if m is None:  # the pattern cannot even reproduce its own question
+            return False
+        strings = {name: value for name, value in m.groupdict().items() if types[name] == "string"}
+        self._entries[pattern] = {
+            "pattern": pattern,
+            "cypher": template,
+            "types": types,
+            "words": {name: len(value.split()) for name, value in strings.items()},
+            "joins": {name: len(_CONJUNCTION_RE.findall(value)) for name, value in strings.items()},
+        }
+        self._entries.move_to_end(pattern)
+        self._compiled.pop(pattern, None)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._compiled.pop(evicted, None)
+        return self._changed()
+
+
+_cache: TemplateCache | None = None
+_cache_lock = threading.Lock()  # first use may come from several asyncio.to_thread workers at once
+
+
+def get_template_cache() -> TemplateCache | None:
+    """Process-wide cache from settings, or None when TEMPLATE_CACHE_ENABLED is false."""
+    global _cache
+    if not settings.template_cache_enabled:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = TemplateCache(
+                resolve_code_path(settings.template_cache_file), settings.template_cache_size
+            )
+            atexit.register(_cache.save)
+    return _cache
@@ -0,0 +1,163 @@
+"""EXPLAIN validation and self-repair of generated Cypher.
+
+Before a generated query runs, the database plans it under EXPLAIN, which is cheap and executes
+nothing. The candidate is rejected when:
+  - the server cannot compile it (syntax error, unknown function, wrong types...), or
+  - some operator of the plan estimates more rows than CYPHER_MAX_ESTIMATED_ROWS.
+A rejection raised by cypher_guard.py (writes, unbounded paths, Cartesian products) counts the same.
+The reason, with hints from the plan (the operators with the largest estimates), goes back to the
+LLM in a repair prompt (prompts.REPAIR_PROMPT). This repeats at most CYPHER_REPAIR_ATTEMPTS times,
+and only a query that passes is executed.
+
+Every attempt is recorded in a ValidationReport: the Cypher, where it failed and why, and the
+milliseconds spent in each stage (generate, extract, guard, explain).
+"""
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from neo4j.exceptions import Neo4jError
+
+from core.config import settings
+from nl2cypher.cypher_guard import CypherRejected
+from nl2cypher.prompts import REPAIR_PROMPT
+
+STAGES = ("generate", "extract", "guard", "explain")
+MAX_HINTS = 3
+
+
+class PlanRejected(CypherRejected):
+    """The database refused to plan the query, or its plan is estimated too expensive."""
+
+    def __init__(self, reason: str, hints: list[str] | None = None):
+        super().__init__(reason)
+        self.reason = reason
+        self.hints = hints or []
+
+
+def _operators(plan: dict | None):
+    stack = [plan] if plan else []
+    while stack:
+        op = stack.pop()
+        stack.extend(op.get("children", []))
+        yield op
+
+
+def plan_hints(plan: dict | None, limit: int = MAX_HINTS) -> list[str]:
+    """The operators with the largest estimated rows, e.g. "AllNodesScan n: ~2000000 rows"."""
+    ops = sorted(_operators(plan), key=lambda op: -float(op.get("args", {}).get("EstimatedRows", 0.0)))
+    hints = []
+    for op in ops[:limit]:
+        args = op.get("args", {})
+        name = op.get("operatorType", "?").split("@")[0]
+        details = str(args.get("Details", "")).strip()
+        label = f"{name} {details}" if details else name
+        hints.append(f"{label}: ~{float(args.get('EstimatedRows', 0.0)):.0f} rows")
+    return hints
+
+
+def estimated_rows(plan: dict | None) -> float:
+    """Largest estimated row count of any operator (an early scan can dwarf the final result)."""
+    return max((float(op.get("args", {}).get("EstimatedRows", 0.0)) for op in _operators(plan)), default=0.0)
+
+
+def check_plan(plan: dict | None, max_rows: int | None = None) -> None:
+    """Raise PlanRejected if an operator of the plan estimates more than max_rows rows."""
+    max_rows = max_rows or settings.cypher_max_estimated_rows
+    rows = estimated_rows(plan)
+    if rows > max_rows:
+        raise PlanRejected(
+            f"Plan estimates ~{rows:.0f} rows, above the limit of {max_rows}; "
+            "add filters, labels or relationship patterns that narrow the match",
+            plan_hints(plan),
+        )
+
+
+def explain_error(error: Neo4jError) -> PlanRejected | None:
+    """PlanRejected for a compile error of the statement; None for anything else (auth, connection...)."""
+    if not str(error.code or "").startswith("Neo.ClientError.Statement."):
+        return None
+    return PlanRejected(f"Neo4j could not compile the query: {error.message or error}")
+
+
+def repair_message(question: str, cypher: str, error: CypherRejected) -> str:
+    """User message asking the LLM to fix its previous answer."""
+    hints = getattr(error, "hints", [])
+    hint_text = "\n".join(f"- {h}" for h in hints) if hints else "- none"
+    return REPAIR_PROMPT.format(question=question, cypher=cypher or "(none)", error=error, hints=hint_text)
+
+
+@dataclass
+class Attempt:
+    cypher: str
+    stage: str | None = None  # stage that rejected it; None if it passed
+    reason: str | None = None
+    ms: dict[str, float] = field(default_factory=dict)  # stage -> milliseconds
+
+
+@dataclass
+class ValidationReport:
+    """Attempts made for one question, in order; the last one passed unless .passed is False."""
+
+    question: str
+    attempts: list[Attempt] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return bool(self.attempts) and self.attempts[-1].stage is None
+
+    def start(self) -> Attempt:
+        self.attempts.append(Attempt(""))
+        return self.attempts[-1]
+
+    @contextmanager
+    def stage(self, attempt: Attempt, name: str) -> Iterator[None]:
+        """Time one stage of attempt; a CypherRejected (or statement error from the server) marks where it failed."""
+        started = time.perf_counter()
+        try:
+            yield
+        except CypherRejected as e:
+            attempt.stage, attempt.reason = name, str(e)
+            raise
+        except Neo4jError as e:
+            rejected = explain_error(e)
+            if rejected is None:
+                raise
+            attempt.stage, attempt.reason = name, str(rejected)
+            raise rejected from e
+        finally:
+            attempt.ms[name] = attempt.ms.get(name, 0.0) + (time.perf_counter() - started) * 1000
+
+    def summary(self) -> str:
+        total = sum(sum(a.ms.values()) for a in self.attempts)
+        status = "passed" if self.passed else "rejected"
+        lines = [f"Validation {status} after {len(self.attempts)} attempt(s), {total:.0f} ms"]
+        for n, a in enumerate(self.attempts, 1):
+            timing = ", ".join(f"{s} {a.ms[s]:.0f} ms" for s in STAGES if s in a.ms)
+            outcome = f"rejected at {a.stage}: {a.reason}" if a.stage else "ok"
+            lines.append(f"  {n}. {outcome} ({timing})")
+        return "\n".join(lines)
+
+
+@dataclass
+class ValidationTotals:
+    """Running counters over all validated questions."""
+
+    questions: int = 0
+    attempts: int = 0
+    repaired: int = 0  # passed after at least one rejection
+    failed: int = 0  # every attempt rejected
+    rejections: Counter = field(default_factory=Counter)  # stage -> count
+    ms: Counter = field(default_factory=Counter)  # stage -> total milliseconds
+
+    def add(self, report: ValidationReport) -> None:
+        self.questions += 1
+        self.attempts += len(report.attempts)
+        self.repaired += report.passed and len(report.attempts) > 1
+        self.failed += not report.passed
+        for a in report.attempts:
+            if a.stage:
+                self.rejections[a.stage] += 1
+            self.ms.update(a.ms)
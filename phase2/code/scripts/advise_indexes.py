@@ -0,0 +1,93 @@
+"""
+Recommend indexes from the Cypher that ask_graph has executed (QUERY_LOG_FILE, see nl2cypher/query_log.py).
+
+Predicates are parsed out of each logged query and ranked by usage and, when the database is
+reachable, by the label-scan rows EXPLAIN estimates they would save (graph/index_advisor.py).
+
+Usage (from phase2/code):
+    python scripts/advise_indexes.py                 # print ranked recommendations
+    python scripts/advise_indexes.py --write         # save them to graph/indexes.py (created by ingest)
+    python scripts/advise_indexes.py --apply         # also create them in Neo4j now
+    python scripts/advise_indexes.py --offline       # no database: rank by usage only
+"""
+import argparse
+from pathlib import Path
+
+from db.connection import Neo4jConnection
+from graph.index_advisor import covered_by_constraints, recommend
+from graph.schema import CREATE_CONSTRAINTS
+from nl2cypher.query_log import get_query_log_path, read_query_log
+
+INDEXES_FILE = Path(__file__).resolve().parent.parent / "graph" / "indexes.py"
+
+
+def _existing_indexes(db: Neo4jConnection) -> set[tuple[str, str, tuple[str, ...]]]:
+    rows = db.execute_query(
+        "SHOW INDEXES YIELD type, entityType, labelsOrTypes, properties "
+        "WHERE entityType = 'NODE' AND type IN ['RANGE', 'TEXT'] "
+        "RETURN type, labelsOrTypes, properties"
+    )
+    return {
+        (r["type"].lower(), r["labelsOrTypes"][0], tuple(r["properties"]))
+        for r in rows
+        if r["labelsOrTypes"] and r["properties"]
+    }
+
+
+def write_indexes_file(statements: list[str]) -> None:
+    lines = [
+        "# Indexes recommended by scripts/advise_indexes.py from the ask_graph query log.",
+        "# Regenerate with: python scripts/advise_indexes.py --write   (ingest creates them after CREATE_CONSTRAINTS)",
+        "CREATE_INDEXES = [",
+        *(f'    "{s}",' for s in statements),
+        "]",
+    ]
+    INDEXES_FILE.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recommend indexes from the ask_graph query log.")
+    parser.add_argument("--log", type=Path, default=None, help="Query log (default: QUERY_LOG_FILE)")
+    parser.add_argument("--top", type=int, default=10, help="Keep at most this many recommendations")
+    parser.add_argument("--min-uses", type=int, default=2, help="Ignore candidates used fewer times")
+    parser.add_argument("--offline", action="store_true", help="Do not connect; rank by usage only")
+    parser.add_argument("--write", action="store_true", help="Save statements to graph/indexes.py")
+    parser.add_argument("--apply", action="store_true", help="Run the CREATE INDEX statements now")
+    args = parser.parse_args()
+
+    entries = list(read_query_log(args.log))
+    if not entries:
+        print(f"No queries logged in {args.log or get_query_log_path()}. Ask some questions first.")
+        return
+    covered = covered_by_constraints(CREATE_CONSTRAINTS)
+
+    db = None if args.offline else Neo4jConnection()
+    try:
+        if db:
+            covered |= _existing_indexes(db)
+        recs = recommend(entries, covered, explain=db.explain if db else None, min_uses=args.min_uses)[: args.top]
+        print(f"{len(entries)} logged executions, {len({e['query'] for e in entries})} distinct queries")
+        if not recs:
+            print("No index recommendations.")
+            return
+        cost_label = "est. rows scanned" if db else "uses"
+        print(f"{'#':>3}  {'uses':>6}  {cost_label:>18}  statement")
+        for i, rec in enumerate(recs, 1):
+            print(f"{i:>3}  {rec.uses:>6}  {rec.cost:>18,.0f}  {rec.statement}")
+            print(f"{'':>33}e.g. {rec.examples[0][:100]}")
+
+        statements = [rec.statement for rec in recs]
+        if args.write:
+            write_indexes_file(statements)
+            print(f"Written to {INDEXES_FILE}")
+        if args.apply and db:
+            for statement in statements:
+                db.execute(statement)
+            print(f"Created {len(statements)} indexes (IF NOT EXISTS)")
+    finally:
+        if db:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,79 +1,76 @@
 """
 Generate graph schema from Neo4j and save to nl2cypher/prompt_schema/graph_schema.txt.
-Run this when the graph structure changes; the pipeline uses the saved file for every question.
+Run this when the graph structure changes; the pipeline picks up the new file on the next question.
 
 Includes node labels, their properties, and relationship structure so the LLM can generate accurate Cypher.
+Nothing here scans the whole graph: labels and relationship types come from the token store
+(db.labels(), db.relationshipTypes()), and properties / relationship endpoints are read from at most
+SCHEMA_SAMPLE_SIZE nodes per label and relationships per type. The file is only rewritten when the
+generated text differs from what is already on disk.
 
 Usage (from phase2/code):
     python scripts/generate_schema.py
+    python scripts/generate_schema.py --watch          # regenerate whenever ingest bumps the graph version
 
 Or:
     python -m scripts.generate_schema
 """
-from collections import defaultdict
+import argparse
+import time
 from pathlib import Path
 
+from core.config import get_schema_path, settings
 from db.connection import Neo4jConnection
+from db.graph_version import get_graph_version
 
 
 def _to_dicts(records: list) -> list[dict]:
     return [r.data() if hasattr(r, "data") else dict(r) for r in records]
 
 
+def _quote(name: str) -> str:
+    """Backtick-quote a label or relationship type for use in a query."""
+    return "`" + name.replace("`", "``") + "`"
+
+
 def _get_labels(db: Neo4jConnection) -> list[str]:
     rows = db.execute_query("CALL db.labels() YIELD label RETURN label")
     return [r["label"] for r in _to_dicts(rows)]
 
 
-def _get_node_properties(db: Neo4jConnection) -> dict[str, list[str]]:
-    """
-    Return label -> sorted list of property names.
-    Tries Neo4j 5 db.schema.nodeTypeProperties(); falls back to sampling keys per label (Neo4j 4.x).
-    """
-    # Neo4j 5.x
-    try:
-        rows = db.execute_query(
-            "CALL db.schema.nodeTypeProperties() YIELD nodeLabels, propertyName RETURN nodeLabels, propertyName"
-        )
-        rows = _to_dicts(rows)
-        if rows:
-            out: dict[str, list[str]] = defaultdict(list)
-            for r in rows:
-                labels = r.get("nodeLabels")
-                prop = r.get("propertyName")
-                if labels is not None and prop is not None:
-                    label = labels[0] if isinstance(labels, list) else labels
-                    out[label].append(prop)
-            return {k: sorted(set(v)) for k, v in out.items()}
-    except Exception:
-        pass
-
-    # Fallback (Neo4j 4.x or empty): sample one node per label and get keys(n)
-    labels = _get_labels(db)
-    out: dict[str, list[str]] = defaultdict(list)
-    for label in labels:
-        try:
-            q = f"MATCH (n:`{label}`) RETURN keys(n) AS keys LIMIT 1"
-            rows = db.execute_query(q)
-            rows = _to_dicts(rows)
-            if rows and rows[0].get("keys"):
-                keys = rows[0]["keys"]
-                out[label] = sorted(set(str(k) for k in keys))
-        except Exception:
-            out[label] = []
-    return dict(out)
-
-
-def _get_relationship_structure(db: Neo4jConnection) -> list[tuple[str, str, str]]:
-    """Return list of (from_label, rel_type, to_label)."""
-    q = """
-    MATCH (a)-[r]->(b)
-    WITH labels(a)[0] AS fromLabel, type(r) AS relType, labels(b)[0] AS toLabel
-    RETURN DISTINCT fromLabel, relType, toLabel
-    ORDER BY fromLabel, relType, toLabel
-    """
-    rows = db.execute_query(q)
-    return [(r["fromLabel"], r["relType"], r["toLabel"]) for r in _to_dicts(rows)]
+def _get_relationship_types(db: Neo4jConnection) -> list[str]:
+    rows = db.execute_query("CALL db.relationshipTypes() YIELD relationshipType RETURN relationshipType")
+    return [r["relationshipType"] for r in _to_dicts(rows)]
+
+
+def _get_node_properties(db: Neo4jConnection, labels: list[str], sample_size: int) -> dict[str, list[str]]:
+    """Return label -> sorted property names, from at most sample_size nodes per label (one session)."""
+    out: dict[str, list[str]] = {}
+    with db.session() as session:
+        for label in labels:
+            q = (
+                f"MATCH (n:{_quote(label)}) WITH n LIMIT $limit "
+                "UNWIND keys(n) AS key RETURN DISTINCT key"
+            )
+            out[label] = sorted(str(r["key"]) for r in session.run(q, {"limit": sample_size}))
+    return out
+
+
+def _get_relationship_structure(
+    db: Neo4jConnection, rel_types: list[str], sample_size: int
+) -> list[tuple[str, str, str]]:
+    """Return sorted (from_label, rel_type, to_label), sampling at most sample_size relationships per type."""
+    found: set[tuple[str, str, str]] = set()
+    with db.session() as session:
+        for rel_type in rel_types:
+            q = (
+                f"MATCH (a)-[:{_quote(rel_type)}]->(b) WITH a, b LIMIT $limit "
+                "RETURN DISTINCT labels(a)[0] AS fromLabel, labels(b)[0] AS toLabel"
+            )
+            for r in session.run(q, {"limit": sample_size}):
+                if r["fromLabel"] is not None and r["toLabel"] is not None:
+                    found.add((r["fromLabel"], rel_type, r["toLabel"]))
+    return sorted(found)
 
 
 def build_schema_text(
@@ -98,24 +95,68 @@ def build_schema_text(
     return "\n".join(lines)
 
 
-def main() -> None:
-    code_root = Path(__file__).resolve().parent.parent
-    schema_dir = code_root / "nl2cypher" / "prompt_schema"
-    schema_file = schema_dir / "graph_schema.txt"
-    schema_dir.mkdir(parents=True, exist_ok=True)
+def introspect_schema(db: Neo4jConnection, sample_size: int | None = None) -> str:
+    """Build the schema text from schema procedures plus bounded sampling."""
+    sample_size = sample_size or settings.schema_sample_size
+    labels = _get_labels(db)
+    if not labels:
+        print("Warning: no labels found in the database. Schema may be empty.")
+    label_properties = _get_node_properties(db, labels, sample_size)
+    rel_structure = _get_relationship_structure(db, _get_relationship_types(db), sample_size)
+    return build_schema_text(labels, rel_structure, label_properties)
+
+
+def refresh_schema_file(db: Neo4jConnection, schema_file: Path, sample_size: int | None = None) -> bool:
+    """Regenerate the schema and write it only if it changed. Returns True when the file was written."""
+    text = introspect_schema(db, sample_size)
+    if schema_file.exists() and schema_file.read_text(encoding="utf-8") == text:
+        return False
+    schema_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp = schema_file.with_name(schema_file.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    tmp.replace(schema_file)
+    return True
+
+
+def watch(db: Neo4jConnection, schema_file: Path, interval: float, sample_size: int | None = None) -> None:
+    """Poll the graph version file (bumped by ingest) and refresh the schema after each change."""
+    print(f"Watching graph version every {interval}s (Ctrl+C to stop)")
+    last_version = get_graph_version()
+    while True:
+        time.sleep(interval)
+        version = get_graph_version()
+        if version == last_version:
+            continue
+        last_version = version
+        if refresh_schema_file(db, schema_file, sample_size):
+            print(f"Graph version {version}: schema changed, written to {schema_file}")
+        else:
+            print(f"Graph version {version}: schema unchanged")
+
 
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate the NL→Cypher schema file from Neo4j.")
+    parser.add_argument("--sample-size", type=int, default=settings.schema_sample_size,
+                        help="Nodes per label / relationships per type to sample")
+    parser.add_argument("--watch", action="store_true", help="Keep running; refresh after each ingest")
+    parser.add_argument("--interval", type=float, default=settings.schema_watch_interval,
+                        help="Seconds between graph version checks in --watch mode")
+    args = parser.parse_args()
+
+    schema_file = get_schema_path()
     db = Neo4jConnection()
     try:
-        labels = _get_labels(db)
-        label_properties = _get_node_properties(db)
-        rel_structure = _get_relationship_structure(db)
-        if not labels:
-            print("Warning: no labels found in the database. Schema may be empty.")
-        text = build_schema_text(labels, rel_structure, label_properties)
-        schema_file.write_text(text, encoding="utf-8")
-        print(f"Schema written to {schema_file}")
+        start = time.perf_counter()
+        if refresh_schema_file(db, schema_file, args.sample_size):
+            print(f"Schema written to {schema_file} in {time.perf_counter() - start:.2f}s")
+        else:
+            print(f"Schema unchanged ({schema_file}) in {time.perf_counter() - start:.2f}s")
         print("---")
-        print(text)
+        print(schema_file.read_text(encoding="utf-8"))
+        if args.watch:
+            watch(db, schema_file, args.interval, args.sample_size)
+    except KeyboardInterrupt:
+        pass
     finally:
         db.close()
 
@@ -0,0 +1,78 @@
+"""
+Curate the few-shot example store (FEW_SHOT_FILE, see nl2cypher/few_shot.py).
+
+Successful questions are added automatically by ask_graph. Use this script to seed, inspect or
+correct the store. Hand-written Cypher goes through the same guard as generated Cypher.
+
+Usage (from phase2/code):
+    python scripts/manage_examples.py add "Which employees work in HR?" "MATCH (e:Employee)-[:WORKS_IN]->(d:Department {department: 'HR'}) RETURN e.name"
+    python scripts/manage_examples.py import seed.jsonl       # lines of {"question", "cypher"}
+    python scripts/manage_examples.py search "employees in sales" -k 5
+    python scripts/manage_examples.py remove "Which employees work in HR?"
+    python scripts/manage_examples.py stats
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+
+from core.config import resolve_code_path, settings
+from nl2cypher.cypher_guard import CypherRejected, guard_query
+from nl2cypher.few_shot import ExampleStore, get_example_store
+
+
+def _add(store: ExampleStore, question: str, cypher: str) -> bool:
+    try:
+        cypher, _ = guard_query(cypher)
+    except CypherRejected as e:
+        print(f"Skipped {question!r}: {e}")
+        return False
+    return store.add(question, cypher)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Manage few-shot (question, Cypher) examples.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    add = sub.add_parser("add", help="Add or replace one example")
+    add.add_argument("question")
+    add.add_argument("cypher")
+    imp = sub.add_parser("import", help="Add examples from a JSONL file")
+    imp.add_argument("file", type=Path)
+    search = sub.add_parser("search", help="Show the examples a question would get")
+    search.add_argument("question")
+    search.add_argument("-k", type=int, default=3)
+    remove = sub.add_parser("remove", help="Remove the example for a question")
+    remove.add_argument("question")
+    sub.add_parser("stats", help="Number of examples and index size")
+    args = parser.parse_args()
+
+    # Curating works on the configured file even while FEW_SHOT_ENABLED is off
+    store = get_example_store()
+    if store is None:
+        store = ExampleStore(resolve_code_path(settings.few_shot_file))
+    if args.command == "add":
+        print("Added." if _add(store, args.question, args.cypher) else "Unchanged.")
+    elif args.command == "import":
+        added = 0
+        with args.file.open(encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    added += _add(store, entry["question"], entry["cypher"])
+        print(f"Added or updated {added} examples.")
+    elif args.command == "search":
+        start = time.perf_counter()
+        hits = store.search(args.question, args.k)
+        elapsed = (time.perf_counter() - start) * 1000
+        for question, cypher, score in hits:
+            print(f"{score:6.2f}  {question}\n        {' '.join(cypher.split())}")
+        print(f"{len(hits)} of {len(store)} examples in {elapsed:.2f} ms")
+    elif args.command == "remove":
+        print("Removed." if store.remove(args.question) else "No example for that question.")
+    else:
+        print(f"{len(store)} examples in {store.path}")
+    store.save()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+Show what schema pruning sends to the LLM for some questions (nl2cypher/schema_pruner.py).
+
+Usage (from phase2/code):
+    python scripts/prune_schema.py "Which employees work in HR?" "Average salary by position"
+"""
+import argparse
+
+from core.config import get_schema_path
+from nl2cypher.schema_pruner import SchemaPruner
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Print the pruned schema and token savings per question.")
+    parser.add_argument("questions", nargs="+")
+    args = parser.parse_args()
+
+    pruner = SchemaPruner(get_schema_path().read_text(encoding="utf-8").strip())
+    if pruner.schema is None:
+        print("Schema file is not in generate_schema.py format; prompts use it unpruned.")
+        return
+    for question in args.questions:
+        pruned = pruner.prune(question)
+        print(f"Q: {question}")
+        print(f"   matched terms: {', '.join(pruned.matched) or '-'}")
+        print(f"   {pruned.summary()}")
+        print("   " + pruned.text.replace("\n", "\n   ") + "\n")
+
+
+if __name__ == "__main__":
+    main()
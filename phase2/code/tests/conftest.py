@@ -0,0 +1,10 @@
+"""Run from phase2/code: python -m pytest tests. Settings need the Neo4j variables even when nothing connects."""
+import os
+
+for key, value in {
+    "NEO4J_URI": "bolt://localhost:7687",
+    "NEO4J_USER": "neo4j",
+    "NEO4J_PASSWORD": "unused",
+    "NEO4J_DB": "neo4j",
+}.items():
+    os.environ.setdefault(key, value)
@@ -0,0 +1,133 @@
+"""guard_query is the security boundary for LLM-generated Cypher: bypasses must stay rejected."""
+import pytest
+
+from nl2cypher.cypher_guard import CypherRejected, guard_query
+
+MAX_ROWS = 1000
+MAX_HOPS = 10
+
+
+def guard(cypher: str, params: dict | None = None) -> tuple[str, dict]:
+    return guard_query(cypher, params, max_rows=MAX_ROWS, max_hops=MAX_HOPS)
+
+
+@pytest.mark.parametrize(
+    "cypher",
+    [
+        "CREATE (n:Employee {name: 'x'}) RETURN n",
+        "MATCH (e:Employee) SET e.salary = 0 RETURN e",
+        "MATCH (e:Employee) DETACH DELETE e",
+        "MERGE (d:Department {department: 'HR'}) RETURN d",
+        "LOAD CSV FROM 'file:///x.csv' AS row RETURN row",
+        "CALL db.labels()",
+        "MATCH (e:Employee) CALL { WITH e CREATE (x) } RETURN e",
+        "MATCH (e:Employee) FOREACH (x IN [1] | SET e.a = x)",
+        "SHOW USERS",
+        "SHOW DATABASES YIELD name RETURN name",
+        "USE system SHOW USERS",
+        "MATCH (e:Employee) RETURN e; MATCH (d) DETACH DELETE d",
+    ],
+)
+def test_rejects_writes_admin_and_multiple_statements(cypher):
+    with pytest.raises(CypherRejected):
+        guard(cypher)
+
+
+@pytest.mark.parametrize(
+    "cypher",
+    [
+        # bracket form
+        "MATCH (a:Person)-[:ACTED_IN*]->(m) RETURN a",
+        "MATCH (a:Person)-[*2..]->(m) RETURN a",
+        "MATCH (a:Person)-[:ACTED_IN*1..50]->(m) RETURN a",
+        # quantified relationships
+        "MATCH (a:Person)-[:ACTED_IN]->+(m) RETURN a",
+        "MATCH (a:Person)-[:ACTED_IN]->*(m) RETURN a",
+        "MATCH (a:Person)-[:ACTED_IN]->{1,}(m) RETURN a",
+        "MATCH (a:Person)-->+(m) RETURN a",
+        "MATCH (a:Person)<--*(m) RETURN a",
+        "MATCH (a:Person)--{2,}(m) RETURN a",
+        "MATCH (a:Person)-[:ACTED_IN]-{1,50}(m) RETURN a",
+        # quantified path patterns
+        "MATCH (a:Person) (()-[:ACTED_IN]->()){1,} (m) RETURN a",
+        "MATCH (a:Person) ((x)-[:ACTED_IN]->(y))+ (m) RETURN a",
+        "MATCH (a:Person) ((x)<-[:ACTED_IN]-(y))* (m) RETURN a",
+        "MATCH (a:Person) ((x)-[:R]->(y)){11} (m) RETURN a",
+        "MATCH p = (a:Person) (()--()){0,} (m) RETURN p",
+        "MATCH (e:Employee) WHERE EXISTS { MATCH (e)-[:WORKS_IN]->+(d) } RETURN e",
+    ],
+)
+def test_rejects_unbounded_or_too_long_paths(cypher):
+    with pytest.raises(CypherRejected, match="Unbounded|exceeds"):
+        guard(cypher)
+
+
+@pytest.mark.parametrize(
+    "cypher",
+    [
+        "MATCH (a:Person)-[:ACTED_IN*1..3]->(m) RETURN a",
+        "MATCH (a:Person)-[:ACTED_IN]->{1,3}(m) RETURN a",
+        "MATCH (a:Person)--{,4}(m) RETURN a",
+        "MATCH (a:Person) ((x)-[:ACTED_IN]->(y)){2} (m) RETURN a",
+        "MATCH (a:Person) (()-[:ACTED_IN]->()){1,10} (m) RETURN a",
+        "MATCH (e:Employee) RETURN (e.age + 1) * 2 AS x",
+        "MATCH (e:Employee) WHERE (e.age - 1) * 2 > 3 RETURN e.name",
+        "MATCH (e:Employee) RETURN [x IN range(1, 3) | (x + 1) * 2] AS xs",
+    ],
+)
+def test_accepts_bounded_paths_and_arithmetic(cypher):
+    guard(cypher)
+
+
+@pytest.mark.parametrize(
+    "cypher",
+    [
+        "MATCH (e:Employee), (d:Department) RETURN e, d",
+        "MATCH (e:Employee) MATCH (d:Department) RETURN e, d",
+        "MATCH (e:Employee) WITH e MATCH (d:Department) RETURN e, d",
+        "MATCH (e:Employee) WITH e.department AS dep, count(*) AS c MATCH (d:Department) RETURN c, d",
+    ],
+)
+def test_rejects_cartesian_products(cypher):
+    with pytest.raises(CypherRejected, match="Cartesian"):
+        guard(cypher)
+
+
+@pytest.mark.parametrize(
+    "cypher",
+    [
+        "MATCH (e:Employee) WITH count(*) AS c MATCH (d:Department) RETURN c, d",
+        "MATCH (e:Employee) WITH avg(e.salary) AS avg_salary, max(e.age) AS oldest MATCH (d:Department) RETURN d, avg_salary",
+        "MATCH (e:Employee)-[:WORKS_IN]->(d:Department) RETURN e, d",
+        "MATCH (e:Employee) MATCH (e)-[:HAS_ROLE]->(p:Position) RETURN e, p",
+        "MATCH (e:Employee) WITH e MATCH (e)-[:WORKS_IN]->(d) RETURN d",
+    ],
+)
+def test_accepts_connected_patterns_and_scalar_joins(cypher):
+    guard(cypher)
+
+
+def test_keywords_inside_strings_properties_and_labels_are_fine():
+    cypher, _ = guard("MATCH (s:Settings) WHERE s.offset > 1 AND s.note = 'SET x = 1; DELETE' RETURN s.show")
+    assert cypher.endswith(f"LIMIT {MAX_ROWS}")
+
+
+def test_limit_is_added_and_capped():
+    assert guard("MATCH (e:Employee) RETURN e")[0] == f"MATCH (e:Employee) RETURN e LIMIT {MAX_ROWS}"
+    assert guard("MATCH (e:Employee) RETURN e LIMIT 5000")[0] == f"MATCH (e:Employee) RETURN e LIMIT {MAX_ROWS}"
+    assert guard("MATCH (e:Employee) RETURN e LIMIT $n", {"n": 10**6})[1] == {"n": MAX_ROWS}
+
+
+@pytest.mark.parametrize(
+    "limit",
+    ["10*100000", 'toInteger("9999999")', "$n * 1000", "size(range(1, 5))"],
+)
+def test_limit_expressions_are_replaced(limit):
+    cypher, params = guard(f"MATCH (e:Employee) RETURN e.name LIMIT {limit}", {"n": 10})
+    assert cypher == f"MATCH (e:Employee) RETURN e.name LIMIT {MAX_ROWS}"
+    assert params == {"n": 10}
+
+
+def test_limit_expression_is_replaced_in_every_union_part():
+    cypher, _ = guard("MATCH (e:Employee) RETURN e.name AS n LIMIT 5 UNION MATCH (d:Department) RETURN d.department AS n LIMIT 2*999999")
+    assert cypher == f"MATCH (e:Employee) RETURN e.name AS n LIMIT 5 UNION MATCH (d:Department) RETURN d.department AS n LIMIT {MAX_ROWS}"
@@ -0,0 +1,43 @@
+"""A template-cache hit skips the LLM, so a question of a different shape must never match."""
+import pytest
+
+from nl2cypher.template_cache import TemplateCache
+
+SCHEMA = "Employee-[:WORKS_IN]->Department"
+COUNT = "MATCH (e:Employee)-[:WORKS_IN]->(d:Department {department: 'Sales'}) RETURN count(e) AS n"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = TemplateCache(tmp_path / "templates.json")
+    cache.store("How many employees are in the Sales department?", COUNT, SCHEMA)
+    return cache
+
+
+def test_same_shape_reuses_the_template(cache):
+    cypher, params = cache.lookup("How many employees are in the Marketing department?", SCHEMA)
+    assert "$p0" in cypher
+    assert params == {"p0": "Marketing"}
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "How many employees are in the Sales or IT department?",
+        "How many employees are in the Sales and IT department?",
+        "How many employees are in the Sales, IT department?",
+        "How many employees are in the Sales nor IT department?",
+    ],
+)
+def test_conjunction_in_capture_misses(cache, question):
+    assert cache.lookup(question, SCHEMA) is None
+
+
+def test_conjunction_in_the_stored_value_is_allowed(tmp_path):
+    cache = TemplateCache(tmp_path / "templates.json")
+    cypher = "MATCH (e:Employee)-[:WORKS_IN]->(d:Department {department: 'Research and Development'}) RETURN count(e) AS n"
+    cache.store("How many employees are in the Research and Development department?", cypher, SCHEMA)
+    assert cache.lookup("How many employees are in the Sales and Marketing department?", SCHEMA)[1] == {
+        "p0": "Sales and Marketing"
+    }
+    assert cache.lookup("How many employees are in the Sales and IT or HR department?", SCHEMA) is None